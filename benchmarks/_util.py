@@ -0,0 +1,10 @@
+"""Helpers shared by the benchmark scripts."""
+import sys
+
+
+def check(condition, message):
+    """Exits with status 1 if the condition is false, unlike assert also
+    with ``python -O``"""
+
+    if not condition:
+        sys.exit("check failed: " + message)
@@ -0,0 +1,145 @@
+"""Batch mode against a local stub of the commands server.
+
+The stub answers every ``/commands_v2`` request after a fixed delay. The
+script compares one ``gorilla --first`` process per query to
+``gorilla --batch`` with growing concurrency. It reports the wall time, the
+number of requests and TCP connections the stub saw, and checks that every
+query got its answer in input order. The queries only differ in a number,
+so ``--no-cache`` keeps them from being answered from the cache of earlier
+answers.
+
+Exits with status 1 if an answer is wrong or out of order, or the stub
+didn't see exactly one request per query.
+
+Run from the repository root: ``python benchmarks/batch.py``
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from _util import check
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+QUERIES = 40
+SERVER_DELAY = 0.05
+CONCURRENCY = [1, 4, 16]
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, connections can be reused
+
+    def do_POST(self):
+        data = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.delay)
+        body = json.dumps(["echo " + data["user_input"]]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def gorilla(args, env, stdin=None):
+    return subprocess.run(
+        [sys.executable, os.path.join(ROOT, "go_cli.py"), *args],
+        input=stdin,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def measure(server, run):
+    server.requests = server.connections = 0
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start, server.requests, server.connections
+
+
+def main():
+    queries = ["query number {}".format(i) for i in range(QUERIES)]
+    server = StubServer(SERVER_DELAY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(
+            os.environ,
+            HOME=home,
+            GORILLA_CLI_SERVER_URL="http://127.0.0.1:{}".format(server.server_port),
+        )
+
+        def one_process_per_query():
+            for query in queries:
+                output = gorilla(["--first", "--no-cache", query], env).strip()
+                check(output == "echo " + query, "answer of " + query)
+
+        elapsed, requests, connections = measure(server, one_process_per_query)
+        check(requests == len(queries), "{} requests".format(requests))
+        print(
+            "{:<24} {:7.2f} s  {:3} requests  {:3} connections".format(
+                "process per query", elapsed, requests, connections
+            )
+        )
+
+        for concurrency in CONCURRENCY:
+            output = []
+
+            def batch():
+                output.append(
+                    gorilla(
+                        ["--batch", "-", "--no-cache", "--rate", "0", "--concurrency", str(concurrency)],
+                        env,
+                        stdin="\n".join(queries),
+                    )
+                )
+
+            elapsed, requests, connections = measure(server, batch)
+            results = [json.loads(line) for line in output[0].splitlines()]
+            check(requests == len(queries), "{} requests".format(requests))
+            check([r["query"] for r in results] == queries, "input order")
+            check(
+                all(r["commands"] == ["echo " + r["query"]] for r in results),
+                "answers in batch mode",
+            )
+            print(
+                "{:<24} {:7.2f} s  {:3} requests  {:3} connections".format(
+                    "batch, concurrency {}".format(concurrency),
+                    elapsed,
+                    requests,
+                    connections,
+                )
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
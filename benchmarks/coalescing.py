@@ -0,0 +1,91 @@
+"""Concurrent gorilla processes asking the same query.
+
+Starts several ``gorilla --json`` processes at once against a local stub of
+the commands server (see ``batch.py``). Processes asking the same query wait
+for the one that asked first and read its answer from the shared cache, so
+the stub sees a single request. Processes asking different queries are not
+held up by each other. ``--no-cache`` keeps queries from being answered
+from earlier runs, waiting for a running request is not affected by it.
+
+Exits with status 1 if an answer is wrong or the stub saw another number
+of requests than expected.
+
+Run from the repository root: ``python benchmarks/coalescing.py``
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from _util import check
+from batch import ROOT, StubServer
+
+PROCESSES = 8
+SERVER_DELAY = 0.5
+
+
+def run_processes(queries, env):
+    """Start one process per query at once, returns their JSON outputs."""
+
+    processes = [
+        subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "go_cli.py"), "--json", "--no-cache", query],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        for query in queries
+    ]
+    return [json.loads(p.communicate()[0]) for p in processes]
+
+
+def main():
+    server = StubServer(SERVER_DELAY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(
+            os.environ,
+            HOME=home,
+            GORILLA_CLI_SERVER_URL="http://127.0.0.1:{}".format(server.server_port),
+        )
+
+        for name, queries in [
+            ("same query", ["list my files"] * PROCESSES),
+            ("different queries", ["list file {}".format(i) for i in range(PROCESSES)]),
+        ]:
+            server.requests = 0
+            start = time.perf_counter()
+            results = run_processes(queries, env)
+            elapsed = time.perf_counter() - start
+
+            sources = [r["source"] for r in results]
+            print(
+                "{:<18} {} processes, {} server requests in {:.2f} s, "
+                "{} coalesced".format(
+                    name,
+                    len(queries),
+                    server.requests,
+                    elapsed,
+                    sources.count("coalesced"),
+                )
+            )
+            check(
+                all(r["commands"] == ["echo " + r["query"]] for r in results),
+                "answers of " + name,
+            )
+            expected = 1 if name == "same query" else len(queries)
+            check(
+                server.requests == expected,
+                "{} server requests for {}".format(server.requests, name),
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Indexed autocomplete lookups against the linear scan they replaced.
+
+For every number of choices, ``WordCompleter.get_completions`` (the
+indexed lookup) and ``WordCompleter.get_completions_linear`` (the scan of
+every choice it replaced) complete the same queries: prefixes and
+substrings, with and without ``ignore_case``, ``match_middle`` and
+``max_results``. It reports the mean time per query of both.
+
+It also times the background helpers of callable choices: a
+``CachedChoiceSource`` around a slow source (first call, fresh hit, stale
+hit while the refresh runs) and a ``DebouncedCompleter`` around a slow
+completer, while a coroutine ticks on the event loop.
+
+Exits with status 1 if the indexed completions differ from the linear ones,
+a cached or stale call waits for the source, or the debounced completer
+blocks the event loop.
+
+Run from the repository root: ``python benchmarks/completion.py``
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prompt_toolkit.completion import CompleteEvent  # noqa: E402
+from prompt_toolkit.document import Document  # noqa: E402
+from prompt_toolkit.formatted_text import to_formatted_text  # noqa: E402
+
+from _util import check  # noqa: E402
+
+from go_questionary.prompts.autocomplete import (  # noqa: E402
+    CachedChoiceSource,
+    DebouncedCompleter,
+    WordCompleter,
+)
+
+SIZES = [100, 1000, 10000, 100000]
+QUERIES = 30
+# fewer queries from this size on, the linear scan takes seconds each
+LARGE_SIZE = 100000
+LARGE_SIZE_QUERIES = 3
+MAX_RESULTS = 20
+# slow choice source and completer
+SOURCE_DELAY = 0.1
+TTL = 0.2
+DEBOUNCE = 0.05
+TICK = 0.005
+
+WORDS = [
+    "alpha", "Beta", "gamma", "delta", "Echo", "fox", "golf", "hotel",
+    "india", "juliet", "kilo", "Lima", "mike", "november", "oscar", "papa",
+]  # fmt: skip
+
+
+def _choices(n, rng):
+    return [
+        "{}-{}_{}".format(rng.choice(WORDS), rng.choice(WORDS), i) for i in range(n)
+    ]
+
+
+def _queries(choices, rng):
+    queries = []
+    for _ in range(LARGE_SIZE_QUERIES if len(choices) >= LARGE_SIZE else QUERIES):
+        choice = rng.choice(choices)
+        start = rng.randrange(len(choice))
+        queries.append(choice[start : start + rng.randrange(1, 6)])
+        queries.append(choice[: rng.randrange(1, 6)])
+    return queries + ["", "zzz", "A", "ECHO"]
+
+
+def _key(completion):
+    return (
+        completion.text,
+        completion.start_position,
+        to_formatted_text(completion.display),
+        completion.display_meta_text,
+    )
+
+
+def _complete(get_completions, queries):
+    event = CompleteEvent()
+    start = time.perf_counter()
+    results = [
+        [_key(c) for c in get_completions(Document(q), event)] for q in queries
+    ]
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def compare_lookups():
+    rng = random.Random(0)
+    for size in SIZES:
+        choices = _choices(size, rng)
+        queries = _queries(choices, rng)
+        meta = {choices[0]: "first"}
+        for ignore_case in (True, False):
+            for match_middle in (True, False):
+                linear_completer = WordCompleter(
+                    choices, ignore_case, meta, match_middle
+                )
+                expected, linear_time = _complete(
+                    linear_completer.get_completions_linear, queries
+                )
+                for max_results in (None, MAX_RESULTS):
+                    completer = WordCompleter(
+                        choices, ignore_case, meta, match_middle, max_results
+                    )
+                    list(completer.get_completions(Document(""), CompleteEvent()))
+                    results, indexed_time = _complete(completer.get_completions, queries)
+                    check(
+                        results == [e[:max_results] for e in expected],
+                        "completions of {} choices, ignore_case={} match_middle={} "
+                        "max_results={}".format(
+                            size, ignore_case, match_middle, max_results
+                        ),
+                    )
+                if ignore_case and match_middle:
+                    print(
+                        "{:>7} choices  linear {:8.3f} ms  indexed {:8.3f} ms "
+                        "(max_results={}) per query".format(
+                            size, linear_time * 1000, indexed_time * 1000, MAX_RESULTS
+                        )
+                    )
+
+
+def time_cached_source():
+    calls = []
+
+    def source():
+        calls.append(time.monotonic())
+        time.sleep(SOURCE_DELAY)
+        return ["choice {}".format(len(calls))]
+
+    cached = CachedChoiceSource(source, TTL)
+
+    def timed():
+        start = time.perf_counter()
+        value = cached()
+        return value, time.perf_counter() - start
+
+    first, first_time = timed()
+    fresh, fresh_time = timed()
+    time.sleep(TTL)
+    stale, stale_time = timed()
+    time.sleep(SOURCE_DELAY * 2)
+    refreshed, refreshed_time = timed()
+
+    print(
+        "cached source  first {:6.1f} ms  fresh {:6.3f} ms  stale {:6.3f} ms  "
+        "refreshed {:6.3f} ms".format(
+            first_time * 1000, fresh_time * 1000, stale_time * 1000, refreshed_time * 1000
+        )
+    )
+    check(first == fresh == stale == ["choice 1"], "cached and stale values")
+    check(refreshed == ["choice 2"], "value refreshed in the background")
+    check(
+        max(fresh_time, stale_time, refreshed_time) < SOURCE_DELAY / 2,
+        "cached calls don't wait for the source",
+    )
+    check(len(calls) == 2, "{} calls of the source".format(len(calls)))
+
+
+async def _debounced():
+    def slow_completions(document, event):
+        time.sleep(SOURCE_DELAY)
+        return WordCompleter(["apple", "apricot", "banana"]).get_completions(
+            document, event
+        )
+
+    inner = WordCompleter([])
+    inner.get_completions = slow_completions  # type: ignore[assignment]
+    completer = DebouncedCompleter(inner, DEBOUNCE)
+
+    ticks = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(TICK)
+
+    ticking = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    completions = [
+        c.text
+        async for c in completer.get_completions_async(Document("ap"), CompleteEvent())
+    ]
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticking
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    return completions, elapsed, max(gaps)
+
+
+def time_debounced_completer():
+    completions, elapsed, max_gap = asyncio.run(_debounced())
+    print(
+        "debounced completer  {:6.1f} ms  longest event loop gap {:5.1f} ms".format(
+            elapsed * 1000, max_gap * 1000
+        )
+    )
+    check(completions == ["apple", "apricot"], "debounced completions")
+    check(elapsed >= DEBOUNCE + SOURCE_DELAY, "completions waited for the debounce")
+    check(max_gap < SOURCE_DELAY / 2, "the completer blocked the event loop")
+
+
+def main():
+    compare_lookups()
+    time_cached_source()
+    time_debounced_completer()
+
+
+if __name__ == "__main__":
+    main()
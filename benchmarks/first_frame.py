@@ -0,0 +1,72 @@
+"""Time to first frame of a small select prompt.
+
+Starts a fresh interpreter on a pseudo terminal and measures the time until
+the first choice is drawn, for ``select()`` (prompt_toolkit) and
+``fast_select()`` (raw terminal writes). The startup time of a bare
+interpreter is reported for reference.
+
+Run from the repository root: ``python benchmarks/first_frame.py``
+"""
+import os
+import pty
+import select
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+ROUNDS = 5
+
+CHOICES = ["ls -la", "echo hello", "pwd", "du -sh .", "df -h"]
+
+PROGRAMS = {
+    "python (no prompt)": "print('ls -la')",
+    "select": "import go_questionary; go_questionary.select('', {!r}).ask()",
+    "fast_select": "import go_questionary; go_questionary.fast_select('', {!r})",
+}
+
+
+def first_frame(code: str) -> float:
+    """Seconds until ``ls -la`` appears on the terminal."""
+
+    start = time.perf_counter()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(ROOT)
+        os.environ["TERM"] = "xterm-256color"
+        os.execv(sys.executable, [sys.executable, "-c", code])
+
+    output = b""
+    elapsed = float("nan")
+    try:
+        while True:
+            ready, _, _ = select.select([fd], [], [], 10)
+            if not ready:
+                break
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            output += data
+            if b"ls -la" in output:
+                elapsed = time.perf_counter() - start
+                break
+        # answer the prompt, wait for the process to exit
+        os.write(fd, b"\r")
+        while select.select([fd], [], [], 2)[0]:
+            if not os.read(fd, 4096):
+                break
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+        os.waitpid(pid, 0)
+    return elapsed
+
+
+def main() -> None:
+    for name, code in PROGRAMS.items():
+        best = min(first_frame(code.format(CHOICES)) for _ in range(ROUNDS))
+        print("{:<20} {:8.1f} ms".format(name, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Ranking time of the fuzzy index by number of candidates.
+
+Builds a :class:`go_questionary.fuzzy.FuzzyIndex` of file paths and ranks
+a few queries against it, like the path and autocomplete prompts do on
+every keystroke. For every size it reports the time to build the index and
+the median time of a ranking with a limit.
+
+Before timing, checks that the masks computed with numpy equal the plain
+ones and that names that are not valid UTF-8 (lone surrogates) are found,
+by the index and by the file finder of ``path(recursive=True)``; exits
+with status 1 if not.
+
+Run from the repository root: ``python benchmarks/fuzzy.py``
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _util import check  # noqa: E402
+
+from go_questionary import fuzzy  # noqa: E402
+from go_questionary.prompts.path import FileFinder  # noqa: E402
+
+SIZES = [1000, 10000, 100000, 1000000]
+QUERIES = ["main", "srcutil", "tstcfg", "READ"]
+LIMIT = 50
+
+
+def _paths(n):
+    parts = ["src", "tests", "docs", "lib", "config", "utils", "build"]
+    names = ["main", "util", "Helper", "test_config", "README", "setup", "index"]
+    return [
+        "{}/{}/{}_{}.py".format(parts[i % 7], parts[i // 7 % 7], names[i // 49 % 7], i)
+        for i in range(n)
+    ]
+
+
+def check_masks():
+    keys = ["", "a", "ok", "bad\udcff", "café au lait", "x-y_z.txt", "v2Beta"]
+    index = fuzzy.FuzzyIndex(keys)
+    check(
+        index._masks == [fuzzy.char_mask(fuzzy._lower(k)) for k in keys],
+        "vectorized character masks",
+    )
+    check(
+        [i for _, i, _ in index.rank("bad", LIMIT)] == [3],
+        "candidates with lone surrogates are found",
+    )
+    check(
+        [i for _, i, _ in index.rank("\udcff", LIMIT)] == [3],
+        "lone surrogates are matched",
+    )
+
+
+def check_finder():
+    with tempfile.TemporaryDirectory() as root:
+        for name in [b"ok", b"bad\xff"]:
+            open(os.path.join(os.fsencode(root), name), "w").close()
+        finder = FileFinder(root, snapshot_dir=None).start()
+        check(finder.wait(10), "file finder finished")
+        check(
+            sorted(finder.index.candidates) == ["bad\udcff", "ok"],
+            "file finder indexes names that are not valid UTF-8",
+        )
+
+
+def main():
+    check_masks()
+    check_finder()
+    print("numpy: {}".format("yes" if fuzzy._load_numpy() is not None else "no"))
+    for size in SIZES:
+        paths = _paths(size)
+        start = time.perf_counter()
+        index = fuzzy.FuzzyIndex(paths)
+        build = time.perf_counter() - start
+
+        timings = []
+        for query in QUERIES:
+            for _ in range(5):
+                start = time.perf_counter()
+                index.rank(query, LIMIT)
+                timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(
+            "{:>7} candidates  build {:8.2f} ms  rank p50 {:8.2f} ms".format(
+                size, build * 1000, timings[len(timings) // 2] * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Throughput of answering complete forms headlessly.
+
+Answers a 10 question form (text with validation, confirm, select, checkbox,
+``when`` and ``filter`` options) from an NDJSON stream, using a compiled
+plan, and reports forms per second.
+
+Run from the repository root: ``python benchmarks/headless.py``
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import go_questionary  # noqa: E402
+
+FORMS = 10000
+ROUNDS = 3
+
+QUESTIONS = [
+    {
+        "type": "text",
+        "name": "name",
+        "message": "Name?",
+        "validate": lambda t: len(t) > 0 or "Name is required",
+    },
+    {"type": "text", "name": "email", "message": "Email?"},
+    {"type": "password", "name": "secret", "message": "Secret?"},
+    {"type": "confirm", "name": "admin", "message": "Admin?", "default": False},
+    {
+        "type": "select",
+        "name": "role",
+        "message": "Role?",
+        "choices": ["dev", "ops", "qa", go_questionary.Separator(), "other"],
+        "when": lambda a: not a["admin"],
+    },
+    {
+        "type": "rawselect",
+        "name": "region",
+        "message": "Region?",
+        "choices": ["eu", "us", "apac"],
+    },
+    {
+        "type": "checkbox",
+        "name": "features",
+        "message": "Features?",
+        "choices": ["a", "b", {"name": "c", "checked": True}],
+        "filter": sorted,
+    },
+    {"type": "text", "name": "team", "message": "Team?", "default": "core"},
+    {
+        "type": "select",
+        "name": "shell",
+        "message": "Shell?",
+        "choices": lambda a: ["bash", "zsh", "fish"],
+    },
+    {"type": "confirm", "name": "ok", "message": "Done?"},
+]
+
+
+def make_stream() -> str:
+    return "\n".join(
+        json.dumps(
+            {
+                "name": "user{}".format(i),
+                "email": "user{}@example.com".format(i),
+                "admin": i % 2 == 0,
+                "role": "ops",
+                "features": ["a", "b"],
+                "shell": "zsh",
+            }
+        )
+        for i in range(FORMS)
+    )
+
+
+def main() -> None:
+    plan = go_questionary.compile(QUESTIONS)
+    stream = make_stream()
+
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        results = list(go_questionary.prompt_headless_stream(plan, stream))
+        best = min(best, time.perf_counter() - start)
+        assert len(results) == FORMS
+
+    print(
+        "{} forms of {} questions: {:.0f} forms/s ({:.1f} us per form)".format(
+            FORMS, len(QUESTIONS), FORMS / best, best / FORMS * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
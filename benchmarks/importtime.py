@@ -0,0 +1,102 @@
+"""Import time of the go_questionary package.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the
+cumulative import time of ``go_questionary`` and whether prompt_toolkit
+was loaded, for a bare ``import go_questionary`` and for importing a
+single prompt type.
+
+Exits with status 1 if ``import go_questionary`` loads prompt_toolkit or
+numpy, if importing ``select`` loads numpy, or if importing ``select``
+takes longer than the budget (``--budget``, in ms).
+
+Run from the repository root: ``python benchmarks/importtime.py``
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from _util import check
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+ROUNDS = 5
+
+STATEMENTS = [
+    "import go_questionary",
+    "from go_questionary import select",
+    "import go_questionary; go_questionary.prompt",
+]
+# modules the statements must not load
+FORBIDDEN_MODULES = {
+    "import go_questionary": ["prompt_toolkit", "numpy"],
+    "from go_questionary import select": ["numpy"],
+}
+# import time of select, about 1.5 times what it takes here: timings vary
+# between machines, the modules above are checked exactly
+SELECT_BUDGET_MS = 300
+
+
+def import_time(statement: str) -> float:
+    """Cumulative import time of all top level modules, in ms."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # only count top level imports, nested ones are part of those
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total / 1000
+
+
+def loaded_modules(statement: str) -> set:
+    """Top level packages loaded by the statement."""
+
+    code = "{}; import sys; print(' '.join(sys.modules))".format(statement)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=SELECT_BUDGET_MS)
+    args = parser.parse_args()
+
+    times = {}
+    for statement in STATEMENTS:
+        best = min(import_time(statement) for _ in range(ROUNDS))
+        modules = loaded_modules(statement)
+        times[statement] = best
+        print(
+            "{:<46} {:8.1f} ms  prompt_toolkit loaded: {}".format(
+                statement, best, "prompt_toolkit" in modules
+            )
+        )
+        for module in FORBIDDEN_MODULES.get(statement, []):
+            check(module not in modules, "{} loads {}".format(statement, module))
+
+    select_time = times["from go_questionary import select"]
+    check(
+        select_time <= args.budget,
+        "importing select took {:.1f} ms, the budget is {:.0f} ms".format(
+            select_time, args.budget
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
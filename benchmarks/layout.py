@@ -0,0 +1,79 @@
+"""Construction time of the layout used by select, checkbox and rawselect.
+
+Compares :func:`go_questionary.prompts.common.create_inquirer_layout` with
+the previous construction, which created two complete ``PromptSession``
+objects to borrow their containers.
+
+Run from the repository root: ``python benchmarks/layout.py``
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prompt_toolkit import PromptSession  # noqa: E402
+from prompt_toolkit.filters import Condition, IsDone  # noqa: E402
+from prompt_toolkit.layout import (  # noqa: E402
+    ConditionalContainer,
+    HSplit,
+    Layout,
+    Window,
+)
+from prompt_toolkit.input import DummyInput  # noqa: E402
+from prompt_toolkit.output import DummyOutput  # noqa: E402
+
+from go_questionary.prompts import common  # noqa: E402
+
+ROUNDS = 200
+
+
+def legacy_layout(ic, get_prompt_tokens, **kwargs):
+    ps = PromptSession(get_prompt_tokens, reserve_space_for_menu=0, **kwargs)
+    validation_prompt = PromptSession(bottom_toolbar=lambda: ic.error_message, **kwargs)
+
+    return Layout(
+        HSplit(
+            [
+                ps.layout.container,
+                ConditionalContainer(Window(ic), filter=~IsDone()),
+                ConditionalContainer(
+                    validation_prompt.layout.container,
+                    filter=Condition(lambda: ic.error_message is not None),
+                ),
+            ]
+        )
+    )
+
+
+def main() -> None:
+    ic = common.InquirerControl(["first", "second", "third"])
+    inp, output = DummyInput(), DummyOutput()
+
+    def get_prompt_tokens():
+        return [("class:question", "Question")]
+
+    for name, create in (
+        (
+            "two PromptSessions",
+            lambda: legacy_layout(ic, get_prompt_tokens, input=inp, output=output),
+        ),
+        (
+            "create_inquirer_layout",
+            lambda: common.create_inquirer_layout(
+                ic, get_prompt_tokens, input=inp, output=output
+            ),
+        ),
+    ):
+        best = min(
+            timeit.repeat(
+                create,
+                number=ROUNDS,
+                repeat=5,
+            )
+        )
+        print("{:<24} {:8.1f} us per layout".format(name, best / ROUNDS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
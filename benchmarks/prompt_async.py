@@ -0,0 +1,113 @@
+"""Event loop responsiveness while ``prompt_async`` waits for answers.
+
+Asks a form with :func:`go_questionary.unsafe_prompt_async` while another
+coroutine ticks every ``TICK`` seconds. The answers are sent through a pipe
+input a while after each question is shown, so the prompt is waiting for
+the user most of the time. The form has ``async`` ``choices``, ``when`` and
+``filter`` options. Reports the number of ticks during the prompt and the
+longest gap between two ticks.
+
+Exits with status 1 if the ticker stalled while the prompt waited or the
+answers are wrong.
+
+Run from the repository root: ``python benchmarks/prompt_async.py``
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prompt_toolkit.input import create_pipe_input  # noqa: E402
+from prompt_toolkit.output import DummyOutput  # noqa: E402
+
+from _util import check  # noqa: E402
+
+import go_questionary  # noqa: E402
+
+TICK = 0.01
+# time until the answer of each question is sent
+ANSWER_DELAY = 0.5
+# a tick may be late by this much before the loop counts as blocked: creating
+# the first question imports the prompt types, waiting for an answer in a
+# blocking call would take ANSWER_DELAY
+MAX_GAP = 0.25
+
+
+async def _choices(answers):
+    await asyncio.sleep(TICK)
+    return ["small", "medium", "large"]
+
+
+async def _when(answers):
+    await asyncio.sleep(TICK)
+    return answers["name"] == "Ada"
+
+
+async def _filter(answer):
+    await asyncio.sleep(TICK)
+    return answer.upper()
+
+
+async def ask(inp, output):
+    questions = [
+        {"type": "text", "name": "name", "message": "Name?", "filter": _filter},
+        {"type": "text", "name": "skipped", "message": "Never?", "when": lambda a: False},
+        {"type": "select", "name": "size", "message": "Size?", "choices": _choices},
+        {"type": "confirm", "name": "ok", "message": "Sure?", "when": _when},
+    ]
+    # "name" is filtered to upper case, so the "ok" question is skipped
+    keys = ["Ada\r", "j\r"]
+
+    async def answer():
+        for key in keys:
+            await asyncio.sleep(ANSWER_DELAY)
+            inp.send_text(key)
+
+    typing = asyncio.ensure_future(answer())
+    answers = await go_questionary.unsafe_prompt_async(
+        questions, input=inp, output=output
+    )
+    await typing
+    return answers
+
+
+async def run():
+    ticks = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        while not stop.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(TICK)
+
+    with create_pipe_input() as inp:
+        ticking = asyncio.ensure_future(ticker())
+        start = time.perf_counter()
+        answers = await ask(inp, DummyOutput())
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await ticking
+
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    return answers, elapsed, len(ticks), max(gaps)
+
+
+def main():
+    answers, elapsed, ticks, max_gap = asyncio.run(run())
+    print(
+        "prompt {:.2f} s  {} ticks  longest gap {:.1f} ms".format(
+            elapsed, ticks, max_gap * 1000
+        )
+    )
+    check(answers == {"name": "ADA", "size": "medium"}, "answers {}".format(answers))
+    check(
+        ticks >= elapsed / TICK / 2,
+        "{} ticks in {:.2f} s, the ticker stalled".format(ticks, elapsed),
+    )
+    check(max_gap < MAX_GAP, "the event loop was blocked for {:.3f} s".format(max_gap))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Microbenchmarks of the prompt types, driven without a terminal.
+
+Every prompt type is created with a growing number of choices (files for
+``path``, characters of the default text for ``text``), answered through a
+pipe input and drawn to a dummy output. For every size it reports:
+
+* ``construct_ms`` - creating the question
+* ``first_render_ms`` - starting the application until the first frame
+* ``key_p50_ms``, ``key_p95_ms``, ``key_max_ms`` - from sending a key until
+  the frame showing its effect was drawn
+* ``peak_kib`` - peak traced memory of creating and answering the question
+* ``key_alloc_kib`` - mean transient memory allocated per keystroke (peak
+  growth while the key is handled and drawn)
+* ``key_blocks`` - mean number of memory blocks still allocated after
+  a keystroke
+
+Keystrokes (20, or 5 for 100k choices) are sent one at a time, each after
+the previous one was drawn.
+Memory is measured in a separate run, tracemalloc slows everything down.
+
+Run from the repository root::
+
+    python benchmarks/prompts.py --json results.json
+    python benchmarks/prompts.py --baseline results.json --tolerance 0.25
+
+With ``--baseline`` the exit code is 1 if a time or memory metric got worse
+by more than the tolerance.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prompt_toolkit.input import create_pipe_input  # noqa: E402
+from prompt_toolkit.output import DummyOutput  # noqa: E402
+
+import go_questionary  # noqa: E402
+
+SIZES = [10, 100, 1000, 10000, 100000]
+KEYS = 20
+# fewer keystrokes from this size on, a frame can take seconds
+LARGE_SIZE = 100000
+LARGE_SIZE_KEYS = 5
+
+# metrics compared against a baseline
+GATED_METRICS = ["construct_ms", "first_render_ms", "key_p95_ms", "peak_kib"]
+
+
+def _choices(n):
+    return ["choice number {}".format(i) for i in range(n)]
+
+
+def _select(n, inp, tmp):
+    question = go_questionary.select(
+        "Pick one", _choices(n), input=inp, output=DummyOutput()
+    )
+    return question, ["j"] * KEYS
+
+
+def _checkbox(n, inp, tmp):
+    question = go_questionary.checkbox(
+        "Pick some", _choices(n), input=inp, output=DummyOutput()
+    )
+    return question, [" ", "j"] * (KEYS // 2)
+
+
+def _rawselect(n, inp, tmp):
+    question = go_questionary.rawselect(
+        "Pick one", _choices(n), input=inp, output=DummyOutput()
+    )
+    return question, [str(i % min(n, 9) + 1) for i in range(KEYS)]
+
+
+def _autocomplete(n, inp, tmp):
+    question = go_questionary.autocomplete(
+        "Pick one", _choices(n), input=inp, output=DummyOutput()
+    )
+    return question, list("choice number 12")[:KEYS]
+
+
+def _files(n, tmp):
+    """Directory with ``n`` empty files, created once."""
+
+    directory = os.path.join(tmp, "files-{}".format(n))
+    if not os.path.isdir(directory):
+        os.mkdir(directory)
+        for i in range(n):
+            open(os.path.join(directory, "file{}.txt".format(i)), "w").close()
+    return directory
+
+
+def _path(n, inp, tmp):
+    directory = os.path.join(tmp, "files-{}".format(n))
+    question = go_questionary.path(
+        "Pick a file",
+        default=directory + os.path.sep,
+        input=inp,
+        output=DummyOutput(),
+    )
+    return question, list("file12")[:KEYS]
+
+
+def _text(n, inp, tmp):
+    question = go_questionary.text(
+        "Type something",
+        default="x" * n,
+        validate=lambda t: len(t) > 0 or "Type something",
+        input=inp,
+        output=DummyOutput(),
+    )
+    return question, ["a"] * KEYS
+
+
+PROMPTS = {
+    "select": _select,
+    "checkbox": _checkbox,
+    "rawselect": _rawselect,
+    "autocomplete": _autocomplete,
+    "path": _path,
+    "text": _text,
+}
+
+
+def _drive(create, n, tmp, trace_memory):
+    """Create and answer one question, returns the measurements."""
+
+    with create_pipe_input() as inp:
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        question, keys = create(n, inp, tmp)
+        construct = time.perf_counter() - start
+        if question is None:
+            if trace_memory:
+                tracemalloc.stop()
+            return None
+
+        app = question.application
+        keys = list(keys)[: LARGE_SIZE_KEYS if n >= LARGE_SIZE else KEYS]
+        key_count = len(keys)
+        state = {"sent": None, "first_render": None, "base": None}
+        latencies, allocated, blocks = [], [], []
+
+        def after_render(_):
+            if app.is_done:
+                # the final frame, drawn after exiting
+                return
+            now = time.perf_counter()
+            if state["first_render"] is None:
+                state["first_render"] = now - start_run
+            elif state["sent"] is not None:
+                latencies.append(now - state["sent"])
+                if trace_memory:
+                    peak = tracemalloc.get_traced_memory()[1]
+                    allocated.append(peak - state["base"])
+                    blocks.append(sys.getallocatedblocks() - state["blocks"])
+            state["sent"] = None
+
+            if not keys:
+                app.exit()
+                return
+
+            if trace_memory:
+                state["base"] = tracemalloc.get_traced_memory()[0]
+                state["blocks"] = sys.getallocatedblocks()
+                tracemalloc.reset_peak()
+            state["sent"] = time.perf_counter()
+            inp.send_text(keys.pop(0))
+
+        app.after_render += after_render
+        start_run = time.perf_counter()
+        app.run()
+
+        result = {
+            "keys": key_count,
+            "construct_ms": construct * 1000,
+            "first_render_ms": state["first_render"] * 1000,
+        }
+        if trace_memory:
+            result["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+            result["key_alloc_kib"] = sum(allocated) / len(allocated) / 1024
+            result["key_blocks"] = sum(blocks) / len(blocks)
+        else:
+            latencies.sort()
+            result["key_p50_ms"] = latencies[len(latencies) // 2] * 1000
+            result["key_p95_ms"] = latencies[int(len(latencies) * 0.95)] * 1000
+            result["key_max_ms"] = latencies[-1] * 1000
+        return result
+
+
+def run(prompts, sizes):
+    tmp = tempfile.mkdtemp(prefix="go_questionary-bench-")
+    results = []
+    try:
+        for name in prompts:
+            for n in sizes:
+                if name == "path":
+                    _files(n, tmp)
+                timing = _drive(PROMPTS[name], n, tmp, trace_memory=False)
+                if timing is None:
+                    continue
+                memory = _drive(PROMPTS[name], n, tmp, trace_memory=True)
+                result = {"prompt": name, "size": n, **timing}
+                result["peak_kib"] = memory["peak_kib"]
+                result["key_alloc_kib"] = memory["key_alloc_kib"]
+                result["key_blocks"] = memory["key_blocks"]
+                results.append(result)
+                print(
+                    "{prompt:<12} {size:>7}  construct {construct_ms:9.2f} ms  "
+                    "first render {first_render_ms:9.2f} ms  "
+                    "key p50 {key_p50_ms:8.2f} ms  p95 {key_p95_ms:8.2f} ms  "
+                    "peak {peak_kib:10.0f} KiB  "
+                    "per key {key_alloc_kib:8.1f} KiB".format(**result),
+                    file=sys.stderr,
+                )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Metrics that got worse than the baseline by more than ``tolerance``."""
+
+    previous = {(r["prompt"], r["size"]): r for r in baseline["results"]}
+    found = []
+    for result in results:
+        before = previous.get((result["prompt"], result["size"]))
+        if before is None:
+            continue
+        for metric in GATED_METRICS:
+            if result[metric] > before[metric] * (1 + tolerance):
+                found.append(
+                    "{} {} {}: {:.2f} -> {:.2f}".format(
+                        result["prompt"],
+                        result["size"],
+                        metric,
+                        before[metric],
+                        result[metric],
+                    )
+                )
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", nargs="*", default=list(PROMPTS))
+    parser.add_argument("--sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args.prompts, args.sizes)
+    report = {
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for regression in found:
+            print("regression: " + regression, file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
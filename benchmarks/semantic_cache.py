@@ -0,0 +1,304 @@
+"""Lookup latency and hit rate of the semantic cache by index size.
+
+Every index holds the same few thousand realistic queries; the other rows
+are random vectors, embedding a million queries would take minutes and
+does not change the cost of a lookup. Probes are paraphrases of cached
+queries (filler words, other word forms, typos, other case), queries that
+were never cached and the opposites of cached queries (uninstall after
+install, or the same arguments swapped). For every size it reports:
+
+* ``build_s`` - time to append all rows
+* ``index_mib`` - size of the index files
+* ``lookup_p50_ms``, ``lookup_p95_ms`` - time of a lookup, embedding the
+  query included
+* ``candidate_rate`` - paraphrases whose cached query was the most similar
+  one above the threshold
+* ``hit_rate`` - paraphrases answered with the right cached query, after
+  the checks of :func:`go_cli_cache.is_paraphrase`
+* ``false_hit_rate`` - queries never cached that got an answer anyway, many
+  differ from a cached one in a single word
+* ``opposite_hit_rate`` - opposites of cached queries that got the answer
+  of the cached query, including swapped arguments
+
+Templates are checked once, with the queries of ``TEMPLATES``:
+
+* ``template_hit_rate`` - queries whose commands were filled in correctly
+* ``unsafe_template_rate`` - queries with a value that must not be filled
+  in (the root directory, a much shorter number, shell syntax) that got
+  commands anyway
+
+Needs numpy. Run from the repository root::
+
+    python benchmarks/semantic_cache.py
+    python benchmarks/semantic_cache.py --sizes 10000 1000000
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np  # noqa: E402
+
+import go_cli_cache  # noqa: E402
+
+SIZES = [10000, 100000, 1000000]
+PROBES = 400
+CHUNK = 100000
+SYSTEM = "Linux"
+
+VERBS = ["list", "show", "delete", "find", "count", "stop", "restart", "describe"]
+OBJECTS = [
+    "gcp instances",
+    "docker containers",
+    "kubernetes pods",
+    "s3 buckets",
+    "git branches",
+    "log files",
+    "python processes",
+    "conda environments",
+    "azure virtual machines",
+    "open ports",
+    "cron jobs",
+    "systemd services",
+]
+# cached queries and their opposites, which must not get the same commands
+OPPOSITES = [
+    ("install numpy with pip", "uninstall numpy with pip"),
+    ("encrypt secret.txt with gpg", "decrypt secret.txt with gpg"),
+    ("mount the usb drive", "unmount the usb drive"),
+    ("lock the screen", "unlock the screen"),
+    ("enable the firewall", "disable the firewall"),
+    ("upload the build folder", "unload the build folder"),
+    ("compress the log folder", "decompress the log folder"),
+    ("connect to the vpn", "disconnect from the vpn"),
+    ("import the gpg key", "export the gpg key"),
+    ("freeze the python packages", "unfreeze the python packages"),
+    ("encode the file in base64", "decode the file in base64"),
+    ("link the config file", "unlink the config file"),
+    # swapped or moved arguments
+    ("copy report_final_v2.txt to a.txt", "copy a.txt to report_final_v2.txt"),
+    ("move old.txt to new.txt", "move new.txt to old.txt"),
+    ("kill process 12345", "kill 12345 process"),
+]
+# cached query and commands, then queries with the same template and the
+# commands they must get, None if they must go to the server
+TEMPLATES = [
+    (
+        "delete the file /tmp/foo/bar",
+        ["rm /tmp/foo/bar"],
+        [
+            ("delete the file /tmp/foo/baz", ["rm /tmp/foo/baz"]),
+            ("delete the file ~/notes/old.txt", ["rm ~/notes/old.txt"]),
+            ("delete the file /", None),
+            ("delete the file ~", None),
+            ("delete the file ~/", None),
+            ("delete the file ..", None),
+            ("delete the file /etc", None),
+            ("delete the file /tmp/foo;reboot", None),
+        ],
+    ),
+    (
+        "kill process 12345",
+        ["kill 12345"],
+        [
+            ("kill process 67890", ["kill 67890"]),
+            ("kill process 4242", ["kill 4242"]),
+            ("kill process 1", None),
+            ("kill process 12", None),
+        ],
+    ),
+    (
+        "generate 100 random characters into test.txt",
+        ["head -c 100 /dev/urandom > test.txt"],
+        [
+            ("generate 250 random characters into out.txt", ["head -c 250 /dev/urandom > out.txt"]),
+            ("generate 100 random characters into $(reboot).txt", None),
+        ],
+    ),
+    (
+        'make a directory called "reports"',
+        ["mkdir reports"],
+        [
+            ('make a directory called "invoices"', ["mkdir invoices"]),
+            ('make a directory called "foo bar"', None),
+        ],
+    ),
+    (
+        "scale image.png by 0.5",
+        ["convert image.png -resize 0.5 out.png"],
+        [
+            ("scale photo.png by 1.5", ["convert photo.png -resize 1.5 out.png"]),
+        ],
+    ),
+]
+QUALIFIERS = [
+    "in the current directory",
+    "older than a week",
+    "sorted by size",
+    "with json output",
+    "in all namespaces",
+    "for the current user",
+    "that are running",
+    "created today",
+    "using the most memory",
+    "matching a pattern",
+]
+
+
+def paraphrase(query, rng):
+    """The query with filler words, another word form, a typo or other case."""
+
+    words = query.split()
+    change = rng.randrange(5)
+    if change == 0:
+        words = ["please"] + words[:1] + ["the"] + words[1:]
+    elif change == 1:
+        i = rng.choice([i for i, w in enumerate(words) if len(w) > 3])
+        words[i] = words[i][:-1] if words[i].endswith("s") else words[i] + "s"
+    elif change == 2:
+        # swap two letters of the longest word
+        i = max(range(len(words)), key=lambda i: len(words[i]))
+        j = rng.randrange(1, len(words[i]) - 2)
+        w = words[i]
+        words[i] = w[:j] + w[j + 1] + w[j] + w[j + 2 :]
+    elif change == 3:
+        # drop a letter of the longest word
+        i = max(range(len(words)), key=lambda i: len(words[i]))
+        j = rng.randrange(1, len(words[i]))
+        words[i] = words[i][:j] + words[i][j + 1 :]
+    else:
+        words = [w.upper() if rng.random() < 0.3 else w for w in words]
+    return " ".join(words)
+
+
+def build(directory, size, cached):
+    index = go_cli_cache.SemanticIndex(directory)
+    start = time.perf_counter()
+    index.add_many(cached, SYSTEM)
+    rng = np.random.default_rng(0)
+    for first in range(len(cached), size, CHUNK):
+        count = min(CHUNK, size - first)
+        vectors = rng.standard_normal((count, go_cli_cache.SEMANTIC_DIM)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index.add_many(
+            ["filler query {}".format(i) for i in range(first, first + count)],
+            SYSTEM,
+            vectors,
+        )
+    return index, time.perf_counter() - start
+
+
+def measure(index, probes):
+    """Probes are (kind, query, cached query it is a paraphrase of)."""
+
+    latencies = []
+    counts = {"paraphrase": 0, "uncached": 0, "opposite": 0}
+    candidates = 0
+    hits = 0
+    false_hits = {"uncached": 0, "opposite": 0}
+    for kind, query, expected in probes:
+        start = time.perf_counter()
+        results = index.search(query, SYSTEM)
+        answers = [q for _, q in results if go_cli_cache.is_paraphrase(query, q)]
+        latencies.append(time.perf_counter() - start)
+        counts[kind] += 1
+        if kind != "paraphrase":
+            false_hits[kind] += bool(answers)
+            continue
+        candidates += bool(results) and results[0][1] == expected
+        hits += bool(answers) and answers[0] == expected
+    latencies.sort()
+    return {
+        "lookup_p50_ms": latencies[len(latencies) // 2] * 1000,
+        "lookup_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "candidate_rate": candidates / counts["paraphrase"],
+        "hit_rate": hits / counts["paraphrase"],
+        "false_hit_rate": false_hits["uncached"] / counts["uncached"],
+        "opposite_hit_rate": false_hits["opposite"] / counts["opposite"],
+    }
+
+
+def measure_templates(directory):
+    cache = go_cli_cache.ResponseCache(directory)
+    counts = {"safe": 0, "unsafe": 0}
+    hits = {"safe": 0, "unsafe": 0}
+    for query, commands, probes in TEMPLATES:
+        cache.put_template(query, SYSTEM, commands)
+        for probe, expected in probes:
+            templated = cache.get_templated(probe, SYSTEM)
+            answer = templated[1] if templated else None
+            kind = "safe" if expected is not None else "unsafe"
+            counts[kind] += 1
+            hits[kind] += answer is not None and (expected is None or answer == expected)
+    return {
+        "template_hit_rate": hits["safe"] / counts["safe"],
+        "unsafe_template_rate": hits["unsafe"] / counts["unsafe"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="*", type=int, default=SIZES)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    queries = [
+        " ".join(parts) for parts in itertools.product(VERBS, OBJECTS, QUALIFIERS)
+    ]
+    rng.shuffle(queries)
+    # a quarter is never cached, to count answers to queries nobody asked
+    uncached = queries[: len(queries) // 4]
+    cached = queries[len(queries) // 4 :] + [q for q, _ in OPPOSITES]
+    probes = [("paraphrase", paraphrase(q, rng), q) for q in rng.sample(cached, PROBES // 2)]
+    probes += [("uncached", q, None) for q in rng.sample(uncached, PROBES // 2)]
+    probes += [("opposite", opposite, None) for _, opposite in OPPOSITES]
+
+    directory = tempfile.mkdtemp(prefix="gorilla-templates-")
+    try:
+        templates = measure_templates(directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    print(
+        "templates  hits {template_hit_rate:5.1%}  "
+        "unsafe hits {unsafe_template_rate:5.1%}".format(**templates),
+        file=sys.stderr,
+    )
+
+    results = []
+    for size in args.sizes:
+        directory = tempfile.mkdtemp(prefix="gorilla-semantic-")
+        try:
+            index, build_time = build(directory, size, cached)
+            index.search(cached[0], SYSTEM)  # page the signatures in
+            result = {
+                "size": size,
+                "build_s": build_time,
+                "index_mib": index.size_bytes() / 2 ** 20,
+                **measure(index, probes),
+                **templates,
+            }
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        results.append(result)
+        print(
+            "{size:>8} rows  build {build_s:6.1f} s  index {index_mib:7.1f} MiB  "
+            "lookup p50 {lookup_p50_ms:6.2f} ms  p95 {lookup_p95_ms:6.2f} ms  "
+            "candidates {candidate_rate:5.1%}  hits {hit_rate:5.1%}  "
+            "false hits {false_hit_rate:5.1%}  "
+            "opposite hits {opposite_hit_rate:5.1%}".format(**result),
+            file=sys.stderr,
+        )
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Per-question transition latency of a 50 question form.
+
+Compares asking every question with its own application to asking all of
+them with a single, reused application (``reuse_application=True``).
+
+Run from the repository root: ``python benchmarks/session.py``
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prompt_toolkit.input import create_pipe_input  # noqa: E402
+from prompt_toolkit.output import DummyOutput  # noqa: E402
+
+import go_questionary  # noqa: E402
+
+QUESTIONS = 50
+ROUNDS = 5
+
+
+def run_form(reuse_application: bool) -> float:
+    with create_pipe_input() as inp:
+        questions = [
+            {
+                "type": "text",
+                "name": "q{}".format(i),
+                "message": "Question {}".format(i),
+                "input": inp,
+                "output": DummyOutput(),
+            }
+            for i in range(QUESTIONS)
+        ]
+        # all answers are already waiting in the input pipe
+        inp.send_text("answer\r" * QUESTIONS)
+
+        start = time.perf_counter()
+        answers = go_questionary.unsafe_prompt(
+            questions, reuse_application=reuse_application
+        )
+        elapsed = time.perf_counter() - start
+
+    assert len(answers) == QUESTIONS
+    return elapsed
+
+
+def main() -> None:
+    for reuse_application in (False, True):
+        best = min(run_form(reuse_application) for _ in range(ROUNDS))
+        print(
+            "reuse_application={!s:<5}  {:8.3f} ms per question".format(
+                reuse_application, best / QUESTIONS * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,28 +13,54 @@
 # limitations under the License.
 
 import datetime
+import email.utils
+import json
 import os
 import sys
 import uuid
 import fcntl
 import platform
+import random
 import requests
 import subprocess
 import argparse
 import termios
+import threading
+import time
 import urllib.parse
-import sys
-from halo import Halo
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import go_questionary
+import go_cli_cache
 
 __version__ = "0.0.11"  # current version
-SERVER_URL = "https://cli.gorilla-llm.com"
+# can be pointed to a local server, e.g. a stub for testing
+SERVER_URL = os.environ.get("GORILLA_CLI_SERVER_URL", "https://cli.gorilla-llm.com")
 UPDATE_CHECK_FILE = os.path.expanduser("~/.gorilla-cli-last-update-check")
 USERID_FILE = os.path.expanduser("~/.gorilla-cli-userid")
 HISTORY_FILE = os.path.expanduser("~/.gorilla_cli_history")
+RATE_LIMIT_FILE = os.path.expanduser("~/.gorilla-cli-rate-limit")
+CIRCUIT_FILE = os.path.expanduser("~/.gorilla-cli-circuit")
+CACHE_STATS_FILE = os.path.expanduser("~/.gorilla-cli-cache-stats")
 ISSUE_URL = f"https://github.com/gorilla-llm/gorilla-cli/issues/new"
 GORILLA_EMOJI = "🦍 " if go_questionary.try_encode_gorilla() else ""
 HISTORY_LENGTH = 10
+BATCH_CONCURRENCY = 4
+# requests per second of all gorilla processes together,
+# the server is a shared free deployment
+RATE_LIMIT = 2.0
+RATE_LIMIT_BURST = 5
+THROTTLE_STATUS_CODES = (429, 503)
+THROTTLE_RETRIES = 3
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 30.0
+MAX_RETRY_WAIT = 60.0  # give up instead of waiting longer for the server
+THROTTLED_EXIT_CODE = 75  # EX_TEMPFAIL, try again later
+CIRCUIT_FAILURES = 3  # failed requests in a row before not trying any more
+CIRCUIT_COOLDOWN = 60.0  # seconds until a probe checks whether the server is back
+PROBE_TIMEOUT = 10
+# cached answers younger than this are used instead of asking the server
+# in the non-interactive modes
+CACHE_MAX_AGE = 7 * 24 * 3600
 WELCOME_TEXT = f"""===***===
 {GORILLA_EMOJI}Welcome to Gorilla-CLI! Enhance your Command Line with the power of LLMs! 
 
@@ -123,7 +149,7 @@ def check_for_updates():
             print("Unable to write update check file:", e)
 
 
-def get_user_id():
+def get_user_id(interactive=True):
     # Unique user identifier for authentication and load balancing
     # Gorilla-CLI is hosted by UC Berkeley Sky lab for FREE as a
     #  research prototype. Please don't spam the system or use it
@@ -136,6 +162,11 @@ def get_user_id():
             user_id = generate_random_uid()
         return user_id
     except FileNotFoundError:
+        if not interactive:
+            # Nobody to ask whether to use the Github handle, scripts get a
+            # random id that isn't saved. Running gorilla interactively
+            # once lets users choose.
+            return generate_random_uid()
         try:
             user_id = get_git_email()
             print(WELCOME_TEXT)
@@ -184,6 +215,492 @@ def append_string_to_file_if_missing(file_path, target_string):
             file.write(target_string)
 
 
+class ThrottledError(Exception):
+    """
+    The server kept asking us to slow down (429 / 503),
+    or asked to wait longer than MAX_RETRY_WAIT
+    """
+    def __init__(self, retry_after):
+        super().__init__(f"Throttled by the server, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class SharedState:
+    """
+    A small JSON object shared by all gorilla processes: it lives
+    in a file, locked while it's updated.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.memory_state = {}  # used if the file can't be opened
+
+    def update(self, update):
+        """
+        Calls update(state, now) with the state locked and
+        stores the changed state. Returns what update returned.
+        """
+        with self.lock:
+            now = time.time()
+            try:
+                f = open(self.path, "a+")
+            except OSError:
+                return update(self.memory_state, now)
+            with f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {}
+                result = update(state, now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+            return result
+
+class SharedTokenBucket:
+    """
+    Token bucket rate limiter shared by all gorilla processes through a
+    SharedState. `rate` tokens per second are added, up to `burst`. A rate
+    of 0 doesn't limit, but waits asked for by the server are still honored.
+    """
+    def __init__(self, rate=RATE_LIMIT, burst=RATE_LIMIT_BURST, path=RATE_LIMIT_FILE):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state = SharedState(path)
+
+    def _take(self, state, now):
+        """Takes a token, returns how long to wait if there is none"""
+        blocked = state.get("blocked_until", 0) - now
+        if blocked > 0:
+            return blocked
+        if not self.rate:
+            return 0
+        elapsed = max(0, now - state.get("updated", now))
+        tokens = min(self.burst, state.get("tokens", self.burst) + elapsed * self.rate)
+        state["updated"] = now
+        if tokens >= 1:
+            state["tokens"] = tokens - 1
+            return 0
+        state["tokens"] = tokens
+        return (1 - tokens) / self.rate
+
+    def acquire(self):
+        """
+        Waits until a request may be sent. Raises ThrottledError
+        instead of waiting longer than MAX_RETRY_WAIT.
+        """
+        while True:
+            wait = self.state.update(self._take)
+            if wait <= 0:
+                return
+            if wait > MAX_RETRY_WAIT:
+                raise ThrottledError(wait)
+            time.sleep(wait)
+
+    def block(self, seconds):
+        """Makes all processes wait, e.g. for a Retry-After of the server"""
+        def block(state, now):
+            state["blocked_until"] = max(state.get("blocked_until", 0), now + seconds)
+        self.state.update(block)
+
+def retry_delay(response, attempt):
+    """
+    Seconds to wait before retrying a throttled request: the Retry-After
+    of the server, else exponential backoff with full jitter
+    """
+    retry_after = response.headers.get("Retry-After")
+    delay = None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                date = email.utils.parsedate_to_datetime(retry_after)
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=datetime.timezone.utc)
+                delay = (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    if delay is not None:
+        # jitter, so the waiting processes don't all retry at once
+        return max(0.0, delay) + random.uniform(0, BACKOFF_BASE)
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+def post_with_backoff(url, data_json, session=None, bucket=None):
+    """
+    POST within the shared rate limit. Throttled requests are retried
+    after the delay the server asks for, or with exponential backoff.
+    Raises ThrottledError if the server keeps throttling.
+    """
+    bucket = bucket or SharedTokenBucket()
+    for attempt in range(THROTTLE_RETRIES + 1):
+        bucket.acquire()
+        response = (session or requests).post(url, json=data_json, timeout=30)
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            return response
+        delay = retry_delay(response, attempt)
+        # every gorilla process waits, not just this request
+        bucket.block(delay)
+        if attempt == THROTTLE_RETRIES or delay > MAX_RETRY_WAIT:
+            raise ThrottledError(delay)
+
+class RejectedError(requests.exceptions.HTTPError):
+    """
+    The server answered but refused the request (4xx), unlike an
+    unreachable server answering offline doesn't help
+    """
+    def __init__(self, response):
+        super().__init__(
+            f"Server rejected the request: {response.status_code} {response.reason}",
+            response=response,
+        )
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Not even trying, the last requests failed
+    """
+
+class CircuitBreaker:
+    """
+    Stops sending requests after CIRCUIT_FAILURES failed ones in a row, in
+    all gorilla processes, so they don't wait for the server to time out.
+    Once the cool-down passed, a probe in a background process checks whether
+    the server is back and closes the circuit, or opens it for another
+    cool-down.
+    """
+    def __init__(self, path=CIRCUIT_FILE, failures=CIRCUIT_FAILURES, cooldown=CIRCUIT_COOLDOWN):
+        self.failures = failures
+        self.cooldown = cooldown
+        self.state = SharedState(path)
+
+    def check(self):
+        """
+        Raises CircuitOpenError if the circuit is open,
+        starting the probe if it is due
+        """
+        def check(state, now):
+            opened_at = state.get("opened_at")
+            if opened_at is None:
+                return False, False
+            start_probe = (
+                now - opened_at >= self.cooldown
+                and now - state.get("probe_started_at", 0) >= PROBE_TIMEOUT
+            )
+            if start_probe:
+                state["probe_started_at"] = now
+            return True, start_probe
+
+        is_open, start_probe = self.state.update(check)
+        if start_probe:
+            start_probe_process()
+        if is_open:
+            raise CircuitOpenError("the last requests failed, not trying again for now")
+
+    def is_open(self):
+        try:
+            self.check()
+        except CircuitOpenError:
+            return True
+        return False
+
+    def record_success(self):
+        def close(state, now):
+            state.clear()
+        self.state.update(close)
+
+    def record_failure(self):
+        def fail(state, now):
+            state["failures"] = state.get("failures", 0) + 1
+            if state["failures"] >= self.failures and state.get("opened_at") is None:
+                state["opened_at"] = now
+        self.state.update(fail)
+
+    def reopen(self):
+        """The probe failed, wait another cool-down"""
+        def reopen(state, now):
+            state["opened_at"] = now
+            state.pop("probe_started_at", None)
+        self.state.update(reopen)
+
+def start_probe_process():
+    """
+    Runs probe_server in a detached process, so the probe
+    outlives a gorilla invocation that answered locally
+    """
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--probe-server"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+def probe_server(breaker=None):
+    """
+    Any answer of the server but a server error closes the circuit
+    """
+    breaker = breaker or CircuitBreaker()
+    try:
+        response = requests.get(SERVER_URL, timeout=PROBE_TIMEOUT)
+    except requests.exceptions.RequestException:
+        breaker.reopen()
+    else:
+        if response.status_code >= 500:
+            breaker.reopen()
+        else:
+            breaker.record_success()
+
+def get_commands(user_id, user_input, system_info, interaction_id, session=None,
+                 bucket=None, breaker=None, cache=None):
+    """
+    Commands suggested by the server, which are also cached for offline use.
+    Raises HTTPError for server errors, which count as failures of the
+    circuit breaker, and RejectedError if the server refused the request.
+    Raises CircuitOpenError without sending a request if the server has
+    been unreachable.
+    """
+    breaker = breaker or CircuitBreaker()
+    breaker.check()
+    data_json = {
+        "user_id": user_id,
+        "user_input": user_input,
+        "interaction_id": interaction_id,
+        "system_info": system_info
+    }
+    try:
+        response = post_with_backoff(
+            f"{SERVER_URL}/commands_v2", data_json, session, bucket
+        )
+        if response.status_code >= 500:
+            response.raise_for_status()
+        commands = response.json() if response.ok else None
+    except requests.exceptions.RequestException:
+        breaker.record_failure()
+        raise
+    # the server is up even if it refused the request
+    breaker.record_success()
+    if not response.ok:
+        raise RejectedError(response)
+    (cache or go_cli_cache.ResponseCache()).put(user_input, system_info, commands, interaction_id)
+    return commands
+
+def get_commands_coalesced(user_id, user_input, system_info, interaction_id, session=None,
+                           bucket=None, breaker=None, cache=None):
+    """
+    get_commands, but if another gorilla process or thread is already
+    asking the server the same query, waits for its answer instead.
+    Returns the commands and their metadata, the source and interaction id.
+    """
+    cache = cache or go_cli_cache.ResponseCache()
+    commands, shared_entry = cache.coalesce(
+        user_input,
+        system_info,
+        lambda: get_commands(
+            user_id, user_input, system_info, interaction_id, session, bucket, breaker, cache
+        ),
+    )
+    if shared_entry is None:
+        return commands, {"source": "server", "interaction_id": interaction_id}
+    return commands, {
+        "source": "coalesced",
+        "interaction_id": shared_entry.get("interaction_id") or interaction_id,
+    }
+
+def search_history(user_input, history_file=HISTORY_FILE):
+    """
+    Executed commands sharing words with the query,
+    the most matching and most recent first
+    """
+    try:
+        with open(history_file, "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    words = set(user_input.lower().split())
+    matches = []
+    for line in reversed(lines):
+        command = line.rstrip('\n')
+        overlap = len(words & set(command.lower().split()))
+        if overlap and command not in matches:
+            matches.append(command)
+    matches.sort(key=lambda command: -len(words & set(command.lower().split())))
+    return matches[:HISTORY_LENGTH]
+
+def lookup_cache(user_input, system_info, cache=None, max_age=CACHE_MAX_AGE, stats=None):
+    """
+    The cached answer to the query or a similar one, see ResponseCache.lookup.
+    Counts the lookups, hits by source and the time they took for --cache-stats.
+    """
+    start = time.monotonic()
+    local = (cache or go_cli_cache.ResponseCache()).lookup(user_input, system_info, max_age)
+    elapsed_ms = (time.monotonic() - start) * 1000
+
+    def record(state, now):
+        state["lookups"] = state.get("lookups", 0) + 1
+        state["lookup_ms"] = state.get("lookup_ms", 0.0) + elapsed_ms
+        if local:
+            hits = state.setdefault("hits", {})
+            hits[local[1]["source"]] = hits.get(local[1]["source"], 0) + 1
+
+    (stats or SharedState(CACHE_STATS_FILE)).update(record)
+    return local
+
+def cache_stats(cache=None, stats=None):
+    """
+    Size of the semantic index and how often
+    the cache answered, for --cache-stats
+    """
+    cache = cache or go_cli_cache.ResponseCache()
+    state = (stats or SharedState(CACHE_STATS_FILE)).update(lambda state, now: dict(state))
+    lookups = state.get("lookups", 0)
+    hits = state.get("hits", {})
+    return {
+        "semantic_index_entries": len(cache.semantic),
+        "semantic_index_bytes": cache.semantic.size_bytes(),
+        "lookups": lookups,
+        "hits": hits,
+        "hit_rate": round(sum(hits.values()) / lookups, 3) if lookups else 0.0,
+        "mean_lookup_ms": round(state.get("lookup_ms", 0.0) / lookups, 2) if lookups else 0.0,
+    }
+
+def get_offline_commands(user_input, system_info, cache=None):
+    """
+    Commands from local sources: the cached response to the query or a
+    similar one, no matter how old, else matching commands of the history.
+    Returns the commands and metadata about where they come from.
+    """
+    local = lookup_cache(user_input, system_info, cache, max_age=None)
+    if local:
+        return local
+    return search_history(user_input), {"source": "history"}
+
+# answers adapted from another query, they need a closer look before running
+APPROXIMATE_SOURCES = ("template", "semantic")
+
+def describe_source(metadata, commands):
+    """Tells the user where commands that didn't come from the server come from"""
+    if metadata["source"] == "cache":
+        return "Showing the commands Gorilla suggested for this query before."
+    if metadata["source"] == "template":
+        return f"Showing the commands Gorilla suggested for \"{metadata['template_query']}\", changed for this query."
+    if metadata["source"] == "semantic":
+        return f"Showing the commands Gorilla suggested for the similar query \"{metadata['similar_query']}\"."
+    if commands:
+        return "Showing matching commands from your history."
+    return "No earlier answer or matching command in your history for this query."
+
+def print_commands(commands, as_json, **metadata):
+    """
+    Non-interactive output: the candidate commands, one per line,
+    or a JSON object with the commands and their metadata
+    """
+    commands = [command.rstrip('\n') for command in commands or []]
+    if as_json:
+        print(json.dumps({**metadata, "commands": commands}))
+    else:
+        for command in commands:
+            print(command)
+
+
+def read_batch_queries(path):
+    """
+    One query per line, '-' reads stdin.
+    Empty lines and lines starting with # are skipped.
+    """
+    if path == "-":
+        lines = [line.strip() for line in sys.stdin]
+    else:
+        with open(path, "r") as f:
+            lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith("#")]
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+def run_batch(queries, user_id, system_info, concurrency=BATCH_CONCURRENCY,
+              rate=RATE_LIMIT, order="input", output=sys.stdout, use_cache=True):
+    """
+    Request the commands of all queries, `concurrency` at a time over
+    a shared connection pool, unless they are cached. Writes one JSON
+    line per query, in input order or as they complete, and the latency
+    stats to stderr. Returns the number of failed or throttled queries.
+    """
+    cache = go_cli_cache.ResponseCache()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    bucket = SharedTokenBucket(rate)
+    stats = SharedState(CACHE_STATS_FILE)
+
+    def query(index, user_input):
+        result = {"index": index, "query": user_input, "interaction_id": str(uuid.uuid4())}
+        start = time.monotonic()
+        try:
+            local = lookup_cache(user_input, system_info, cache, stats=stats) if use_cache else None
+            result["commands"], metadata = local or get_commands_coalesced(
+                user_id, user_input, system_info, result["interaction_id"], session, bucket,
+                cache=cache,
+            )
+            result.update(metadata)
+            result["status"] = "ok"
+        except ThrottledError as e:
+            result["status"] = "throttled"
+            result["error"] = str(e)
+        except (requests.exceptions.RequestException, OSError, ValueError) as e:
+            # OSError: the cache or shared state files, like a full disk
+            result["status"] = "error"
+            result["error"] = str(e) or type(e).__name__
+        result["latency_ms"] = round((time.monotonic() - start) * 1000, 1)
+        return result
+
+    progress = sys.stderr.isatty()
+    pending = {}  # finished results waiting for earlier ones, by index
+    next_index = 0
+    latencies = []
+    failed = 0
+    throttled = 0
+    start = time.monotonic()
+
+    with session, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(query, i, q) for i, q in enumerate(queries)]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            latencies.append(result["latency_ms"])
+            failed += result["status"] == "error"
+            throttled += result["status"] == "throttled"
+
+            if order == "input":
+                pending[result["index"]] = result
+                while next_index in pending:
+                    print(json.dumps(pending.pop(next_index)), file=output, flush=True)
+                    next_index += 1
+            else:
+                print(json.dumps(result), file=output, flush=True)
+
+            if progress:
+                print(f"\r{done}/{len(queries)} queries, {failed} failed, {throttled} throttled", end="", file=sys.stderr)
+
+    elapsed = time.monotonic() - start
+    latencies.sort()
+    if progress:
+        print(file=sys.stderr)
+    print(
+        f"{len(queries)} queries, {failed} failed, {throttled} throttled in {elapsed:.1f}s "
+        f"({len(queries) / elapsed if elapsed else 0:.1f}/s), latency "
+        f"p50 {percentile(latencies, 50):.0f} ms, p95 {percentile(latencies, 95):.0f} ms, "
+        f"max {latencies[-1] if latencies else 0:.0f} ms",
+        file=sys.stderr,
+    )
+    return failed + throttled
+
+
 def main():
     def execute_command(cmd):
         cmd = format_command(cmd)
@@ -209,54 +726,137 @@ def main():
             with open(history_file, 'r') as history:
                 lines = history.readlines()
                 if not lines:
-                    print("No command history.")
+                    print("No command history.", file=sys.stderr)
                 return lines[-HISTORY_LENGTH:]
         else:
-            print("No command history.")
+            print("No command history.", file=sys.stderr)
             return
 
-    args = sys.argv[1:]
-    user_input = " ".join(args)
-    user_id = get_user_id()
-    system_info = get_system_info()
-
-
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Gorilla CLI Help Doc")
     parser.add_argument("-p", "--history", action="store_true", help="Display command history")
+    parser.add_argument("--json", action="store_true", help="Print the candidate commands as JSON instead of prompting")
+    parser.add_argument("--first", action="store_true", help="Print only the top candidate command instead of prompting")
+    parser.add_argument("--print", dest="print_commands", action="store_true", help="Print the candidate commands, one per line, instead of prompting")
+    parser.add_argument("--batch", metavar="FILE", help="Request commands for every line of FILE ('-' for stdin) and print them as JSON lines")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="Number of parallel requests in batch mode")
+    parser.add_argument("--rate", type=float, default=RATE_LIMIT, help="Maximum requests per second of all gorilla processes in batch mode, 0 for no limit")
+    parser.add_argument("--order", choices=["input", "completion"], default="input", help="Order of the batch results")
+    parser.add_argument("--offline", action="store_true", help="Don't contact the server, answer from the cache of earlier answers and the command history")
+    parser.add_argument("--no-cache", action="store_true", help="With --json, --first, --print or --batch, always ask the server, even if the query or a similar one was answered before")
+    parser.add_argument("--cache-stats", action="store_true", help="Print the size of the semantic cache and how often the cache answered, as JSON")
+    parser.add_argument("--probe-server", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("command_args", nargs='*', help="Prompt to be inputted to Gorilla")
 
     args = parser.parse_args()
 
+    if args.probe_server:
+        # started in the background while the server was unreachable
+        probe_server()
+        return
+
+    if args.cache_stats:
+        print(json.dumps(cache_stats()))
+        return
+
+    # Output modes for scripts and editors: no prompt, spinner or update check
+    interactive = not (args.json or args.first or args.print_commands or args.batch)
+
+    user_input = " ".join(args.command_args)
+    user_id = get_user_id(interactive)
+    system_info = get_system_info()
+
     # Generate a unique interaction ID
     interaction_id = str(uuid.uuid4())
 
+    if args.batch:
+        if args.concurrency < 1:
+            parser.error("--concurrency must be at least 1")
+        queries = read_batch_queries(args.batch)
+        if run_batch(queries, user_id, system_info, args.concurrency, args.rate, args.order,
+                     use_cache=not args.no_cache):
+            sys.exit(1)
+        return
+
+    # the commands come from the server unless it's unreachable or --offline.
+    # Scripts get answers to queries asked before (or differing only in their
+    # literals) from the cache, interactive runs always ask the server.
+    offline = args.offline
+    metadata = {"source": "server"}
+    local = None
+    if not (interactive or args.history or args.offline or args.no_cache):
+        local = lookup_cache(user_input, system_info)
     if args.history:
+        metadata = {"source": "history"}
         commands = get_history_commands(HISTORY_FILE)
+    elif args.offline:
+        commands, metadata = get_offline_commands(user_input, system_info)
+    elif local:
+        commands, metadata = local
+    elif not interactive:
+        try:
+            commands, metadata = get_commands_coalesced(user_id, user_input, system_info, interaction_id)
+            interaction_id = metadata.pop("interaction_id")
+        except ThrottledError as e:
+            print(e, file=sys.stderr)
+            sys.exit(THROTTLED_EXIT_CODE)
+        except RejectedError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            print(f"Server is unreachable: {e}", file=sys.stderr)
+            offline = True
+            commands, metadata = get_offline_commands(user_input, system_info)
     else:
+        from halo import Halo
+
         with Halo(text=f"{GORILLA_EMOJI}Loading", spinner="dots"):
             try:
-                data_json = {
-                    "user_id": user_id,
-                    "user_input": user_input,
-                    "interaction_id": interaction_id,
-                    "system_info": system_info
-                }
-                response = requests.post(
-                    f"{SERVER_URL}/commands_v2", json=data_json, timeout=30
-                )
-                commands = response.json()
-            except requests.exceptions.RequestException as e:
-                print("Server is unreachable.")
+                commands, metadata = get_commands_coalesced(user_id, user_input, system_info, interaction_id)
+                # when coalesced, the execution result belongs to the other request
+                interaction_id = metadata.pop("interaction_id")
+            except ThrottledError as e:
+                print(f"Gorilla is busy right now, please try again in {e.retry_after:.0f} seconds.")
+                return
+            except RejectedError as e:
+                print(f"{e}.")
                 print("Try updating Gorilla-CLI with 'pip install --upgrade gorilla-cli'")
                 return
-
-    check_for_updates()
+            except requests.exceptions.RequestException as e:
+                offline = True
+                commands, metadata = get_offline_commands(user_input, system_info)
+                print("Server is unreachable.")
+                if not commands:
+                    print("Try updating Gorilla-CLI with 'pip install --upgrade gorilla-cli'")
+                    return
+
+    approximate = metadata["source"] in APPROXIMATE_SOURCES
+    if not interactive:
+        if args.first:
+            commands = commands[:1] if commands else []
+        if approximate and not args.json:
+            print(describe_source(metadata, commands), file=sys.stderr)
+        print_commands(
+            commands,
+            args.json,
+            query=user_input,
+            interaction_id=interaction_id,
+            **metadata,
+        )
+        if not commands:
+            sys.exit(1)
+        return
+
+    if offline or approximate:
+        print(describe_source(metadata, commands))
+    if not offline:
+        check_for_updates()
 
     if commands:
-        selected_command = go_questionary.select(
-            "", choices=commands, instruction="Welcome to Gorilla. Use arrow keys to select. Ctrl-C to Exit"
-        ).ask()
+        instruction = "Welcome to Gorilla. Use arrow keys to select. Ctrl-C to Exit"
+        if approximate:
+            instruction = "Not suggested for this exact query, check before running. Use arrow keys to select. Ctrl-C to Exit"
+        selected_command = go_questionary.fast_select("", choices=commands, instruction=instruction)
 
         if not selected_command:
             # happens when Ctrl-C is pressed
@@ -268,6 +868,10 @@ def main():
             append_to_bash_history(selected_command)
             prefill_shell_cmd(selected_command)
 
+        if offline:
+            # the server doesn't know this interaction
+            return
+
         # Commands failed / succeeded?
         try:
             response = requests.post(
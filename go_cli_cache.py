@@ -0,0 +1,658 @@
+# Copyright 2023 https://github.com/ShishirPatil/gorilla
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import fcntl
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import time
+import zlib
+
+CACHE_DIR = os.path.expanduser("~/.gorilla-cli-cache")
+COALESCE_TIMEOUT = 30.0  # seconds to wait for another process asking the same
+COALESCE_POLL_INTERVAL = 0.02
+
+# words that don't change what a query asks for
+STOPWORDS = frozenset(
+    "a an the please pls kindly can could would you i me my want like some called named".split()
+)
+# literals of a query that are slots of its template, the first matching
+# pattern wins: quoted strings, paths and file names (with a letter in the
+# extension, 1.5 is a number), numbers and identifiers mixing letters with
+# digits or underscores (vm1, my_bucket)
+SLOT_PATTERN = re.compile(
+    r"""(?P<quoted>"[^"]*"|'[^']*')"""
+    r"""|(?P<path>(?:~|\.{1,2})?/[^\s"']*|[\w-]*\w\.(?=[\w.-]*[A-Za-z])[A-Za-z0-9][\w.-]*)"""
+    r"""|(?P<number>\b\d+(?:\.\d+)*\b)"""
+    r"""|(?P<identifier>\b(?=[\w-]*[\d_])[A-Za-z][\w-]*\w\b)"""
+)
+WORD_PATTERN = re.compile(r"\w+(?:[-']\w+)*")
+# templates need this many words besides the slots to be specific enough
+TEMPLATE_MIN_WORDS = 2
+# filled in values can't contain these, they're put into shell commands
+# unquoted: whitespace, quotes, substitutions, command separators,
+# redirections, globs, comments
+UNSAFE_SLOT_CHARACTERS = frozenset("\"'`$\\;|&<>(){}[]*?!# \n\r\t")
+# filled in values this much shorter than the value of the cached query
+# are refused, like 1 for a process id or / for a file
+SLOT_MIN_LENGTH_RATIO = 0.5
+
+# semantic cache: queries are hashed into SEMANTIC_DIM dimensional vectors
+# of their words and character trigrams, see embed_query
+SEMANTIC_DIM = 256
+SEMANTIC_THRESHOLD = 0.75  # cosine similarity of queries checked to be paraphrases
+# a first pass compares 64 bit signatures of the vectors (random hyperplanes,
+# their hamming distance estimates the angle), the closest this many rows
+# are then compared exactly
+SEMANTIC_CANDIDATES = 256
+# at most this many similar queries are checked to be paraphrases
+SEMANTIC_RESULTS = 8
+SEMANTIC_SEED = 20230607  # all processes need the same hyperplanes
+WORD_WEIGHT = 2.0
+TRIGRAM_WEIGHT = 1.0
+# shorter words are too often another word with a letter swapped or missing
+TYPO_MIN_LENGTH = 5
+
+_numpy = None
+
+def load_numpy():
+    """
+    numpy, imported on first use: only the semantic cache needs it and
+    most runs are answered before or without it. None if not installed.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def normalize_query(query):
+    """
+    Queries differing only in the case of their words or in whitespace
+    are the same query. Literals (see SLOT_PATTERN) are kept as they are,
+    Report.txt and report.txt are different files.
+    """
+    parts = []
+    last = 0
+    for match in SLOT_PATTERN.finditer(query):
+        parts.append(query[last:match.start()].lower())
+        parts.append(match.group())
+        last = match.end()
+    parts.append(query[last:].lower())
+    return "".join(
+        re.sub(r"\s+", " ", part) if i % 2 == 0 else part for i, part in enumerate(parts)
+    ).strip()
+
+def cache_key(query, system_info):
+    normalized = f"{normalize_query(query)}\0{system_info}"
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def canonicalize(query):
+    """
+    Splits a query into its canonical form and its slots: case and
+    whitespace are folded, stopwords dropped and literals (numbers,
+    files, quoted strings, identifiers) replaced by their type.
+    "generate 100 random characters into test.txt" becomes
+    "generate {number} random characters into {path}" with the
+    slots [("number", "100"), ("path", "test.txt")].
+    """
+    words = []
+    slots = []
+    last = 0
+
+    def add_words(text):
+        words.extend(w for w in WORD_PATTERN.findall(text.lower()) if w not in STOPWORDS)
+
+    for match in SLOT_PATTERN.finditer(query):
+        add_words(query[last:match.start()])
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "quoted":
+            value = value[1:-1]
+        words.append("{" + kind + "}")
+        slots.append((kind, value))
+        last = match.end()
+    add_words(query[last:])
+    return " ".join(words), slots
+
+def make_templates(slots, commands):
+    """
+    The commands as templates: lists of literal strings and numbers of the
+    slots they contain. None if that isn't safe: slots with the same value,
+    a slot none of the commands contains (then the answer doesn't depend on
+    it in a way we could fill in), or a slot found more than once in one
+    command (likely a coincidence, like a number 1).
+    """
+    values = [value for kind, value in slots]
+    if len(set(values)) != len(values) or any(not value for value in values):
+        return None
+    # longest first, so a value containing another one wins
+    ordered = sorted(values, key=len, reverse=True)
+    pattern = re.compile(
+        "|".join(r"(?<![\w.-])" + re.escape(value) + r"(?![\w-])" for value in ordered)
+    ) if values else None
+
+    templates = []
+    used = set()
+    for command in commands:
+        if not isinstance(command, str):
+            return None
+        parts = []
+        found = []
+        last = 0
+        for match in pattern.finditer(command) if pattern else ():
+            found.append(values.index(match.group()))
+            parts.extend([command[last:match.start()], found[-1]])
+            last = match.end()
+        if len(set(found)) != len(found):
+            return None
+        parts.append(command[last:])
+        used.update(found)
+        templates.append([part for part in parts if part != ""])
+    if len(used) != len(values):
+        return None
+    return templates
+
+def is_broad_path(value):
+    """The root, home or current directory or one of their parents"""
+    return not value.strip("/.~")
+
+def is_safe_slot(kind, value, original):
+    """
+    Whether the value can be filled in for a slot that had the original
+    value in the cached query, commands of other values go to the server
+    """
+    if UNSAFE_SLOT_CHARACTERS & set(value):
+        return False
+    if kind == "path" and is_broad_path(value):
+        return False
+    return len(value) >= SLOT_MIN_LENGTH_RATIO * len(original)
+
+def fill_templates(templates, slots, original_slots):
+    """
+    The commands of the templates with the values of the slots, None if
+    one of them isn't safe to put in place of the original slots
+    """
+    values = [value for kind, value in slots]
+    for (kind, value), (_, original) in zip(slots, original_slots):
+        if not is_safe_slot(kind, value, original):
+            return None
+    return [
+        "".join(values[part] if isinstance(part, int) else part for part in template)
+        for template in templates
+    ]
+
+def write_json_atomic(path, data):
+    """
+    Readers in other processes see the old or the new file, never a part
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def query_features(query):
+    """
+    Weighted words and character trigrams of a query, without
+    stopwords. Repeated features count sublinearly.
+    """
+    counts = collections.Counter()
+    for word in WORD_PATTERN.findall(query.lower()):
+        if word in STOPWORDS:
+            continue
+        counts["w " + word] += 1
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            counts["c " + padded[i:i + 3]] += 1
+    return {
+        feature: (WORD_WEIGHT if feature[0] == "w" else TRIGRAM_WEIGHT) * (1 + math.log(count))
+        for feature, count in counts.items()
+    }
+
+def embed_query(query):
+    """
+    Unit vector of the query's features, hashed into SEMANTIC_DIM
+    dimensions with a hashed sign, so collisions tend to cancel out
+    """
+    np = load_numpy()
+    vector = np.zeros(SEMANTIC_DIM, dtype=np.float32)
+    for feature, weight in query_features(query).items():
+        h = zlib.crc32(feature.encode("utf-8"))
+        vector[h % SEMANTIC_DIM] += weight if h & 0x80000000 else -weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+_hyperplanes = None
+
+def signatures(vectors):
+    """64 bit random hyperplane signatures of the rows of vectors"""
+    global _hyperplanes
+    np = load_numpy()
+    if _hyperplanes is None:
+        rng = np.random.default_rng(SEMANTIC_SEED)
+        _hyperplanes = rng.standard_normal((SEMANTIC_DIM, 64)).astype(np.float32)
+    bits = (np.atleast_2d(vectors).astype(np.float32) @ _hyperplanes) > 0
+    return np.packbits(bits, axis=1, bitorder="little").view(np.uint64).ravel()
+
+_POPCOUNT = None
+
+def popcount(values):
+    global _POPCOUNT
+    np = load_numpy()
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(values)
+    if _POPCOUNT is None:
+        _POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return _POPCOUNT[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def content_words(query):
+    return {word for word in WORD_PATTERN.findall(query.lower()) if word not in STOPWORDS}
+
+def stem(word):
+    for suffix in ("ing", "es", "ed", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+def is_typo(word, other):
+    """
+    Whether one word is the other with two neighbouring letters swapped or
+    one letter missing. Words starting with another letter are never typos,
+    they are often opposites (install, uninstall, encrypt, decrypt), and
+    neither are words with a replaced letter (upload, unload).
+    """
+    if min(len(word), len(other)) < TYPO_MIN_LENGTH or word[0] != other[0]:
+        return False
+    if len(word) == len(other):
+        diff = [i for i in range(len(word)) if word[i] != other[i]]
+        return (
+            len(diff) == 2
+            and diff[1] == diff[0] + 1
+            and word[diff[0]] == other[diff[1]]
+            and word[diff[1]] == other[diff[0]]
+        )
+    short, long = sorted((word, other), key=len)
+    if len(long) - len(short) != 1:
+        return False
+    return any(long[:i] + long[i + 1:] == short for i in range(1, len(long)))
+
+def same_word(word, other):
+    return stem(word) == stem(other) or is_typo(word, other)
+
+def literals(query):
+    """
+    The literals of the query in order, each with its position among the
+    words of the canonical form: "copy a.txt to b.txt" and "copy b.txt to
+    a.txt" have the same literals, but not in the same places.
+    """
+    canonical, slots = canonicalize(query)
+    positions = [i for i, word in enumerate(canonical.split()) if word.startswith("{")]
+    return [
+        (position, value) for position, (kind, value) in zip(positions, slots)
+    ]
+
+def is_paraphrase(query, similar_query):
+    """
+    Whether the answer to similar_query can be used for query. The vectors
+    only find candidates: queries differing in one word are very similar,
+    but can need different commands. So every word of each query needs a
+    counterpart in the other one (the same word in another form or with a
+    typo, see is_typo), and the literals (numbers, files, ...) have to be
+    the same and in the same places, swapped arguments change the command.
+    """
+    if literals(query) != literals(similar_query):
+        return False
+    words = content_words(query)
+    similar_words = content_words(similar_query)
+    return all(any(same_word(w, s) for s in similar_words) for w in words) and all(
+        any(same_word(s, w) for w in words) for s in similar_words
+    )
+
+
+class SemanticIndex:
+    """
+    Vectors of cached queries, to find paraphrases of a query. Rows are
+    appended to memory-mapped files shared by all gorilla processes:
+
+    - vectors.f16: the query vectors, SEMANTIC_DIM float16 per row
+    - signatures.u64: their 64 bit signatures
+    - queries.jsonl: the query and system info of every row
+    - offsets.u64: where the row's line in queries.jsonl starts
+
+    Writers append under a lock, the signatures last, so readers only
+    look at rows that are complete. Rows an interrupted writer left in
+    some of the files are cut off by the next writer. Searching and adding need numpy.
+    """
+    def __init__(self, directory=os.path.join(CACHE_DIR, "semantic")):
+        self.directory = directory
+        self.vectors_path = os.path.join(directory, "vectors.f16")
+        self.signatures_path = os.path.join(directory, "signatures.u64")
+        self.queries_path = os.path.join(directory, "queries.jsonl")
+        self.offsets_path = os.path.join(directory, "offsets.u64")
+
+    def __len__(self):
+        try:
+            return os.path.getsize(self.signatures_path) // 8
+        except OSError:
+            return 0
+
+    def size_bytes(self):
+        total = 0
+        for path in (self.vectors_path, self.signatures_path, self.queries_path, self.offsets_path):
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+
+    def add(self, query, system_info):
+        self.add_many([query], system_info)
+
+    def add_many(self, queries, system_info, vectors=None):
+        """
+        Appends rows for queries of one system, vectors are
+        their embeddings if they were already computed
+        """
+        np = load_numpy()
+        if vectors is None:
+            vectors = np.array([embed_query(query) for query in queries])
+        lines = [
+            json.dumps({"query": query, "system_info": system_info}).encode("utf-8") + b"\n"
+            for query in queries
+        ]
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, "lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._truncate_to_complete_rows()
+            with open(self.queries_path, "ab") as f:
+                start = f.tell()
+                f.write(b"".join(lines))
+            offsets = start + np.cumsum([0] + [len(line) for line in lines[:-1]], dtype=np.uint64)
+            with open(self.offsets_path, "ab") as f:
+                f.write(offsets.astype(np.uint64).tobytes())
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors.astype(np.float16).tobytes())
+            with open(self.signatures_path, "ab") as f:
+                f.write(signatures(vectors).tobytes())
+
+    def _truncate_to_complete_rows(self):
+        """
+        Cuts all files to the rows complete in every one of them. A write
+        that was interrupted leaves rows in some files only, the rows
+        appended after them would belong to the wrong queries.
+        Call with the lock held.
+        """
+        np = load_numpy()
+        row_sizes = {
+            self.offsets_path: 8,
+            self.vectors_path: SEMANTIC_DIM * 2,
+            self.signatures_path: 8,
+        }
+        sizes = {}
+        for path in (*row_sizes, self.queries_path):
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                sizes[path] = 0
+        count = min(sizes[path] // row_size for path, row_size in row_sizes.items())
+        queries_size = 0
+        if count:
+            with open(self.offsets_path, "rb") as f:
+                f.seek((count - 1) * 8)
+                last = int(np.fromfile(f, dtype=np.uint64, count=1)[0])
+            with open(self.queries_path, "rb") as f:
+                f.seek(last)
+                f.readline()
+                queries_size = f.tell()
+        sizes_wanted = {path: count * row_size for path, row_size in row_sizes.items()}
+        sizes_wanted[self.queries_path] = queries_size
+        for path, size in sizes_wanted.items():
+            if sizes[path] > size:
+                os.truncate(path, size)
+
+    def _row(self, offsets, row):
+        with open(self.queries_path, "rb") as f:
+            f.seek(int(offsets[row]))
+            return json.loads(f.readline())
+
+    def search(self, query, system_info, threshold=SEMANTIC_THRESHOLD, limit=SEMANTIC_RESULTS):
+        """
+        Up to limit cached queries of the same system with a cosine
+        similarity of at least threshold, the most similar first, as
+        (similarity, query)
+        """
+        np = load_numpy()
+        count = len(self)
+        if not count:
+            return []
+        vector = embed_query(query)
+        signature_array = np.memmap(self.signatures_path, dtype=np.uint64, mode="r", shape=(count,))
+        vectors = np.memmap(self.vectors_path, dtype=np.float16, mode="r", shape=(count, SEMANTIC_DIM))
+        offsets = np.memmap(self.offsets_path, dtype=np.uint64, mode="r", shape=(count,))
+
+        distances = popcount(signature_array ^ signatures(vector)[0])
+        if count > SEMANTIC_CANDIDATES:
+            rows = np.argpartition(distances, SEMANTIC_CANDIDATES - 1)[:SEMANTIC_CANDIDATES]
+        else:
+            rows = np.arange(count)
+        rows.sort()  # reading the rows in order is faster
+        similarities = vectors[rows].astype(np.float32) @ vector
+
+        results = []
+        for i in np.argsort(-similarities):
+            if similarities[i] < threshold:
+                break
+            row = self._row(offsets, rows[i])
+            if row["system_info"] == system_info:
+                results.append((float(similarities[i]), row["query"]))
+                if len(results) == limit:
+                    break
+        return results
+
+
+class ResponseCache:
+    """
+    Commands the server suggested, by normalized query and system. One small
+    JSON file per query, so gorilla processes can share the cache without
+    locking: files are replaced atomically.
+    Caching is best effort, unreadable or unwritable entries are misses.
+    """
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.semantic = SemanticIndex(os.path.join(directory, "semantic"))
+
+    def path(self, query, system_info, suffix=".json", kind="responses"):
+        key = cache_key(query, system_info)
+        # spread the files over subdirectories, directories with very
+        # many entries are slow on some file systems
+        return os.path.join(self.directory, kind, key[:2], key + suffix)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, query, system_info):
+        """
+        The cached entry with "query", "system_info", "commands" and
+        "cached_at" (a timestamp), None if there is none
+        """
+        return self._read(self.path(query, system_info))
+
+    def get_templated(self, query, system_info):
+        """
+        Commands of an earlier query with the same canonical form, with the
+        slots filled in from this query. Returns the template entry and the
+        commands, None if there is none or it can't be filled in safely.
+        """
+        canonical, slots = canonicalize(query)
+        entry = self._read(self.path(canonical, system_info, kind="templates"))
+        if not entry or entry.get("slot_types") != [kind for kind, value in slots]:
+            return None
+        original_slots = canonicalize(entry["query"])[1]
+        commands = fill_templates(entry["templates"], slots, original_slots)
+        if not commands:
+            return None
+        return entry, commands
+
+    def get_similar(self, query, system_info):
+        """
+        The cached entry of the most similar earlier query that is a
+        paraphrase of this one, and the similarity. None if there is none
+        or numpy isn't installed.
+        """
+        if load_numpy() is None:
+            return None
+        try:
+            similar = self.semantic.search(query, system_info)
+        except (OSError, ValueError):
+            return None
+        for similarity, similar_query in similar:
+            if not is_paraphrase(query, similar_query):
+                continue
+            entry = self.get(similar_query, system_info)
+            if entry:
+                return entry, similarity
+        return None
+
+    def lookup(self, query, system_info, max_age=None):
+        """
+        Commands for the query without asking the server: the cached
+        answer, else a filled in template, else the answer to a similar
+        query. Entries older than max_age seconds are ignored. Returns the
+        commands and metadata about where they come from, None if there
+        are none.
+        """
+        oldest = time.time() - max_age if max_age is not None else 0
+        entry = self.get(query, system_info)
+        if entry and entry["cached_at"] >= oldest:
+            return entry["commands"], {"source": "cache", "cached_at": entry["cached_at"]}
+        templated = self.get_templated(query, system_info)
+        if templated and templated[0]["cached_at"] >= oldest:
+            entry, commands = templated
+            return commands, {
+                "source": "template",
+                "cached_at": entry["cached_at"],
+                "template_query": entry["query"],
+            }
+        similar = self.get_similar(query, system_info)
+        if similar and similar[0]["cached_at"] >= oldest:
+            entry, similarity = similar
+            return entry["commands"], {
+                "source": "semantic",
+                "cached_at": entry["cached_at"],
+                "similar_query": entry["query"],
+                "similarity": round(similarity, 3),
+            }
+        return None
+
+    def put(self, query, system_info, commands, interaction_id=None):
+        if not isinstance(commands, list) or not commands:
+            return
+        entry = {
+            "query": query,
+            "system_info": system_info,
+            "commands": commands,
+            "cached_at": time.time(),
+            "interaction_id": interaction_id,
+        }
+        path = self.path(query, system_info)
+        is_new = not os.path.exists(path)
+        try:
+            write_json_atomic(path, entry)
+        except OSError:
+            is_new = False
+        self.put_template(query, system_info, commands)
+        if is_new and load_numpy() is not None:
+            try:
+                self.semantic.add(query, system_info)
+            except OSError:
+                pass
+
+    def put_template(self, query, system_info, commands):
+        canonical, slots = canonicalize(query)
+        if len(canonical.split()) - len(slots) < TEMPLATE_MIN_WORDS:
+            return
+        templates = make_templates(slots, commands)
+        if templates is None:
+            return
+        entry = {
+            "canonical": canonical,
+            "query": query,
+            "system_info": system_info,
+            "slot_types": [kind for kind, value in slots],
+            "templates": templates,
+            "cached_at": time.time(),
+        }
+        try:
+            write_json_atomic(self.path(canonical, system_info, kind="templates"), entry)
+        except OSError:
+            pass
+
+    def coalesce(self, query, system_info, fetch, timeout=COALESCE_TIMEOUT):
+        """
+        Calls fetch(), which requests the commands and puts them into this
+        cache, unless another process or thread is already requesting the
+        same query: then waits for it and reads its answer from the cache.
+        If the other one fails or takes longer than timeout, calls fetch()
+        after all.
+
+        Returns the commands and the cache entry they were read from,
+        None if fetch() was called.
+        """
+        start = time.time()
+        try:
+            lock_path = self.path(query, system_info, ".lock")
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+            lock = open(lock_path, "a")
+        except OSError:
+            return fetch(), None
+
+        with lock:
+            waited = False
+            while True:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.time() - start > timeout:
+                        return fetch(), None
+                    waited = True
+                    time.sleep(COALESCE_POLL_INTERVAL)
+
+            # holding the lock: the request of the process that had it is done
+            if waited:
+                entry = self.get(query, system_info)
+                if entry and entry["cached_at"] >= start:
+                    return entry["commands"], entry
+            return fetch(), None
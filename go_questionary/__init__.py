@@ -1,54 +1,99 @@
-# noinspection PyUnresolvedReferences
-from prompt_toolkit.validation import Validator, ValidationError
-from prompt_toolkit.styles import Style
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Dict, List
 
 import go_questionary.version
-from go_questionary.form import Form
-from go_questionary.form import form
-from go_questionary.prompt import prompt, unsafe_prompt
-from go_questionary.prompts.common import Choice
-from go_questionary.prompts.common import Separator
-from go_questionary.prompts.common import print_formatted_text as print
-from go_questionary.question import Question
-
-# import the shortcuts to create single question prompts
-from go_questionary.prompts.autocomplete import autocomplete
-from go_questionary.prompts.select import select
-from go_questionary.prompts.checkbox import checkbox
-from go_questionary.prompts.text import text
-from go_questionary.prompts.path import path
-from go_questionary.prompts.confirm import confirm
-from go_questionary.prompts.password import password
-from go_questionary.prompts.rawselect import rawselect
-
-# Utilities
-from go_questionary.utils import try_encode_gorilla
 
 __version__ = go_questionary.version.__version__
 
-__all__ = [
-    "__version__",
+# Public names and the modules defining them. Prompt types and their
+# prompt_toolkit dependencies are imported on first use (PEP 562).
+_LAZY_ATTRIBUTES = {
     # question types
-    "autocomplete",
-    "checkbox",
-    "confirm",
-    "password",
-    "path",
-    "rawselect",
-    "select",
-    "text",
+    "autocomplete": "go_questionary.prompts.autocomplete",
+    "checkbox": "go_questionary.prompts.checkbox",
+    "confirm": "go_questionary.prompts.confirm",
+    "fast_select": "go_questionary.fastselect",
+    "password": "go_questionary.prompts.password",
+    "path": "go_questionary.prompts.path",
+    "rawselect": "go_questionary.prompts.rawselect",
+    "select": "go_questionary.prompts.select",
+    "text": "go_questionary.prompts.text",
     # utility methods
-    "print",
-    "form",
-    "prompt",
-    "unsafe_prompt",
+    "print": "go_questionary.prompts.common",
+    "compile": "go_questionary.prompt",
+    "prompt_async": "go_questionary.prompt",
+    "prompt_headless": "go_questionary.headless",
+    "prompt_headless_stream": "go_questionary.headless",
+    "unsafe_prompt": "go_questionary.prompt",
+    "unsafe_prompt_async": "go_questionary.prompt",
     # commonly used classes
-    "Form",
-    "Question",
-    "Choice",
-    "Style",
-    "Separator",
-    "Validator",
-    "ValidationError",
-    "try_encode_gorilla"
-]
+    "Form": "go_questionary.form",
+    "Question": "go_questionary.question",
+    "Choice": "go_questionary.prompts.common",
+    "Style": "prompt_toolkit.styles",
+    "Separator": "go_questionary.prompts.common",
+    "Validator": "prompt_toolkit.validation",
+    "ValidationError": "prompt_toolkit.validation",
+    # Utilities
+    "try_encode_gorilla": "go_questionary.utils",
+}
+
+# attributes named differently in their module
+_RENAMED = {"print": "print_formatted_text"}
+
+__all__ = ["__version__", "form", "prompt", *_LAZY_ATTRIBUTES]
+
+
+def _lazy_module(name: str) -> types.ModuleType:
+    """Register a submodule that is executed on first attribute access.
+
+    The ``prompt`` and ``form`` functions share their names with the
+    submodules defining them. Importing such a submodule the regular way
+    sets the attribute of this package to the module, so they are
+    registered here up front and the import system never rebinds them."""
+
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.find_spec(name)
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_prompt_module = _lazy_module("go_questionary.prompt")
+_form_module = _lazy_module("go_questionary.form")
+
+
+def prompt(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Prompt the user for input on all the questions.
+
+    See :func:`go_questionary.prompt.prompt` for the arguments."""
+
+    return _prompt_module.prompt(*args, **kwargs)
+
+
+def form(**kwargs: Any) -> Any:
+    """Create a form with multiple questions.
+
+    See :func:`go_questionary.form.form` for the arguments."""
+
+    return _form_module.form(**kwargs)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    value = getattr(module, _RENAMED.get(name, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,4 +1,9 @@
-from go_questionary import Style
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from prompt_toolkit.styles import Style
 
 # Value to display as an answer when "affirming" a confirmation question
 YES = "Yes"
@@ -33,17 +38,30 @@ DEFAULT_KBI_MESSAGE = "Cancelled by user"
 # Default text shown when the input is invalid
 INVALID_INPUT = "Invalid input"
 
-# Default message style
-DEFAULT_STYLE = Style(
-    [
-        ("qmark", "fg:#5f819d"),  # token in front of the question
-        ("question", "bold"),  # question text
-        ("answer", "fg:#FF9D00 bold"),  # submitted answer text behind the question
-        ("pointer", ""),  # pointer used in select and checkbox prompts
-        ("selected", ""),  # style for a selected item of a checkbox
-        ("separator", ""),  # separator in lists
-        ("instruction", ""),  # user instructions for select, rawselect, checkbox
-        ("text", ""),  # any other text
-        ("instruction", ""),  # user instructions for select, rawselect, checkbox
-    ]
-)
+
+# Style rules of the message (DEFAULT_STYLE), created on first use to keep
+# prompt_toolkit from being imported with this module
+def _default_style() -> Style:
+    from prompt_toolkit.styles import Style
+
+    return Style(
+        [
+            ("qmark", "fg:#5f819d"),  # token in front of the question
+            ("question", "bold"),  # question text
+            ("answer", "fg:#FF9D00 bold"),  # submitted answer text behind the question
+            ("pointer", ""),  # pointer used in select and checkbox prompts
+            ("selected", ""),  # style for a selected item of a checkbox
+            ("separator", ""),  # separator in lists
+            ("instruction", ""),  # user instructions for select, rawselect, checkbox
+            ("text", ""),  # any other text
+            ("instruction", ""),  # user instructions for select, rawselect, checkbox
+        ]
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DEFAULT_STYLE":
+        global DEFAULT_STYLE
+        DEFAULT_STYLE = _default_style()
+        return DEFAULT_STYLE
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import os
+import sys
+import unicodedata
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    import termios
+except ImportError:  # pragma: no cover
+    termios = None
+
+from go_questionary.constants import DEFAULT_KBI_MESSAGE, DEFAULT_SELECTED_POINTER
+
+# lists with more choices are always drawn with prompt_toolkit
+FAST_SELECT_MAX_CHOICES = 10
+
+# escape codes of the default style (256 colors), see constants.DEFAULT_STYLE
+_RESET = "\x1b[0m"
+_QMARK = "\x1b[0;38;5;67m"
+_QUESTION = "\x1b[0;1m"
+_ANSWER = "\x1b[0;38;5;214;1m"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+_ERASE_DOWN = "\x1b[J"
+
+_KEY_UP = ("\x1b[A", "\x1bOA")
+_KEY_DOWN = ("\x1b[B", "\x1bOB")
+_KEY_ENTER = ("\r", "\n")
+_KEY_ABORT = ("\x03", "\x11")  # Ctrl-C, Ctrl-Q
+
+# select() keyword arguments the fast selector draws the same way
+_SUPPORTED_KWARGS = frozenset(["default", "qmark", "pointer", "use_jk_keys"])
+
+
+def _width(text: str) -> int:
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+class _TerminalSelect:
+    """Draws a list of plain choices with direct ANSI writes while the
+    terminal is in raw mode, like :func:`select` does with prompt_toolkit."""
+
+    def __init__(
+        self,
+        message: str,
+        choices: List[str],
+        instruction: str,
+        pointer: Optional[str],
+        pointed_at: int,
+        use_jk_keys: bool,
+        fd_in: int,
+        fd_out: int,
+    ) -> None:
+        self.message = message
+        self.choices = choices
+        self.instruction = instruction
+        self.pointer = pointer
+        self.pointed_at = pointed_at
+        self.use_jk_keys = use_jk_keys
+        self.fd_in = fd_in
+        self.fd_out = fd_out
+        # terminal rows drawn by the last frame, below the first one
+        self._rows = 0
+
+    def _prompt_line(self, answer: Optional[str] = None) -> str:
+        line = "{}🦍{} {} ".format(_QMARK, _QUESTION, self.message)
+        if answer is None:
+            return line + _RESET + self.instruction
+        return line + _ANSWER + answer
+
+    def _rows_of(self, lines: List[str]) -> int:
+        try:
+            columns = os.get_terminal_size(self.fd_out).columns or 80
+        except OSError:
+            columns = 80
+        return sum(max(1, -(-_width(line) // columns)) for line in lines) - 1
+
+    def _draw(self, frame: str, plain_lines: List[str]) -> None:
+        # back to the first row of the previous frame, then overwrite it
+        up = "\x1b[{}A".format(self._rows) if self._rows else ""
+        os.write(self.fd_out, (up + "\r" + _ERASE_DOWN + frame).encode("utf-8"))
+        self._rows = self._rows_of(plain_lines)
+
+    def draw_choices(self) -> None:
+        lines = [self._prompt_line()]
+        plain = ["🦍 {} {}".format(self.message, self.instruction)]
+        for i, title in enumerate(self.choices):
+            if i == self.pointed_at and self.pointer is not None:
+                prefix = " {} ".format(self.pointer)
+            elif self.pointer is not None:
+                prefix = " " * (2 + len(self.pointer))
+            else:
+                prefix = " " * 3
+            lines.append(_RESET + prefix + title)
+            plain.append(prefix + title)
+        self._draw((_RESET + "\r\n").join(lines) + _RESET, plain)
+
+    def draw_answer(self, answer: Optional[str]) -> None:
+        if answer is None:
+            line = self._prompt_line()
+            plain = "🦍 {} {}".format(self.message, self.instruction)
+        else:
+            line = self._prompt_line(answer)
+            plain = "🦍 {} {}".format(self.message, answer)
+        self._draw(line + _RESET + "\r\n", [plain])
+
+    def _keys(self) -> Any:
+        pending = ""
+        while True:
+            data = os.read(self.fd_in, 64)
+            if not data:
+                raise EOFError
+            pending += data.decode("utf-8", "replace")
+            while pending:
+                for key in _KEY_UP + _KEY_DOWN:
+                    if pending.startswith(key):
+                        break
+                else:
+                    if pending == "\x1b" or pending in ("\x1b[", "\x1bO"):
+                        # incomplete escape sequence, wait for the rest
+                        break
+                    key = pending[0]
+                pending = pending[len(key) :]
+                yield key
+
+    def run(self) -> int:
+        """Let the user pick a choice, returns its index.
+
+        Raises:
+            KeyboardInterrupt: on Ctrl-C or Ctrl-Q
+        """
+
+        old = termios.tcgetattr(self.fd_in)
+        new = termios.tcgetattr(self.fd_in)
+        # same raw mode prompt_toolkit uses, output processing stays on
+        new[0] &= ~(
+            termios.IXON | termios.IXOFF | termios.ICRNL | termios.INLCR | termios.IGNCR
+        )
+        new[3] &= ~(termios.ECHO | termios.ICANON | termios.IEXTEN | termios.ISIG)
+        new[6][termios.VMIN] = 1
+        new[6][termios.VTIME] = 0
+
+        termios.tcsetattr(self.fd_in, termios.TCSANOW, new)
+        os.write(self.fd_out, _HIDE_CURSOR.encode())
+        try:
+            self.draw_choices()
+            for key in self._keys():
+                if key in _KEY_ABORT:
+                    self.draw_answer(None)
+                    raise KeyboardInterrupt
+                if key in _KEY_ENTER:
+                    self.draw_answer(self.choices[self.pointed_at])
+                    return self.pointed_at
+                if key in _KEY_UP or (self.use_jk_keys and key == "k"):
+                    self.pointed_at = (self.pointed_at - 1) % len(self.choices)
+                elif key in _KEY_DOWN or (self.use_jk_keys and key == "j"):
+                    self.pointed_at = (self.pointed_at + 1) % len(self.choices)
+                else:
+                    continue
+                self.draw_choices()
+            raise EOFError
+        finally:
+            os.write(self.fd_out, _SHOW_CURSOR.encode())
+            termios.tcsetattr(self.fd_in, termios.TCSADRAIN, old)
+
+
+def _plain_choices(choices: Sequence[Any]) -> Optional[List[Any]]:
+    """Titles and values of the choices, ``None`` if a choice is more than
+    a plain string or a dict with a string ``name`` and a ``value``."""
+
+    titles, values = [], []
+    for c in choices:
+        if isinstance(c, str):
+            title, value = c, c
+        elif isinstance(c, dict) and set(c) <= {"name", "value"}:
+            title = c.get("name")
+            value = c.get("value", title)
+            if value is None:
+                value = title
+        else:
+            return None
+        if not isinstance(title, str) or not title.isprintable():
+            return None
+        titles.append(title)
+        values.append(value)
+    return [titles, values]
+
+
+def _is_terminal(stdin: Any, stdout: Any) -> bool:
+    try:
+        return (
+            stdin.isatty()
+            and stdout.isatty()
+            and os.environ.get("TERM", "dumb") != "dumb"
+        )
+    except (AttributeError, ValueError):
+        return False
+
+
+def fast_select(
+    message: str,
+    choices: Sequence[Union[str, Dict[str, Any]]],
+    instruction: Optional[str] = None,
+    kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    max_fast_choices: int = FAST_SELECT_MAX_CHOICES,
+    **kwargs: Any,
+) -> Any:
+    """Ask the user to select one item, optimized for startup time.
+
+    Small lists of plain choices are drawn directly on the terminal, using
+    raw mode and ANSI escape codes, without importing prompt_toolkit. The
+    output and the up/down/j/k/Enter/Ctrl-C keys are those of
+    :func:`select`. Anything else, e.g. :class:`Choice` objects, separators,
+    disabled choices, styles or a terminal that doesn't support raw mode,
+    is asked with :func:`select`.
+
+    Unlike the other prompt functions this asks the question right away.
+
+    Example:
+        >>> import go_questionary
+        >>> go_questionary.fast_select(
+        ...     "What do you want to do?",
+        ...     choices=["Order a pizza", "Make a reservation"],
+        ... )
+        🦍 What do you want to do? Order a pizza
+        'Order a pizza'
+
+    Args:
+        message: Question text.
+
+        choices: Items shown in the selection, see :func:`select`.
+
+        instruction: A hint on how to navigate the menu.
+
+        kbi_msg: The message to be printed on a keyboard interrupt.
+
+        max_fast_choices: Lists with more choices are asked with
+                          :func:`select`.
+
+        kwargs: Additional arguments, passed to :func:`select`. Only
+                ``default``, ``qmark``, ``pointer`` and ``use_jk_keys``
+                are supported by the fast path.
+
+    Returns:
+        The value of the selected choice, ``None`` if the question was
+        cancelled.
+    """
+
+    plain = _plain_choices(choices) if 0 < len(choices) <= max_fast_choices else None
+    default = kwargs.get("default")
+
+    if (
+        plain is not None
+        and termios is not None
+        and set(kwargs) <= _SUPPORTED_KWARGS
+        and (default is None or default in plain[1])
+        and _is_terminal(sys.stdin, sys.stdout)
+    ):
+        titles, values = plain
+        selector = _TerminalSelect(
+            message,
+            titles,
+            instruction or "Welcome to Gorilla. Use arrows to select",
+            kwargs.get("pointer", DEFAULT_SELECTED_POINTER),
+            values.index(default) if default is not None else 0,
+            kwargs.get("use_jk_keys", True),
+            sys.stdin.fileno(),
+            sys.stdout.fileno(),
+        )
+        sys.stdout.flush()
+        try:
+            return values[selector.run()]
+        except KeyboardInterrupt:
+            print("\n{}\n".format(kbi_msg))
+            return None
+
+    from go_questionary.prompts.select import select
+
+    return select(message, choices, instruction=instruction, **kwargs).ask(
+        kbi_msg=kbi_msg
+    )
@@ -1,5 +1,6 @@
 from typing import Any, Dict, NamedTuple, Sequence
 
+from go_questionary import session
 from go_questionary.constants import DEFAULT_KBI_MESSAGE
 from go_questionary.question import Question
 
@@ -34,7 +35,13 @@ class Form:
     def __init__(self, *form_fields: FormField) -> None:
         self.form_fields = form_fields
 
-    def unsafe_ask(self, patch_stdout: bool = False) -> Dict[str, Any]:
+    def _flow(self, answers: Dict[str, Any]) -> session.QuestionFlow:
+        for f in self.form_fields:
+            answers[f.key] = yield f.question
+
+    def unsafe_ask(
+        self, patch_stdout: bool = False, reuse_application: bool = False
+    ) -> Dict[str, Any]:
         """Ask the questions synchronously and return user response.
 
         Does not catch keyboard interrupts.
@@ -43,10 +50,21 @@ class Form:
             patch_stdout: Ensure that the prompt renders correctly if other threads
                           are printing to stdout.
 
+            reuse_application: Ask all questions with a single prompt_toolkit
+                               application, swapping in the layout of each
+                               question instead of starting a new application.
+
         Returns:
             The answers from the form.
         """
-        return {f.key: f.question.unsafe_ask(patch_stdout) for f in self.form_fields}
+        if not reuse_application:
+            return {
+                f.key: f.question.unsafe_ask(patch_stdout) for f in self.form_fields
+            }
+
+        answers: Dict[str, Any] = {}
+        session.run_questions(self._flow(answers), patch_stdout)
+        return answers
 
     async def unsafe_ask_async(self, patch_stdout: bool = False) -> Dict[str, Any]:
         """Ask the questions using asyncio and return user response.
@@ -66,7 +84,10 @@ class Form:
         }
 
     def ask(
-        self, patch_stdout: bool = False, kbi_msg: str = DEFAULT_KBI_MESSAGE
+        self,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+        reuse_application: bool = False,
     ) -> Dict[str, Any]:
         """Ask the questions synchronously and return user response.
 
@@ -76,11 +97,15 @@ class Form:
 
             kbi_msg: The message to be printed on a keyboard interrupt.
 
+            reuse_application: Ask all questions with a single prompt_toolkit
+                               application, swapping in the layout of each
+                               question instead of starting a new application.
+
         Returns:
             The answers from the form.
         """
         try:
-            return self.unsafe_ask(patch_stdout)
+            return self.unsafe_ask(patch_stdout, reuse_application)
         except KeyboardInterrupt:
             print("")
             print(kbi_msg)
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Any, Optional
+
+from prompt_toolkit import Application
+
+# frames per second drawn at most for updates that are not keystrokes
+DEFAULT_MAX_FPS = 30.0
+
+
+class FrameScheduler:
+    """Limits how often an application is redrawn.
+
+    Every call to the application's ``invalidate()`` requests a redraw.
+    Requests caused by keystrokes are drawn right away, so typing is echoed
+    without delay. All other requests, e.g. from background threads
+    updating choices or validation messages, are coalesced into at most
+    ``max_fps`` frames per second: a request arriving while a frame is
+    already scheduled is dropped, its changes are part of that frame.
+
+    Not used unless enabled, e.g. with
+    :meth:`~go_questionary.question.Question.limit_frame_rate`: it replaces
+    the ``invalidate()`` method of the application it is attached to.
+
+    Args:
+        max_fps: Maximum number of frames per second for updates that
+                 are not keystrokes.
+    """
+
+    max_fps: float
+
+    frames_rendered: int
+    """Number of frames drawn"""
+
+    invalidations: int
+    """Number of redraws requested"""
+
+    invalidations_dropped: int
+    """Number of requests merged into an already scheduled frame"""
+
+    def __init__(self, max_fps: float = DEFAULT_MAX_FPS) -> None:
+        self.max_fps = max_fps
+        self.frames_rendered = 0
+        self.invalidations = 0
+        self.invalidations_dropped = 0
+
+        self._app: Optional["Application[Any]"] = None
+        self._lock = threading.Lock()
+        self._pending = False
+        self._last_frame = 0.0
+        # thread handling a key press, its redraws are not delayed
+        self._key_press_thread: Optional[int] = None
+
+    def attach(self, app: "Application[Any]") -> "FrameScheduler":
+        """Route the redraws of ``app`` through this scheduler.
+
+        Returns:
+            The scheduler itself.
+        """
+
+        self._app = app
+        self._invalidate = app.invalidate
+        # shadow the method, prompt_toolkit invalidates through the instance
+        app.invalidate = self.invalidate  # type: ignore
+        app.before_render += self._on_render
+        app.key_processor.before_key_press += self._on_key_press
+        app.key_processor.after_key_press += self._on_key_press_done
+        return self
+
+    def _on_render(self, _: Any) -> None:
+        self.frames_rendered += 1
+        self._last_frame = time.monotonic()
+
+    def _on_key_press(self, _: Any) -> None:
+        self._key_press_thread = threading.get_ident()
+
+    def _on_key_press_done(self, _: Any) -> None:
+        self._key_press_thread = None
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.max_fps if self.max_fps > 0 else 0.0
+
+    def invalidate(self) -> None:
+        """Request a redraw of the application. Thread safe."""
+
+        app = self._app
+        with self._lock:
+            self.invalidations += 1
+
+            if self._key_press_thread == threading.get_ident():
+                immediate = True
+            elif self._pending:
+                self.invalidations_dropped += 1
+                return
+            else:
+                delay = self._last_frame + self.interval - time.monotonic()
+                immediate = delay <= 0 or app is None or app.loop is None
+                self._pending = not immediate
+
+        if immediate:
+            self._invalidate()
+            return
+
+        def schedule() -> None:
+            app.loop.call_later(delay, self._flush)
+
+        try:
+            app.loop.call_soon_threadsafe(schedule)
+        except RuntimeError:
+            # the event loop is closed, nothing to draw anymore
+            with self._lock:
+                self._pending = False
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._pending = False
+        self._invalidate()
+
+
+def limit_frame_rate(
+    app: "Application[Any]", max_fps: float = DEFAULT_MAX_FPS
+) -> FrameScheduler:
+    """Redraw ``app`` at most ``max_fps`` times per second, except for
+    keystrokes. See :class:`FrameScheduler`."""
+
+    return FrameScheduler(max_fps).attach(app)
@@ -0,0 +1,414 @@
+import heapq
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+
+# bonus for matching the first character of a word
+BONUS_BOUNDARY = 8
+# bonus for matching an upper case letter after a lower case letter or
+# a digit after a non digit
+BONUS_CAMEL = 7
+# minimum bonus for a match directly following another match
+BONUS_CONSECUTIVE = 4
+# the bonus of the first query character counts this many times
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+WORD_SEPARATORS = frozenset(" /\\_-.,:;|")
+
+# with numpy, queries matching more candidates than this only score the
+# ones most likely to match well, see FuzzyIndex.rank
+MAX_SCORED = 5000
+
+# a match: score, index of the candidate and the matched character positions
+FuzzyMatch = Tuple[int, int, List[int]]
+
+_numpy = None
+
+
+def _load_numpy():
+    """:mod:`numpy`, imported when the first index is built: it takes longer
+    to import than the prompts, most of which never match fuzzily. ``None``
+    if it isn't installed."""
+
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def char_mask(text: str) -> int:
+    """Return a 64 bit mask with one bit set for every character of ``text``.
+
+    Different characters may share a bit, so a mask can only prove that a
+    candidate does **not** contain all characters of a query."""
+
+    mask = 0
+    for c in set(text):
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+def pair_mask(text: str) -> int:
+    """Return a 64 bit mask with one bit set for every pair of adjacent
+    characters of ``text``, see :func:`char_mask`."""
+
+    mask = 0
+    for a, b in zip(text, text[1:]):
+        mask |= 1 << ((ord(a) * 31 + ord(b)) & 63)
+    return mask
+
+
+def _masks(keys: List[str]):
+    """Masks of all ``keys`` as numpy arrays, computed on all characters at
+    once: the :func:`char_mask`, the :func:`char_mask` of the characters
+    starting a word, the :func:`pair_mask` and the lengths."""
+
+    np = _load_numpy()
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+    # lone surrogates, like in file names that are not valid UTF-8, are
+    # characters too
+    codes = np.frombuffer(
+        "".join(keys).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    codes = codes.astype(np.uint64)
+    starts = np.cumsum(lengths) - lengths
+    # masks of empty keys stay 0, the others are reduced from their start
+    # to the start of the next non empty key
+    filled = lengths > 0
+
+    one = np.uint64(1)
+    char_bits = np.left_shift(one, codes & np.uint64(63))
+    pair_bits = np.zeros_like(codes)
+    word_start = np.zeros(len(codes), dtype=bool)
+    if len(codes) > 1:
+        pairs = (codes[:-1] * np.uint64(31) + codes[1:]) & np.uint64(63)
+        pair_bits[:-1] = np.left_shift(one, pairs)
+        # the last character of a key has no pair
+        pair_bits[(starts + lengths - 1)[filled]] = 0
+
+        separators = np.array([ord(c) for c in WORD_SEPARATORS], dtype=np.uint64)
+        is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+        word_start[1:] = np.isin(codes[:-1], separators) | (is_digit[1:] & ~is_digit[:-1])
+    word_start[starts[filled]] = True
+    start_bits = np.where(word_start, char_bits, np.uint64(0))
+
+    char_masks = np.zeros(len(keys), dtype=np.uint64)
+    start_masks = np.zeros(len(keys), dtype=np.uint64)
+    pair_masks = np.zeros(len(keys), dtype=np.uint64)
+    if filled.any():
+        char_masks[filled] = np.bitwise_or.reduceat(char_bits, starts[filled])
+        start_masks[filled] = np.bitwise_or.reduceat(start_bits, starts[filled])
+        pair_masks[filled] = np.bitwise_or.reduceat(pair_bits, starts[filled])
+    return char_masks, start_masks, pair_masks, lengths
+
+
+_POPCOUNT = None
+
+
+def _popcount(values):
+    global _POPCOUNT
+    np = _load_numpy()
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(values)
+    if _POPCOUNT is None:
+        _POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return _POPCOUNT[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def _lower(text: str) -> str:
+    """``text`` in lower case with the same length.
+
+    A few characters (like ``İ``) have a longer lower case form, they are
+    kept as they are, so positions in the result are positions in ``text``."""
+
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _bonus(candidate: str, i: int) -> int:
+    if i == 0:
+        return BONUS_BOUNDARY
+
+    prev, cur = candidate[i - 1], candidate[i]
+    if prev in WORD_SEPARATORS:
+        return BONUS_BOUNDARY
+    if (prev.islower() and cur.isupper()) or (not prev.isdigit() and cur.isdigit()):
+        return BONUS_CAMEL
+    return 0
+
+
+def score(
+    query: str, candidate: str, ignore_case: bool = True
+) -> Optional[Tuple[int, List[int]]]:
+    """Score how well ``query`` fuzzy matches ``candidate``.
+
+    Args:
+        query: The characters to look for.
+
+        candidate: The string to search in.
+
+        ignore_case: If true, upper and lower case characters are equal.
+
+    Returns:
+        ``None`` if the candidate doesn't contain the query as a subsequence,
+        otherwise the score and the positions of the matched characters.
+    """
+
+    if not query:
+        return 0, []
+
+    haystack = _lower(candidate) if ignore_case else candidate
+    needle = _lower(query) if ignore_case else query
+
+    # find the first position where the whole query matched
+    end = -1
+    for c in needle:
+        end = haystack.find(c, end + 1)
+        if end == -1:
+            return None
+
+    # walk back to find the shortest window ending there
+    start = end
+    for c in reversed(needle[:-1]):
+        start = haystack.rfind(c, 0, start)
+
+    positions = []
+    total = 0
+    previous = -1
+    consecutive_bonus = 0
+    j = start
+    for qi, c in enumerate(needle):
+        j = haystack.find(c, j)
+        bonus = _bonus(candidate, j)
+
+        if previous != -1 and j == previous + 1:
+            consecutive_bonus = max(consecutive_bonus, bonus, BONUS_CONSECUTIVE)
+            bonus = consecutive_bonus
+        else:
+            consecutive_bonus = bonus
+            if previous != -1:
+                gap = j - previous - 1
+                total += SCORE_GAP_START + SCORE_GAP_EXTENSION * (gap - 1)
+
+        if qi == 0:
+            bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+
+        total += SCORE_MATCH + bonus
+        positions.append(j)
+        previous = j
+        j += 1
+
+    return total, positions
+
+
+def rank(
+    query: str,
+    candidates: Sequence[str],
+    limit: Optional[int] = None,
+    ignore_case: bool = True,
+    ids: Optional[Iterable[int]] = None,
+) -> List[FuzzyMatch]:
+    """Return the best fuzzy matches of ``query``, best match first.
+
+    Ties are broken by preferring shorter candidates and then the order of
+    ``candidates``.
+
+    Args:
+        query: The characters to look for.
+
+        candidates: The strings to search in.
+
+        limit: Maximum number of matches returned. ``None`` returns all.
+
+        ignore_case: If true, upper and lower case characters are equal.
+
+        ids: Only score the candidates at these positions.
+    """
+
+    if ids is None:
+        ids = range(len(candidates))
+
+    def matches() -> Iterable[Tuple[Tuple[int, int, int], FuzzyMatch]]:
+        for i in ids:
+            candidate = candidates[i]
+            result = score(query, candidate, ignore_case)
+            if result is not None:
+                s, positions = result
+                yield (s, -len(candidate), -i), (s, i, positions)
+
+    if limit is None:
+        ranked = sorted(matches(), key=lambda m: m[0], reverse=True)
+    else:
+        ranked = heapq.nlargest(limit, matches(), key=lambda m: m[0])
+    return [m for _, m in ranked]
+
+
+class FuzzyIndex:
+    """Candidates prepared for repeated fuzzy queries.
+
+    Character masks of all candidates are computed once. A query first
+    discards every candidate that is missing one of the query's characters
+    using the masks (vectorized with :mod:`numpy` if it is available) and
+    only scores the remaining ones. With :mod:`numpy` at most
+    :data:`MAX_SCORED` of them are scored, see :meth:`rank`.
+
+    Candidates can be added with :meth:`extend` while other threads query
+    the index, queries see all candidates added before they started.
+
+    Args:
+        candidates: The strings to search in.
+
+        ignore_case: If true, upper and lower case characters are equal.
+    """
+
+    candidates: List[str]
+    ignore_case: bool
+
+    def __init__(
+        self, candidates: Sequence[str] = (), ignore_case: bool = True
+    ) -> None:
+        self.candidates = []
+        self.ignore_case = ignore_case
+        self._masks: List[int] = []
+        self._lengths: List[int] = []
+        # masks of the characters starting words and of adjacent character
+        # pairs, only computed with numpy
+        self._start_masks: List[int] = []
+        self._pair_masks: List[int] = []
+        # numpy copies of the masks and lengths, they might lag behind
+        self._vectors = None
+
+        self.extend(candidates)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def extend(self, candidates: Iterable[str]) -> None:
+        """Add candidates to the index."""
+
+        candidates = list(candidates)
+        keys = [_lower(c) for c in candidates] if self.ignore_case else candidates
+
+        if _load_numpy() is not None:
+            masks, start_masks, pair_masks, lengths = _masks(keys)
+            self._masks.extend(masks.tolist())
+            self._start_masks.extend(start_masks.tolist())
+            self._pair_masks.extend(pair_masks.tolist())
+            self._lengths.extend(lengths.tolist())
+        else:
+            self._masks.extend(char_mask(k) for k in keys)
+            self._lengths.extend(len(k) for k in keys)
+        # add the candidates last, queries only look at candidates
+        # whose mask is already known
+        self.candidates.extend(candidates)
+
+    def _vectorized(self, count: int):
+        np = _load_numpy()
+        if self._vectors is None:
+            self._vectors = (
+                np.empty(0, dtype=np.uint64),
+                np.empty(0, dtype=np.uint64),
+                np.empty(0, dtype=np.uint64),
+                np.empty(0, dtype=np.int64),
+            )
+        if len(self._vectors[0]) < count:
+            start = len(self._vectors[0])
+            self._vectors = tuple(
+                np.concatenate([vector, np.array(values[start:count], dtype=vector.dtype)])
+                for vector, values in zip(
+                    self._vectors,
+                    (self._masks, self._start_masks, self._pair_masks, self._lengths),
+                )
+            )
+        return tuple(vector[:count] for vector in self._vectors)
+
+    def prefilter(self, query: str, count: Optional[int] = None) -> List[int]:
+        """Positions of all candidates that may contain the query.
+
+        Args:
+            query: The characters to look for.
+
+            count: Only look at the first ``count`` candidates.
+        """
+
+        if count is None:
+            count = len(self.candidates)
+
+        if self.ignore_case:
+            query = _lower(query)
+        mask = char_mask(query)
+        length = len(query)
+
+        np = _load_numpy()
+        if np is not None:
+            masks, _, _, lengths = self._vectorized(count)
+            qmask = np.uint64(mask)
+            hits = ((masks & qmask) == qmask) & (lengths >= length)
+            return np.flatnonzero(hits).tolist()
+
+        return [
+            i
+            for i, m, n in zip(range(count), self._masks, self._lengths)
+            if m & mask == mask and n >= length
+        ]
+
+    def rank(self, query: str, limit: Optional[int] = None) -> List[FuzzyMatch]:
+        """Return the best fuzzy matches of ``query``, best match first.
+
+        See :func:`rank` for details. With :mod:`numpy` and a ``limit``,
+        if more than :data:`MAX_SCORED` candidates contain the characters
+        of the query, only that many are scored: the ones with the most
+        query characters starting a word and adjacent pairs of query
+        characters, then the shortest. A better match among the others can
+        be missed, typing more characters finds it."""
+
+        count = len(self.candidates)
+        if not query:
+            ids: Iterable[int] = range(count)
+        elif _load_numpy() is not None and limit is not None:
+            ids = self._likely_matches(query, count)
+        else:
+            ids = self.prefilter(query, count)
+        return rank(query, self.candidates, limit, self.ignore_case, ids)
+
+    def _likely_matches(self, query: str, count: int) -> List[int]:
+        np = _load_numpy()
+        if self.ignore_case:
+            query = _lower(query)
+        masks, start_masks, pair_masks, lengths = self._vectorized(count)
+        qmask = np.uint64(char_mask(query))
+        ids = np.flatnonzero(((masks & qmask) == qmask) & (lengths >= len(query)))
+        if len(ids) <= MAX_SCORED:
+            return ids.tolist()
+
+        # like the bonuses of score: word starts count double
+        likely = 2 * _popcount(start_masks[ids] & qmask).astype(np.int64)
+        likely += _popcount(pair_masks[ids] & np.uint64(pair_mask(query)))
+        order = likely * (int(lengths.max()) + 1) - lengths[ids]
+        best = np.argpartition(order, len(ids) - MAX_SCORED)[len(ids) - MAX_SCORED :]
+        return np.sort(ids[best]).tolist()
+
+
+def highlight(
+    text: str, positions: Iterable[int], style: str = "class:b,u"
+) -> List[Tuple[str, str]]:
+    """Formatted text of ``text`` with the characters at ``positions`` styled."""
+
+    matched = set(positions)
+    fragments: List[Tuple[str, str]] = []
+    for i, c in enumerate(text):
+        s = style if i in matched else ""
+        if fragments and fragments[-1][0] == s:
+            fragments[-1] = (s, fragments[-1][1] + c)
+        else:
+            fragments.append((s, c))
+    return fragments
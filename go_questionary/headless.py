@@ -0,0 +1,320 @@
+import io
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from prompt_toolkit.document import Document
+from prompt_toolkit.validation import ValidationError
+
+from go_questionary.prompt import PlannedQuestion, PromptPlan, _LazyPlans, _planned_flow
+from go_questionary.prompts.common import Choice, Separator, build_validator
+
+
+class HeadlessQuestion(NamedTuple):
+    """A question answered without a terminal.
+
+    Passed to answer callbacks, see :func:`prompt_headless`."""
+
+    name: str
+    """Name of the question, the key of its answer"""
+
+    type: str
+    """Type of the question, e.g. ``"text"`` or ``"select"``"""
+
+    kwargs: Dict[str, Any]
+    """Arguments of the question, callable ``choices`` and ``default``
+    options are already evaluated"""
+
+    @property
+    def message(self) -> str:
+        return self.kwargs.get("message", "")
+
+
+class HeadlessAnswerError(ValueError):
+    """An answer was rejected, like it would be rejected in a terminal.
+
+    Args:
+        name: Name of the question.
+
+        message: Why the answer was rejected.
+    """
+
+    def __init__(self, name: str, message: Any) -> None:
+        super().__init__("Invalid answer for question {}: {}".format(name, message))
+        self.name = name
+        self.message = message
+
+
+# returned by answer sources that have no answer for a question, the
+# question's default is used, as if the user just hit enter
+NO_ANSWER = object()
+
+AnswerSource = Union[Mapping[str, Any], Callable[[HeadlessQuestion], Any]]
+
+TYPE_ALIASES = {"list": "select", "rawlist": "rawselect", "input": "text"}
+
+
+def _resolve_text(question: HeadlessQuestion, answer: Any) -> str:
+    if answer is NO_ANSWER:
+        answer = question.kwargs.get("default", "")
+    if not isinstance(answer, str):
+        raise HeadlessAnswerError(question.name, "expected a string")
+
+    validator = build_validator(question.kwargs.get("validate"))
+    if validator is not None:
+        try:
+            validator.validate(Document(answer))
+        except ValidationError as e:
+            raise HeadlessAnswerError(question.name, e.message)
+    return answer
+
+
+def _resolve_confirm(question: HeadlessQuestion, answer: Any) -> bool:
+    if answer is NO_ANSWER:
+        return question.kwargs.get("default", True)
+    if isinstance(answer, bool):
+        return answer
+    if isinstance(answer, str) and answer.lower() in ("y", "yes"):
+        return True
+    if isinstance(answer, str) and answer.lower() in ("n", "no"):
+        return False
+    raise HeadlessAnswerError(question.name, "expected yes or no")
+
+
+def _selectable(question: HeadlessQuestion) -> List[Choice]:
+    choices = [Choice.build(c) for c in question.kwargs["choices"]]
+    return [c for c in choices if not isinstance(c, Separator) and not c.disabled]
+
+
+def _title(choice: Choice) -> Any:
+    if isinstance(choice.title, list):
+        return "".join(token[1] for token in choice.title)
+    return choice.title
+
+
+def _find_choice(
+    question: HeadlessQuestion, choices: List[Choice], answer: Any
+) -> Any:
+    """Value of the choice with the answer as its value or, failing that,
+    as its title."""
+
+    for c in choices:
+        if c.value == answer:
+            return c.value
+    for c in choices:
+        if _title(c) == answer:
+            return c.value
+    raise HeadlessAnswerError(
+        question.name, "{!r} is not a selectable choice".format(answer)
+    )
+
+
+def _default_choice(default: Any) -> Any:
+    if isinstance(default, Choice):
+        return default.value
+    if isinstance(default, dict):
+        return Choice.build(default).value
+    return default
+
+
+def _resolve_select(question: HeadlessQuestion, answer: Any) -> Any:
+    choices = _selectable(question)
+    if answer is NO_ANSWER:
+        default = question.kwargs.get("default")
+        if default is not None:
+            answer = _default_choice(default)
+        elif choices:
+            return choices[0].value
+        else:
+            raise HeadlessAnswerError(question.name, "no selectable choices")
+    return _find_choice(question, choices, answer)
+
+
+def _resolve_checkbox(question: HeadlessQuestion, answer: Any) -> List[Any]:
+    choices = _selectable(question)
+    if answer is NO_ANSWER:
+        default = _default_choice(question.kwargs.get("default"))
+        values = [
+            c.value
+            for c in choices
+            if c.checked or (default is not None and c.value == default)
+        ]
+    elif isinstance(answer, (list, tuple)):
+        values = [_find_choice(question, choices, a) for a in answer]
+    else:
+        raise HeadlessAnswerError(question.name, "expected a list of choices")
+
+    validate = question.kwargs.get("validate")
+    if validate is not None:
+        verdict = validate(values)
+        if verdict is not True:
+            raise HeadlessAnswerError(
+                question.name, "invalid input" if verdict is False else verdict
+            )
+    return values
+
+
+RESOLVERS: Dict[str, Callable[[HeadlessQuestion, Any], Any]] = {
+    "autocomplete": _resolve_text,
+    "confirm": _resolve_confirm,
+    "text": _resolve_text,
+    "select": _resolve_select,
+    "rawselect": _resolve_select,
+    "password": _resolve_text,
+    "checkbox": _resolve_checkbox,
+    "path": _resolve_text,
+}
+
+
+def resolve_answer(question: HeadlessQuestion, answer: Any = NO_ANSWER) -> Any:
+    """Check an answer the way the interactive question would.
+
+    Args:
+        question: The question to answer.
+
+        answer: The given answer. :data:`NO_ANSWER` results in the
+                question's default, like hitting enter.
+
+    Returns:
+        The answer the interactive question would return. Choices can be
+        given by value or by title, the choice's value is returned.
+    """
+
+    return RESOLVERS[question.type](question, answer)
+
+
+def _create_headless_question(
+    planned: PlannedQuestion, kwargs: Dict[str, Any]
+) -> HeadlessQuestion:
+    return HeadlessQuestion(
+        planned.name, TYPE_ALIASES.get(planned.type, planned.type), kwargs
+    )
+
+
+def prompt_headless(
+    questions: Union[PromptPlan, Iterable[Mapping[str, Any]]],
+    answers_from: AnswerSource,
+    answers: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Answer all questions without a terminal.
+
+    Nothing is rendered and no prompt_toolkit application is created, but
+    ``when``, ``filter``, ``validate`` and callable ``choices`` and
+    ``default`` options are applied just like in :func:`prompt`.
+
+    Example:
+        >>> import go_questionary
+        >>> from go_questionary.headless import prompt_headless
+        >>> prompt_headless(
+        ...     [{"type": "confirm", "name": "ok", "message": "Continue?"}],
+        ...     {"ok": "n"},
+        ... )
+        {'ok': False}
+
+    Args:
+        questions: A list of question configs, see :func:`unsafe_prompt`, or
+                   a plan created by :func:`compile`.
+
+        answers_from: Answers by question name, or a function returning the
+                      answer of a :class:`HeadlessQuestion`. Missing answers
+                      (or :data:`NO_ANSWER`) use the question's default.
+
+        answers: Default answers.
+
+        kwargs: Additional options passed to every question, ignored if
+                ``questions`` is already compiled.
+
+    Returns:
+        Dictionary of question answers.
+
+    Raises:
+        HeadlessAnswerError: An answer did not pass validation or doesn't
+                             match a selectable choice.
+    """
+
+    if isinstance(questions, PromptPlan):
+        planned_questions: Sequence[PlannedQuestion] = questions.questions
+    else:
+        if isinstance(questions, dict):
+            questions = [questions]
+        # like prompt(), questions are checked once they are reached
+        planned_questions = _LazyPlans(questions, False, kwargs)
+
+    if callable(answers_from):
+        get_answer = answers_from
+    else:
+        source = answers_from
+
+        def get_answer(question: HeadlessQuestion) -> Any:
+            return source.get(question.name, NO_ANSWER)
+
+    answers = dict(answers or {})
+    flow = _planned_flow(planned_questions, answers, _create_headless_question)
+    try:
+        question = next(flow)
+        while True:
+            answer = resolve_answer(question, get_answer(question))
+            question = flow.send(answer)
+    except StopIteration:
+        pass
+    finally:
+        flow.close()
+
+    return answers
+
+
+def prompt_headless_stream(
+    questions: Union[PromptPlan, Iterable[Mapping[str, Any]]],
+    stream: Union[str, IO[str]],
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Answer the questions once for every set of answers in a stream.
+
+    The questions are compiled once and every line of ``stream`` is one
+    JSON object of answers (NDJSON). A stream holding a single JSON array
+    of answer objects works as well.
+
+    Args:
+        questions: A list of question configs, see :func:`unsafe_prompt`, or
+                   a plan created by :func:`compile`.
+
+        stream: JSON text or a file like object to read it from.
+
+        kwargs: Additional options passed to every question.
+
+    Returns:
+        The answers of each form, in the order of the stream.
+    """
+
+    if not isinstance(questions, PromptPlan):
+        if isinstance(questions, dict):
+            questions = [questions]
+        # split once, the questions are still resolved once they are asked
+        questions = PromptPlan(_LazyPlans(questions, False, kwargs))
+
+    if isinstance(stream, str):
+        stream = io.StringIO(stream)
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("["):
+            # a single JSON array, possibly spread across several lines
+            for answers_from in json.loads(line + stream.read()):
+                yield prompt_headless(questions, answers_from)
+            return
+        yield prompt_headless(questions, json.loads(line))
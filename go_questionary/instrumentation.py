@@ -0,0 +1,197 @@
+import atexit
+import json
+import signal
+import sys
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Union
+
+from prompt_toolkit import Application
+from prompt_toolkit.layout.controls import FormattedTextControl
+
+# the recorder attached to every new question, see :func:`install`
+RECORDER: Optional["LatencyRecorder"] = None
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest rank percentile of already sorted values."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, -(-len(sorted_values) * p // 100) - 1))
+    return sorted_values[int(rank)]
+
+
+class LatencyRecorder:
+    """Records where the time of a prompt goes.
+
+    Attached to an application, it samples:
+
+    * ``keystroke`` - seconds spent in the key binding handlers of a key press
+    * ``render`` - seconds spent drawing a frame, including the tokens
+    * ``tokens`` - seconds spent creating the formatted text of a control,
+      e.g. the choice list of a select prompt
+    * ``token_count`` - number of tokens created
+    * ``bytes_written`` - bytes written to the terminal per frame
+
+    Nothing is recorded (or slowed down) unless a recorder is attached.
+    """
+
+    samples: Dict[str, List[float]]
+
+    def __init__(self) -> None:
+        self.samples = {
+            "keystroke": [],
+            "render": [],
+            "tokens": [],
+            "token_count": [],
+            "bytes_written": [],
+        }
+        self._lock = threading.Lock()
+        self._bytes_written = 0
+        self._key_press_start = 0.0
+        self._render_start = 0.0
+        self._render_bytes = 0
+
+    def record(self, metric: str, value: float) -> None:
+        with self._lock:
+            self.samples.setdefault(metric, []).append(value)
+
+    def attach(self, app: "Application[Any]") -> "LatencyRecorder":
+        """Record the key presses, frames and terminal output of ``app``.
+
+        Returns:
+            The recorder itself.
+        """
+
+        app.key_processor.before_key_press += self._on_key_press
+        app.key_processor.after_key_press += self._on_key_press_done
+        app.before_render += self._on_render
+        app.after_render += self._on_render_done
+        self._wrap_output(app.output)
+        for control in app.layout.find_all_controls():
+            if isinstance(control, FormattedTextControl) and callable(control.text):
+                control.text = self._timed_tokens(control.text)
+        return self
+
+    def _on_key_press(self, _: Any) -> None:
+        self._key_press_start = time.perf_counter()
+
+    def _on_key_press_done(self, _: Any) -> None:
+        self.record("keystroke", time.perf_counter() - self._key_press_start)
+
+    def _on_render(self, _: Any) -> None:
+        self._render_bytes = self._bytes_written
+        self._render_start = time.perf_counter()
+
+    def _on_render_done(self, _: Any) -> None:
+        self.record("render", time.perf_counter() - self._render_start)
+        self.record("bytes_written", self._bytes_written - self._render_bytes)
+
+    def _timed_tokens(self, get_tokens: Callable[[], Any]) -> Callable[[], Any]:
+        if getattr(get_tokens, "_latency_recorder", None) is self:
+            return get_tokens
+
+        def timed_tokens() -> Any:
+            start = time.perf_counter()
+            tokens = get_tokens()
+            self.record("tokens", time.perf_counter() - start)
+            if isinstance(tokens, list):
+                self.record("token_count", len(tokens))
+            return tokens
+
+        timed_tokens._latency_recorder = self  # type: ignore
+        return timed_tokens
+
+    def _wrap_output(self, output: Any) -> None:
+        if getattr(output, "_latency_recorder", None) is self:
+            return
+        output._latency_recorder = self
+
+        def counting(write: Callable[[str], None]) -> Callable[[str], None]:
+            def counting_write(data: str) -> None:
+                self._bytes_written += len(data.encode("utf-8", "replace"))
+                write(data)
+
+            return counting_write
+
+        output.write = counting(output.write)
+        output.write_raw = counting(output.write_raw)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, maximum and percentiles of every metric."""
+
+        with self._lock:
+            samples = {k: sorted(v) for k, v in self.samples.items()}
+
+        result = {}
+        for metric, values in samples.items():
+            stats = {
+                "count": len(values),
+                "mean": sum(values) / len(values) if values else 0.0,
+                "max": values[-1] if values else 0.0,
+            }
+            for p in PERCENTILES:
+                stats["p{}".format(p)] = percentile(values, p)
+            result[metric] = stats
+        return result
+
+    def export(self, file: Union[str, IO[str], None] = None) -> None:
+        """Write the summary as JSON, to stderr by default.
+
+        Args:
+            file: Path or file object to write to.
+        """
+
+        if isinstance(file, str):
+            with open(file, "w") as f:
+                json.dump(self.summary(), f, indent=2)
+        else:
+            json.dump(self.summary(), file or sys.stderr, indent=2)
+            (file or sys.stderr).write("\n")
+
+
+def install(
+    file: Union[str, IO[str], None] = None,
+    signum: Optional[int] = None,
+    at_exit: bool = True,
+) -> LatencyRecorder:
+    """Record the latencies of all questions created from now on.
+
+    Example:
+        >>> from go_questionary import instrumentation
+        >>> recorder = instrumentation.install("latency.json")
+        >>> go_questionary.select("Pick one", ["a", "b", "c"]).ask()
+
+    Args:
+        file: Where the summary is exported to, see
+              :meth:`LatencyRecorder.export`.
+
+        signum: Also export the summary when this signal (e.g.
+                ``signal.SIGUSR1``) is received.
+
+        at_exit: Export the summary when the interpreter exits.
+
+    Returns:
+        The recorder attached to new questions.
+    """
+
+    global RECORDER
+
+    recorder = LatencyRecorder()
+    RECORDER = recorder
+
+    if at_exit:
+        atexit.register(recorder.export, file)
+    if signum is not None:
+        signal.signal(signum, lambda *_: recorder.export(file))
+    return recorder
+
+
+def uninstall() -> None:
+    """Stop attaching the recorder to new questions."""
+
+    global RECORDER
+    RECORDER = None
@@ -1,9 +1,24 @@
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
 from prompt_toolkit.output import ColorDepth
-from typing import Any, Dict, Optional, Iterable, Mapping
-
-from go_questionary import utils
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Iterable,
+    Mapping,
+    Sequence,
+    Tuple,
+)
+
+from go_questionary import session, utils
 from go_questionary.constants import DEFAULT_KBI_MESSAGE
 from go_questionary.prompts import AVAILABLE_PROMPTS, prompt_by_name
+from go_questionary.question import Question
 
 
 class PromptParameterException(ValueError):
@@ -18,6 +33,7 @@ def prompt(
     patch_stdout: bool = False,
     true_color: bool = False,
     kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    reuse_application: bool = False,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """Prompt the user for input on all the questions.
@@ -39,6 +55,16 @@ def prompt(
                    * filter - Function that the answer is passed to. The return value of this
                      function is saved as the answer.
 
+                   * depends_on - Names of the answers used by callable ``choices`` and
+                     ``default`` options. If set, these callables are evaluated in
+                     the background as soon as these answers are known, while
+                     earlier questions are still being answered. ``when`` is never
+                     called ahead of time, so the ``default`` of a question with
+                     ``when`` is only evaluated once the question is reached.
+                     An evaluation whose answers changed meanwhile is dropped,
+                     but can't be stopped if it already started: the prompt
+                     waits for it before returning.
+
                    Additional options correspond to the parameter names for
                    particular question types.
 
@@ -50,6 +76,10 @@ def prompt(
         kbi_msg: The message to be printed on a keyboard interrupt.
         true_color: Use true color output.
 
+        reuse_application: Ask all questions with a single prompt_toolkit
+                           application, swapping in the layout of each
+                           question instead of starting a new application.
+
         color_depth: Color depth to use. If ``true_color`` is set to true then this
                      value is ignored.
 
@@ -65,7 +95,14 @@ def prompt(
     """
 
     try:
-        return unsafe_prompt(questions, answers, patch_stdout, true_color, **kwargs)
+        return unsafe_prompt(
+            questions,
+            answers,
+            patch_stdout,
+            true_color,
+            reuse_application=reuse_application,
+            **kwargs,
+        )
     except KeyboardInterrupt:
         print("")
         print(kbi_msg)
@@ -78,6 +115,7 @@ def unsafe_prompt(
     answers: Optional[Mapping[str, Any]] = None,
     patch_stdout: bool = False,
     true_color: bool = False,
+    reuse_application: bool = False,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """Prompt the user for input on all the questions.
@@ -97,6 +135,16 @@ def unsafe_prompt(
                    * filter - Function that the answer is passed to. The return value of this
                      function is saved as the answer.
 
+                   * depends_on - Names of the answers used by callable ``choices`` and
+                     ``default`` options. If set, these callables are evaluated in
+                     the background as soon as these answers are known, while
+                     earlier questions are still being answered. ``when`` is never
+                     called ahead of time, so the ``default`` of a question with
+                     ``when`` is only evaluated once the question is reached.
+                     An evaluation whose answers changed meanwhile is dropped,
+                     but can't be stopped if it already started: the prompt
+                     waits for it before returning.
+
                    Additional options correspond to the parameter names for
                    particular question types.
 
@@ -107,6 +155,10 @@ def unsafe_prompt(
 
         true_color: Use true color output.
 
+        reuse_application: Ask all questions with a single prompt_toolkit
+                           application, swapping in the layout of each
+                           question instead of starting a new application.
+
         color_depth: Color depth to use. If ``true_color`` is set to true then this
                      value is ignored.
 
@@ -128,80 +180,627 @@ def unsafe_prompt(
         questions = [questions]
 
     answers = dict(answers or {})
+    flow = _question_flow(questions, answers, true_color, kwargs)
 
-    for question_config in questions:
-        question_config = dict(question_config)
-        # import the question
-        if "type" not in question_config:
-            raise PromptParameterException("type")
-        if "name" not in question_config:
-            raise PromptParameterException("name")
+    if reuse_application:
+        session.run_questions(flow, patch_stdout)
+    else:
+        session.ask_questions(flow, patch_stdout)
 
-        choices = question_config.get("choices")
-        if choices is not None and callable(choices):
-            question_config["choices"] = choices(answers)
+    return answers
 
-        _kwargs = kwargs.copy()
-        _kwargs.update(question_config)
 
-        _type = _kwargs.pop("type")
-        _filter = _kwargs.pop("filter", None)
-        name = _kwargs.pop("name")
-        when = _kwargs.pop("when", None)
+async def prompt_async(
+    questions: Iterable[Mapping[str, Any]],
+    answers: Optional[Mapping[str, Any]] = None,
+    patch_stdout: bool = False,
+    true_color: bool = False,
+    kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Prompt the user for input on all the questions using asyncio.
 
-        if true_color:
-            _kwargs["color_depth"] = ColorDepth.TRUE_COLOR
+    Catches keyboard interrupts and prints a message.
 
-        if when:
-            # at least a little sanity check!
-            if callable(question_config["when"]):
-                try:
-                    if not question_config["when"](answers):
+    See :func:`unsafe_prompt_async` for details.
+
+    Args:
+        questions: A list of question configs, see :func:`unsafe_prompt`.
+
+        answers: Default answers.
+
+        patch_stdout: Ensure that the prompt renders correctly if other threads
+                      are printing to stdout.
+
+        kbi_msg: The message to be printed on a keyboard interrupt.
+        true_color: Use true color output.
+
+        kwargs: Additional options passed to every question.
+
+    Returns:
+        Dictionary of question answers.
+    """
+
+    try:
+        return await unsafe_prompt_async(
+            questions, answers, patch_stdout, true_color, **kwargs
+        )
+    except KeyboardInterrupt:
+        print("")
+        print(kbi_msg)
+        print("")
+        return {}
+
+
+async def unsafe_prompt_async(
+    questions: Iterable[Mapping[str, Any]],
+    answers: Optional[Mapping[str, Any]] = None,
+    patch_stdout: bool = False,
+    true_color: bool = False,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Prompt the user for input on all the questions using asyncio.
+
+    Questions are asked with ``.unsafe_ask_async()``, so other tasks of the
+    event loop keep running while the user answers. ``when``, ``filter``,
+    ``choices`` and ``default`` options may be ``async`` functions, their
+    results are awaited.
+
+    Won't catch keyboard interrupts.
+
+    Args:
+        questions: A list of question configs, see :func:`unsafe_prompt`.
+
+        answers: Default answers.
+
+        patch_stdout: Ensure that the prompt renders correctly if other threads
+                      are printing to stdout.
+
+        true_color: Use true color output.
+
+        kwargs: Additional options passed to every question.
+
+    Returns:
+        Dictionary of question answers.
+
+    Raises:
+        KeyboardInterrupt: raised on keyboard interrupt
+    """
+
+    if isinstance(questions, dict):
+        questions = [questions]
+
+    answers = dict(answers or {})
+    await _ask_planned_async(
+        _LazyPlans(questions, true_color, kwargs), answers, patch_stdout
+    )
+    return answers
+
+
+class PlannedQuestion(NamedTuple):
+    """A validated question config, see :func:`compile`."""
+
+    name: str
+    type: str
+    # None until resolved, see _resolve_question
+    create_question: Optional[Callable[..., Question]]
+    kwargs: Dict[str, Any]
+    when: Optional[Callable[[Dict[str, Any]], bool]]
+    filter: Optional[Callable[[Any], Any]]
+    choices: Optional[Callable[[Dict[str, Any]], Any]]
+    default: Optional[Callable[[Dict[str, Any]], Any]]
+    depends_on: Optional[Tuple[str, ...]]
+
+
+def _plan_question(
+    question_config: Mapping[str, Any], true_color: bool, kwargs: Dict[str, Any]
+) -> PlannedQuestion:
+    """Split a question config into its options.
+
+    Only checks what is needed to evaluate its ``when`` check, the question
+    type is resolved by :func:`_resolve_question` once that passed."""
+
+    question_config = dict(question_config)
+    # import the question
+    if "type" not in question_config:
+        raise PromptParameterException("type")
+    if "name" not in question_config:
+        raise PromptParameterException("name")
+
+    _kwargs = kwargs.copy()
+    _kwargs.update(question_config)
+
+    _type = _kwargs.pop("type")
+    _filter = _kwargs.pop("filter", None)
+    name = _kwargs.pop("name")
+    when = _kwargs.pop("when", None)
+    depends_on = _kwargs.pop("depends_on", None)
+
+    if true_color:
+        _kwargs["color_depth"] = ColorDepth.TRUE_COLOR
+
+    if isinstance(depends_on, str):
+        depends_on = [depends_on]
+
+    # at least a little sanity check!
+    if when and not callable(when):
+        raise ValueError("'when' needs to be function that accepts a dict argument")
+
+    choices = _kwargs.get("choices")
+    default = _kwargs.get("default")
+
+    return PlannedQuestion(
+        name,
+        _type,
+        None,
+        _kwargs,
+        when or None,
+        _filter or None,
+        choices if callable(choices) else None,
+        default if callable(default) else None,
+        tuple(depends_on) if depends_on is not None else None,
+    )
+
+
+def _resolve_question(planned: PlannedQuestion) -> PlannedQuestion:
+    """Check the filter and arguments of a planned question and resolve
+    its question type."""
+
+    if planned.create_question is not None:
+        return planned
+
+    # at least a little sanity check!
+    if planned.filter and not callable(planned.filter):
+        raise ValueError("'filter' needs to be function that accepts an argument")
+
+    create_question_func = prompt_by_name(planned.type)
+
+    if not create_question_func:
+        raise ValueError(
+            "No question type '{}' found. "
+            "Known question types are {}."
+            "".format(planned.type, ", ".join(AVAILABLE_PROMPTS))
+        )
+
+    missing_args = list(utils.missing_arguments(create_question_func, planned.kwargs))
+    if missing_args:
+        raise PromptParameterException(missing_args[0])
+
+    return planned._replace(create_question=create_question_func)
+
+
+class _LazyPlans(Sequence[PlannedQuestion]):
+    """Question configs, split into their options when they are accessed for
+    the first time. :func:`_planned_flow` resolves them once they are asked."""
+
+    def __init__(
+        self,
+        questions: Iterable[Mapping[str, Any]],
+        true_color: bool,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self._configs = list(questions)
+        self._plans: Dict[int, PlannedQuestion] = {}
+        self._true_color = true_color
+        self._kwargs = kwargs
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def __getitem__(self, i):  # type: ignore
+        if i not in self._plans:
+            self._plans[i] = _plan_question(
+                self._configs[i], self._true_color, self._kwargs
+            )
+        return self._plans[i]
+
+
+# marks answers a speculation depends on, which are not given yet
+_MISSING = object()
+
+
+class _Lookahead:
+    """Evaluates callable choices and defaults of upcoming questions in the
+    background, while the user is still answering the current question.
+
+    Only questions declaring the answers their callables use (``depends_on``)
+    are evaluated ahead of time, once all of these answers are given. User
+    ``when`` checks are never called ahead of time, they may have side
+    effects or be costly: of a question with ``when`` only the ``choices``
+    are evaluated, the flow evaluates them before the check anyway. Results
+    are keyed by the values of these answers; speculations whose answers
+    changed are cancelled.
+
+    Cancelling is best effort: a callable that already started can't be
+    stopped and runs to completion, its result is dropped. :meth:`close`
+    waits for these, so no speculation runs after the prompt returned.
+    """
+
+    def __init__(self, plans: Sequence[PlannedQuestion]) -> None:
+        self._plans = plans
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (question index, option) -> (answers key, future)
+        self._speculations: Dict[Tuple[int, str], Tuple[Tuple[Any, ...], Future]] = {}
+
+    @staticmethod
+    def _key(planned: PlannedQuestion, answers: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple(answers.get(d, _MISSING) for d in planned.depends_on or ())
+
+    def speculate(self, start: int, answers: Dict[str, Any]) -> None:
+        """Start evaluating the questions from index ``start`` on."""
+
+        for i in range(start, len(self._plans)):
+            try:
+                planned = self._plans[i]
+            except Exception:
+                # raised again once the question is reached
+                continue
+
+            if planned.depends_on is None or (
+                planned.choices is None and planned.default is None
+            ):
+                continue
+
+            key = self._key(planned, answers)
+            if _MISSING in key:
+                continue
+
+            # the default is only evaluated if the question's when check
+            # passes, which can't be known without calling it
+            options = ("choices",) if planned.when is not None else ("choices", "default")
+            for option in options:
+                func = getattr(planned, option)
+                if func is None or inspect.iscoroutinefunction(func):
+                    # coroutines are awaited by the runner of the flow
+                    continue
+
+                running = self._speculations.get((i, option))
+                if running is not None:
+                    if running[0] == key:
                         continue
-                except Exception as e:
-                    raise ValueError(
-                        "Problem in 'when' check of {} " "question: {}".format(name, e)
+                    running[1].cancel()
+
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        thread_name_prefix="go_questionary-lookahead"
                     )
-            else:
-                raise ValueError(
-                    "'when' needs to be function that accepts a dict argument"
-                )
-        if _filter:
-            # at least a little sanity check!
-            if not callable(_filter):
-                raise ValueError(
-                    "'filter' needs to be function that accepts an argument"
-                )
+                future = self._executor.submit(func, dict(answers))
+                self._speculations[(i, option)] = (key, future)
 
-        if callable(question_config.get("default")):
-            _kwargs["default"] = question_config["default"](answers)
+    def evaluate(self, i: int, option: str, answers: Dict[str, Any]) -> Any:
+        """Result of the ``option`` callable of question ``i``, reusing a
+        speculation if its answers still match."""
 
-        create_question_func = prompt_by_name(_type)
+        planned = self._plans[i]
+        func = getattr(planned, option)
 
-        if not create_question_func:
-            raise ValueError(
-                "No question type '{}' found. "
-                "Known question types are {}."
-                "".format(_type, ", ".join(AVAILABLE_PROMPTS))
-            )
+        speculation = self._speculations.pop((i, option), None)
+        if speculation is not None:
+            key, future = speculation
+            if key == self._key(planned, answers) and not future.cancelled():
+                return future.result()
+            future.cancel()
+
+        return func(answers)
+
+    def close(self) -> None:
+        """Cancel the speculations that didn't start yet and wait for the
+        running ones."""
+
+        for _, future in self._speculations.values():
+            future.cancel()
+        self._speculations.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class _Awaiting(NamedTuple):
+    """Yielded by :func:`_planned_flow` for a result of a callable that
+    has to be awaited, the result is sent back."""
+
+    awaitable: Any
+
+
+def _result(value: Any, awaitable_results: bool) -> Generator[Any, Any, Any]:
+    """The result of a callable of a question, awaited by the runner of the
+    flow if it is awaitable and ``awaitable_results`` is set.
+
+    Used with ``yield from`` in :func:`_planned_flow`."""
+
+    if awaitable_results and inspect.isawaitable(value):
+        value = yield _Awaiting(value)
+    return value
+
+
+def _planned_flow(
+    planned_questions: Sequence[PlannedQuestion],
+    answers: Dict[str, Any],
+    create_question: Optional[Callable[[PlannedQuestion, Dict[str, Any]], Any]] = None,
+    awaitable_results: bool = False,
+) -> session.QuestionFlow:
+    """Create the questions of a prompt, one at a time.
+
+    Yields each question and expects its answer to be sent back. Answers are
+    stored in ``answers``.
 
-        missing_args = list(utils.missing_arguments(create_question_func, _kwargs))
-        if missing_args:
-            raise PromptParameterException(missing_args[0])
+    ``create_question`` receives the planned question and its resolved
+    arguments and replaces creating the prompt_toolkit question.
 
-        question = create_question_func(**_kwargs)
+    With ``awaitable_results``, awaitable results of ``choices``, ``when``,
+    ``default`` and ``filter`` are yielded as :class:`_Awaiting`, the runner
+    sends back their result or throws their exception into the flow, see
+    :func:`_ask_planned_async`."""
 
-        answer = question.unsafe_ask(patch_stdout)
+    lookahead = _Lookahead(planned_questions)
+    try:
+        for i in range(len(planned_questions)):
+            planned = planned_questions[i]
+            _kwargs = planned.kwargs
+
+            if planned.choices is not None or planned.default is not None:
+                _kwargs = _kwargs.copy()
+                if planned.choices is not None:
+                    _kwargs["choices"] = yield from _result(
+                        lookahead.evaluate(i, "choices", answers), awaitable_results
+                    )
 
-        if answer is not None:
-            if _filter:
+            if planned.when is not None:
                 try:
-                    answer = _filter(answer)
+                    if not (
+                        yield from _result(planned.when(answers), awaitable_results)
+                    ):
+                        continue
                 except Exception as e:
                     raise ValueError(
-                        "Problem processing 'filter' of {} "
-                        "question: {}".format(name, e)
+                        "Problem in 'when' check of {} "
+                        "question: {}".format(planned.name, e)
                     )
-            answers[name] = answer
 
-    return answers
+            # the filter, type and arguments are only checked once the
+            # question is asked, questions skipped by 'when' may lack them
+            planned = _resolve_question(planned)
+
+            if planned.default is not None:
+                _kwargs["default"] = yield from _result(
+                    lookahead.evaluate(i, "default", answers), awaitable_results
+                )
+
+            if create_question is None:
+                question = planned.create_question(**_kwargs)
+            else:
+                question = create_question(planned, _kwargs)
+
+            # prepare the next questions while the user answers this one
+            lookahead.speculate(i + 1, answers)
+
+            answer = yield question
+
+            if answer is not None:
+                if planned.filter is not None:
+                    try:
+                        answer = yield from _result(
+                            planned.filter(answer), awaitable_results
+                        )
+                    except Exception as e:
+                        raise ValueError(
+                            "Problem processing 'filter' of {} "
+                            "question: {}".format(planned.name, e)
+                        )
+                answers[planned.name] = answer
+    finally:
+        lookahead.close()
+
+
+async def _ask_planned_async(
+    planned_questions: Sequence[PlannedQuestion],
+    answers: Dict[str, Any],
+    patch_stdout: bool,
+) -> None:
+    """Ask the questions of a prompt using asyncio, running
+    :func:`_planned_flow` and awaiting the results of async callables.
+
+    Answers are stored in ``answers``."""
+
+    flow = _planned_flow(planned_questions, answers, awaitable_results=True)
+    try:
+        step = next(flow)
+        while True:
+            try:
+                if isinstance(step, _Awaiting):
+                    value = await step.awaitable
+                else:
+                    value = await step.unsafe_ask_async(patch_stdout)
+            except Exception as e:
+                step = flow.throw(e)
+            else:
+                step = flow.send(value)
+    except StopIteration:
+        return
+    finally:
+        flow.close()
+
+
+def _question_flow(
+    questions: Iterable[Mapping[str, Any]],
+    answers: Dict[str, Any],
+    true_color: bool,
+    kwargs: Dict[str, Any],
+) -> session.QuestionFlow:
+    """Like :func:`_planned_flow`, validating each question config when it
+    is reached."""
+
+    return _planned_flow(_LazyPlans(questions, true_color, kwargs), answers)
+
+
+class PromptPlan:
+    """A list of questions, validated once and ready to be asked many times.
+
+    This class should not be invoked directly, instead use :func:`compile`.
+    """
+
+    questions: List[PlannedQuestion]
+
+    def __init__(self, questions: Iterable[PlannedQuestion]) -> None:
+        self.questions = list(questions)
+
+    def unsafe_ask(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+        reuse_application: bool = False,
+    ) -> Dict[str, Any]:
+        """Ask the questions and return the answers.
+
+        Does not catch keyboard interrupts.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+            reuse_application: Ask all questions with a single prompt_toolkit
+                               application.
+
+        Returns:
+            Dictionary of question answers.
+        """
+
+        answers = dict(answers or {})
+        flow = _planned_flow(self.questions, answers)
+
+        if reuse_application:
+            session.run_questions(flow, patch_stdout)
+        else:
+            session.ask_questions(flow, patch_stdout)
+
+        return answers
+
+    def ask(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+        reuse_application: bool = False,
+    ) -> Dict[str, Any]:
+        """Ask the questions and return the answers.
+
+        Catches keyboard interrupts and prints a message.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+            kbi_msg: The message to be printed on a keyboard interrupt.
+
+            reuse_application: Ask all questions with a single prompt_toolkit
+                               application.
+
+        Returns:
+            Dictionary of question answers.
+        """
+
+        try:
+            return self.unsafe_ask(answers, patch_stdout, reuse_application)
+        except KeyboardInterrupt:
+            print("")
+            print(kbi_msg)
+            print("")
+            return {}
+
+    async def unsafe_ask_async(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+    ) -> Dict[str, Any]:
+        """Ask the questions using asyncio and return the answers.
+
+        Does not catch keyboard interrupts.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+        Returns:
+            Dictionary of question answers.
+        """
+
+        answers = dict(answers or {})
+        await _ask_planned_async(self.questions, answers, patch_stdout)
+        return answers
+
+    async def ask_async(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    ) -> Dict[str, Any]:
+        """Ask the questions using asyncio and return the answers.
+
+        Catches keyboard interrupts and prints a message.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+            kbi_msg: The message to be printed on a keyboard interrupt.
+
+        Returns:
+            Dictionary of question answers.
+        """
+
+        try:
+            return await self.unsafe_ask_async(answers, patch_stdout)
+        except KeyboardInterrupt:
+            print("")
+            print(kbi_msg)
+            print("")
+            return {}
+
+
+def compile(
+    questions: Iterable[Mapping[str, Any]], true_color: bool = False, **kwargs: Any
+) -> PromptPlan:
+    """Validate question configs once, to ask them many times.
+
+    Question types are resolved and the configs are checked for missing
+    arguments when compiling, asking the returned plan only evaluates
+    callable ``when``, ``choices``, ``default`` and ``filter`` options.
+    Unlike :func:`prompt`, this also checks questions that ``when`` would
+    skip.
+
+    Example:
+        >>> import go_questionary
+        >>> plan = go_questionary.compile([
+        ...     {"type": "text", "name": "first_name", "message": "First name?"}
+        ... ])
+        >>> plan.ask()
+        ? First name? Tom
+        {'first_name': 'Tom'}
+
+    Args:
+        questions: A list of question configs, see :func:`unsafe_prompt`.
+
+        true_color: Use true color output.
+
+        kwargs: Additional options passed to every question.
+
+    Returns:
+        :class:`PromptPlan`: The validated questions, ready to be asked
+        (using ``.ask()``).
+    """
+
+    if isinstance(questions, dict):
+        questions = [questions]
+
+    return PromptPlan(
+        _resolve_question(_plan_question(q, true_color, kwargs)) for q in questions
+    )
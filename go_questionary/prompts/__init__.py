@@ -1,26 +1,65 @@
-from go_questionary.prompts import autocomplete
-from go_questionary.prompts import confirm
-from go_questionary.prompts import text
-from go_questionary.prompts import select
-from go_questionary.prompts import rawselect
-from go_questionary.prompts import password
-from go_questionary.prompts import checkbox
-from go_questionary.prompts import path
-
-AVAILABLE_PROMPTS = {
-    "autocomplete": autocomplete.autocomplete,
-    "confirm": confirm.confirm,
-    "text": text.text,
-    "select": select.select,
-    "rawselect": rawselect.rawselect,
-    "password": password.password,
-    "checkbox": checkbox.checkbox,
-    "path": path.path,
-    # backwards compatible names
-    "list": select.select,
-    "rawlist": rawselect.rawselect,
-    "input": text.text,
+import importlib
+from typing import Any, Callable, Dict
+
+_PROMPT_MODULES = (
+    "autocomplete",
+    "confirm",
+    "text",
+    "select",
+    "rawselect",
+    "password",
+    "checkbox",
+    "path",
+)
+
+
+class _LazyPrompt:
+    """A prompt function whose module is imported when it is first called
+    or its signature is inspected."""
+
+    def __init__(self, module: str, function: str) -> None:
+        self._module = module
+        self._function = function
+
+    @property
+    def function(self) -> Callable[..., Any]:
+        module = importlib.import_module(__name__ + "." + self._module)
+        return getattr(module, self._function)
+
+    @property
+    def __signature__(self) -> Any:
+        import inspect
+
+        return inspect.signature(self.function)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.function(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return "<prompt {}.{}.{}>".format(__name__, self._module, self._function)
+
+
+# Prompt functions by question type. Custom question types can be added.
+AVAILABLE_PROMPTS: Dict[str, Callable[..., Any]] = {
+    "autocomplete": _LazyPrompt("autocomplete", "autocomplete"),
+    "confirm": _LazyPrompt("confirm", "confirm"),
+    "text": _LazyPrompt("text", "text"),
+    "select": _LazyPrompt("select", "select"),
+    "rawselect": _LazyPrompt("rawselect", "rawselect"),
+    "password": _LazyPrompt("password", "password"),
+    "checkbox": _LazyPrompt("checkbox", "checkbox"),
+    "path": _LazyPrompt("path", "path"),
 }
+# backwards compatible names
+AVAILABLE_PROMPTS["list"] = AVAILABLE_PROMPTS["select"]
+AVAILABLE_PROMPTS["rawlist"] = AVAILABLE_PROMPTS["rawselect"]
+AVAILABLE_PROMPTS["input"] = AVAILABLE_PROMPTS["text"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROMPT_MODULES:
+        return importlib.import_module(__name__ + "." + name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 def prompt_by_name(name):
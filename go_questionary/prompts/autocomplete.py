@@ -1,31 +1,261 @@
+import asyncio
+import bisect
+import heapq
+import threading
+import time
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Union,
     Iterable,
 )
 
+from prompt_toolkit.application.current import get_app_or_none
 from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.eventloop import run_in_executor_with_context
 from prompt_toolkit.document import Document
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.shortcuts.prompt import PromptSession, CompleteStyle
 from prompt_toolkit.styles import Style, merge_styles
 from prompt_toolkit.lexers import SimpleLexer
 
+from go_questionary import fuzzy as fuzzy_matching
 from go_questionary.constants import DEFAULT_QUESTION_PREFIX, DEFAULT_STYLE
 from go_questionary.prompts.common import build_validator
 from go_questionary.question import Question
 
 
+# Length of the substrings used to index choices for ``match_middle`` lookups.
+NGRAM_SIZE = 3
+
+
+class ChoiceIndex:
+    """Precomputed lookup structures for a fixed list of choices.
+
+    The index is built once per choice set and answers prefix and substring
+    queries without touching every choice on each keystroke. Matches are
+    always reported in the order of the original choices, so results are
+    identical to a linear scan.
+
+    Args:
+        choices: The choices to index.
+
+        ignore_case: If true, choices are indexed in lower case and queries
+                     are expected to be lower case as well.
+    """
+
+    choices: List[str]
+    keys: List[str]
+
+    def __init__(self, choices: Sequence[str], ignore_case: bool = True) -> None:
+        self.choices = list(choices)
+        self.keys = [c.lower() for c in self.choices] if ignore_case else self.choices
+
+        # sorted keys (with their original position) to answer prefix queries
+        # with two binary searches
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[i] for i in order]
+        self._sorted_ids = order
+
+        # n-gram posting lists to narrow down substring queries
+        self._ngrams: Dict[str, List[int]] = {}
+        for i, key in enumerate(self.keys):
+            for gram in {
+                key[j : j + NGRAM_SIZE] for j in range(len(key) - NGRAM_SIZE + 1)
+            }:
+                self._ngrams.setdefault(gram, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def _prefix_candidates(self, word: str, limit: Optional[int]) -> List[int]:
+        lo = bisect.bisect_left(self._sorted_keys, word)
+        hi = bisect.bisect_left(self._sorted_keys, word + "\U0010ffff", lo)
+        ids = self._sorted_ids[lo:hi]
+
+        if limit is not None and limit < len(ids):
+            return heapq.nsmallest(limit, ids)
+        return sorted(ids)
+
+    def _middle_candidates(self, word: str) -> Iterable[int]:
+        if len(word) < NGRAM_SIZE:
+            # too short to be narrowed down by the n-gram index
+            return range(len(self.keys))
+
+        grams = {word[j : j + NGRAM_SIZE] for j in range(len(word) - NGRAM_SIZE + 1)}
+        postings = sorted((self._ngrams.get(gram, []) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+
+        candidates: Set[int] = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return sorted(candidates)
+
+    def matches(
+        self, word: str, match_middle: bool = True, limit: Optional[int] = None
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield ``(choice position, match index)`` for all matching choices.
+
+        Args:
+            word: The query, already lower cased if the index ignores case.
+
+            match_middle: If true, ``word`` may appear anywhere in a choice,
+                          otherwise only at its beginning.
+
+            limit: Stop after this many matches. ``None`` yields all matches.
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        if not match_middle:
+            for i in self._prefix_candidates(word, limit):
+                yield i, 0
+            return
+
+        found = 0
+        keys = self.keys
+        for i in self._middle_candidates(word):
+            index = keys[i].find(word)
+            if index == -1:
+                continue
+
+            yield i, index
+            found += 1
+            if found == limit:
+                return
+
+
+class CachedChoiceSource:
+    """Cache the result of a callable choice source for ``ttl`` seconds.
+
+    The first call blocks until the source returned. Once the cached value
+    is older than ``ttl``, it is still returned immediately while a
+    background thread fetches a fresh value (stale-while-revalidate). At
+    most one refresh runs at a time.
+
+    Args:
+        source: Callable returning the list of choices.
+
+        ttl: Number of seconds a fetched value is considered fresh.
+    """
+
+    source: Callable[[], List[str]]
+    ttl: float
+
+    def __init__(self, source: Callable[[], List[str]], ttl: float) -> None:
+        self.source = source
+        self.ttl = ttl
+        self._value: Optional[List[str]] = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    def _fetch(self) -> List[str]:
+        with self._fetch_lock:
+            value = list(self.source())
+            with self._lock:
+                self._value = value
+                self._fetched_at = time.monotonic()
+                self._refreshing = False
+            return value
+
+    def _refresh(self) -> None:
+        try:
+            self._fetch()
+        except Exception:
+            # keep serving the stale value, retry on the next access
+            with self._lock:
+                self._refreshing = False
+
+    def __call__(self) -> List[str]:
+        with self._lock:
+            value = self._value
+            expired = time.monotonic() - self._fetched_at >= self.ttl
+            start_refresh = value is not None and expired and not self._refreshing
+            if start_refresh:
+                self._refreshing = True
+
+        if value is None:
+            with self._fetch_lock:
+                # another thread might have fetched it while we waited
+                if self._value is not None:
+                    return self._value
+            return self._fetch()
+
+        if start_refresh:
+            threading.Thread(target=self._refresh, daemon=True).start()
+        return value
+
+
+class DebouncedCompleter(Completer):
+    """Run a completer in a background thread once typing paused.
+
+    Completions are only computed after no new input arrived for ``delay``
+    seconds. Requests that were superseded by newer input, either while
+    waiting or while the completions were computed, are dropped.
+
+    Args:
+        completer: The completer to wrap.
+
+        delay: Number of seconds to wait for more input before completing.
+    """
+
+    completer: Completer
+    delay: float
+
+    def __init__(self, completer: Completer, delay: float = 0.0) -> None:
+        self.completer = completer
+        self.delay = delay
+
+    @staticmethod
+    def _is_stale(document: Document) -> bool:
+        app = get_app_or_none()
+        if app is None:
+            return False
+        return app.current_buffer.text != document.text
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        return self.completer.get_completions(document, complete_event)
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+            if self._is_stale(document):
+                return
+
+        completions = await run_in_executor_with_context(
+            lambda: list(self.completer.get_completions(document, complete_event))
+        )
+        if self._is_stale(document):
+            return
+
+        for completion in completions:
+            yield completion
+
+
 class WordCompleter(Completer):
     choices_source: Union[List[str], Callable[[], List[str]]]
     ignore_case: bool
     meta_information: Dict[str, Any]
     match_middle: bool
+    max_results: Optional[int]
+    fuzzy: bool
 
     def __init__(
         self,
@@ -33,11 +263,24 @@ class WordCompleter(Completer):
         ignore_case: bool = True,
         meta_information: Optional[Dict[str, Any]] = None,
         match_middle: bool = True,
+        max_results: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        fuzzy: bool = False,
     ) -> None:
+        if callable(choices) and cache_ttl is not None:
+            choices = CachedChoiceSource(choices, cache_ttl)
+
         self.choices_source = choices
         self.ignore_case = ignore_case
         self.meta_information = meta_information or {}
         self.match_middle = match_middle
+        self.max_results = max_results
+        self.fuzzy = fuzzy
+        self._index: Optional[ChoiceIndex] = None
+        self._fuzzy_index: Optional[fuzzy_matching.FuzzyIndex] = None
+        # the choices lists the indexes were built from, and their lengths
+        self._index_source: Optional[Tuple[List[str], int]] = None
+        self._fuzzy_index_source: Optional[Tuple[List[str], int]] = None
 
     def _choices(self) -> Iterable[str]:
         return (
@@ -46,6 +289,68 @@ class WordCompleter(Completer):
             else self.choices_source
         )
 
+    @staticmethod
+    def _changed(
+        choices: Iterable[str],
+        source: Optional[Tuple[List[str], int]],
+        indexed: List[str],
+    ) -> bool:
+        """Whether ``choices`` differ from the ``indexed`` ones.
+
+        The list an index was built from is taken to be unchanged as long as
+        its length is, so a fixed list costs nothing per keystroke. Only
+        other lists, like a new one returned by a callable, are compared.
+        Replacing an item of the indexed list in place isn't noticed, see
+        the ``choices`` argument of :func:`autocomplete`."""
+
+        if source is None:
+            return True
+        if choices is source[0]:
+            return len(choices) != source[1]  # type: ignore[arg-type]
+        return list(choices) != indexed
+
+    def _get_index(self) -> ChoiceIndex:
+        """Return the index for the current choices, rebuilding it if they changed."""
+
+        choices = self._choices()
+        index = self._index
+        if index is None or self._changed(choices, self._index_source, index.choices):
+            if not isinstance(choices, list):
+                choices = list(choices)
+            index = self._index = ChoiceIndex(choices, self.ignore_case)
+            self._index_source = (choices, len(choices))
+        return index
+
+    def _get_fuzzy_index(self) -> fuzzy_matching.FuzzyIndex:
+        choices = self._choices()
+        index = self._fuzzy_index
+        if index is None or self._changed(
+            choices, self._fuzzy_index_source, index.candidates
+        ):
+            if not isinstance(choices, list):
+                choices = list(choices)
+            index = self._fuzzy_index = fuzzy_matching.FuzzyIndex(
+                choices, self.ignore_case
+            )
+            self._fuzzy_index_source = (choices, len(choices))
+        return index
+
+    def _get_fuzzy_completions(self, document: Document) -> Iterable[Completion]:
+        index = self._get_fuzzy_index()
+        query = document.text_before_cursor
+
+        for _, position, matched in index.rank(query, self.max_results):
+            choice = index.candidates[position]
+
+            yield Completion(
+                choice,
+                start_position=-len(document.text_before_cursor),
+                display=fuzzy_matching.highlight(choice, matched),
+                display_meta=self.meta_information.get(choice, ""),
+                style="class:answer",
+                selected_style="class:selected",
+            )
+
     def _choice_matches(self, word_before_cursor: str, choice: str) -> int:
         """Match index if found, -1 if not. """
 
@@ -67,9 +372,58 @@ class WordCompleter(Completer):
             choice[index + len(word_before_cursor) : len(choice)],
         )
 
+    @staticmethod
+    def _fragments_for_choice(
+        choice: str, index: int, word_before_cursor: str
+    ) -> List[Tuple[str, str]]:
+        """Same output as :meth:`_display_for_choice`, without parsing HTML."""
+
+        end = index + len(word_before_cursor)
+        fragments = [
+            ("", choice[:index]),
+            ("class:b,u", choice[index:end]),
+            ("", choice[end:]),
+        ]
+        return [f for f in fragments if f[1]]
+
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> Iterable[Completion]:
+        if self.fuzzy:
+            yield from self._get_fuzzy_completions(document)
+            return
+
+        index = self._get_index()
+
+        # Get word/text before cursor.
+        word_before_cursor = document.text_before_cursor
+
+        if self.ignore_case:
+            word_before_cursor = word_before_cursor.lower()
+
+        matches = index.matches(word_before_cursor, self.match_middle, self.max_results)
+        for position, match_index in matches:
+            choice = index.choices[position]
+            display_meta = self.meta_information.get(choice, "")
+            display = self._fragments_for_choice(choice, match_index, word_before_cursor)
+
+            yield Completion(
+                choice,
+                start_position=-len(choice),
+                display=display,
+                display_meta=display_meta,
+                style="class:answer",
+                selected_style="class:selected",
+            )
+
+    def get_completions_linear(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        """Reference implementation of :meth:`get_completions`.
+
+        Scans every choice on each call. Kept to verify the results of the
+        indexed lookup and to compare the speed of both."""
+
         choices = self._choices()
 
         # Get word/text before cursor.
@@ -99,16 +453,21 @@ class WordCompleter(Completer):
 
 def autocomplete(
     message: str,
-    choices: List[str],
+    choices: Union[List[str], Callable[[], List[str]]],
     default: str = "",
     qmark: str = DEFAULT_QUESTION_PREFIX,
     completer: Optional[Completer] = None,
     meta_information: Optional[Dict[str, Any]] = None,
     ignore_case: bool = True,
     match_middle: bool = True,
+    max_results: Optional[int] = None,
+    cache_ttl: Optional[float] = None,
+    debounce: float = 0.0,
+    fuzzy: bool = False,
     complete_style: CompleteStyle = CompleteStyle.COLUMN,
     validate: Any = None,
     style: Optional[Style] = None,
+    validate_debounce: Optional[float] = None,
     **kwargs: Any,
 ) -> Question:
     """Prompt the user to enter a message with autocomplete help.
@@ -137,7 +496,12 @@ def autocomplete(
     Args:
         message: Question text
 
-        choices: Items shown in the selection, this contains items as strings
+        choices: Items shown in the selection, this contains items as strings.
+                 Can also be a callable returning the items, it is evaluated in
+                 a background thread to keep the prompt responsive. The
+                 items are indexed once: to change them while the prompt is
+                 running, add items to the list or return a new list from
+                 the callable, don't replace items of the list in place.
 
         default: Default return value (single value).
 
@@ -155,6 +519,22 @@ def autocomplete(
         match_middle: If true autocomplete would search in every string position
                       not only in string begin.
 
+        max_results: Maximum number of completions shown at once. ``None``
+                     shows every matching choice.
+
+        cache_ttl: If ``choices`` is a callable, reuse its result for this many
+                   seconds. Expired results are still shown while they are
+                   refreshed in the background. ``None`` calls it on every
+                   keystroke.
+
+        debounce: Number of seconds to wait after the last keystroke before
+                  computing completions. Completions are computed in a
+                  background thread if this is set.
+
+        fuzzy: If true, a choice matches if it contains the typed characters
+               in order, not necessarily next to each other. Completions are
+               sorted by how well they match. ``match_middle`` is ignored.
+
         complete_style: How autocomplete menu would be shown, it could be ``COLUMN``
                         ``MULTI_COLUMN`` or ``READLINE_LIKE`` from
                         :class:`prompt_toolkit.shortcuts.CompleteStyle`.
@@ -167,6 +547,12 @@ def autocomplete(
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
 
+        validate_debounce: Validate in a background thread once typing paused
+                           for this many seconds, e.g. for validators doing
+                           I/O. The last error stays visible while the new
+                           input is checked. ``None`` validates on every
+                           keystroke, blocking the input.
+
         style: A custom color and style for the question parts. You can
                configure colors as well as font types for different elements.
 
@@ -186,7 +572,7 @@ def autocomplete(
 
         return meta
 
-    validator = build_validator(validate)
+    validator = build_validator(validate, validate_debounce)
 
     if completer is None:
         if not choices:
@@ -197,8 +583,14 @@ def autocomplete(
             ignore_case=ignore_case,
             meta_information=get_meta_style(meta_information),
             match_middle=match_middle,
+            max_results=max_results,
+            cache_ttl=cache_ttl,
+            fuzzy=fuzzy,
         )
 
+    if debounce > 0 or callable(choices):
+        completer = DebouncedCompleter(completer, debounce)
+
     p = PromptSession(
         get_prompt_tokens,
         lexer=SimpleLexer("class:answer"),
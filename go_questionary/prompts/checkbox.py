@@ -195,6 +195,10 @@ def checkbox(
 
     @bindings.add(" ", eager=True)
     def toggle(_event):
+        if not ic.is_selection_valid():
+            # no choice can be selected
+            return
+
         pointed_choice = ic.get_pointed_at().value
         if pointed_choice in ic.selected_options:
             ic.selected_options.remove(pointed_choice)
@@ -235,17 +239,15 @@ def checkbox(
 
     def move_cursor_down(event):
         ic.select_next()
-        while not ic.is_selection_valid():
-            ic.select_next()
 
     def move_cursor_up(event):
         ic.select_previous()
-        while not ic.is_selection_valid():
-            ic.select_previous()
 
     if use_arrow_keys:
         bindings.add(Keys.Down, eager=True)(move_cursor_down)
         bindings.add(Keys.Up, eager=True)(move_cursor_up)
+        bindings.add(Keys.PageDown, eager=True)(lambda event: ic.select_page_down())
+        bindings.add(Keys.PageUp, eager=True)(lambda event: ic.select_page_up())
 
     if use_jk_keys:
         bindings.add("j", eager=True)(move_cursor_down)
@@ -1,6 +1,13 @@
+import asyncio
+import bisect
+import collections
 import inspect
-from prompt_toolkit import PromptSession
-from prompt_toolkit.filters import IsDone, Always, Condition
+import time
+from prompt_toolkit.application import Application
+from prompt_toolkit.application.current import get_app_or_none
+from prompt_toolkit.document import Document
+from prompt_toolkit.eventloop import run_in_executor_with_context
+from prompt_toolkit.filters import IsDone, Condition
 from prompt_toolkit.layout import (
     FormattedTextControl,
     Layout,
@@ -8,10 +15,12 @@ from prompt_toolkit.layout import (
     ConditionalContainer,
     Window,
 )
+from prompt_toolkit.layout.dimension import Dimension
 from prompt_toolkit.styles import Style, merge_styles
 from prompt_toolkit.validation import Validator, ValidationError
 from typing import Optional, Any, List, Dict, Union, Callable, Sequence, Tuple
 
+from go_questionary import utils
 from go_questionary.constants import (
     DEFAULT_STYLE,
     DEFAULT_SELECTED_POINTER,
@@ -147,6 +156,114 @@ class Separator(Choice):
         super().__init__(self.line, None, "-")
 
 
+class NavigationIndex:
+    """Next and previous selectable position of every entry in a list.
+
+    Moving the pointer past separators and disabled choices is a single
+    lookup. Changing whether an entry is selectable only updates the
+    entries between its selectable neighbours.
+
+    Args:
+        selectable: For every entry, whether it can be selected.
+    """
+
+    selectable: List[bool]
+
+    next: List[int]
+    """Position of the next selectable entry (wrapping around), ``-1`` if
+    there is none"""
+
+    previous: List[int]
+    """Position of the previous selectable entry (wrapping around), ``-1``
+    if there is none"""
+
+    positions: List[int]
+    """Positions of the selectable entries, in order"""
+
+    def __init__(self, selectable: Sequence[bool] = ()) -> None:
+        self.selectable = list(selectable)
+        self.positions = [i for i, s in enumerate(self.selectable) if s]
+        self.next = [-1] * len(self.selectable)
+        self.previous = [-1] * len(self.selectable)
+        if self.positions:
+            self._rebuild(self.positions[-1], self.positions[-1])
+
+    def __len__(self) -> int:
+        return len(self.selectable)
+
+    def _rebuild(self, start: int, stop: int) -> None:
+        """Recompute the entries from selectable position ``start`` to
+        selectable position ``stop``, wrapping around. Nothing in between
+        is selectable. If both are equal, the whole list is recomputed."""
+
+        n = len(self.selectable)
+        gap = (stop - start) % n or n
+
+        following = stop
+        for k in range(gap - 1, -1, -1):
+            i = (start + k) % n
+            self.next[i] = following
+            if self.selectable[i]:
+                following = i
+
+        preceding = start
+        for k in range(1, gap + 1):
+            i = (start + k) % n
+            self.previous[i] = preceding
+            if self.selectable[i]:
+                preceding = i
+
+    def set_selectable(self, i: int, selectable: bool) -> None:
+        """Change whether the entry at position ``i`` can be selected."""
+
+        if self.selectable[i] == selectable:
+            return
+
+        self.selectable[i] = selectable
+        k = bisect.bisect_left(self.positions, i)
+        if selectable:
+            self.positions.insert(k, i)
+        else:
+            del self.positions[k]
+
+        if not self.positions:
+            self.next = [-1] * len(self.selectable)
+            self.previous = [-1] * len(self.selectable)
+            return
+
+        # the neighbours of i that stay selectable delimit what changes
+        k = bisect.bisect_left(self.positions, i)
+        before = self.positions[k - 1]
+        after = self.positions[(k + 1 if selectable else k) % len(self.positions)]
+        self._rebuild(before, after)
+
+    def append(self, selectable: bool) -> None:
+        """Add an entry at the end of the list."""
+
+        self.selectable.append(False)
+        self.next.append(self.positions[0] if self.positions else -1)
+        self.previous.append(self.positions[-1] if self.positions else -1)
+        self.set_selectable(len(self.selectable) - 1, selectable)
+
+    def number(self, i: int) -> int:
+        """Number of the selectable entry at position ``i``, counting from 1."""
+
+        return bisect.bisect_left(self.positions, i) + 1
+
+    def step(self, i: int, count: int) -> int:
+        """Position ``count`` selectable entries after (or, if negative,
+        before) position ``i``, stopping at the first and last one."""
+
+        if not self.positions:
+            return i
+        k = bisect.bisect_left(self.positions, i)
+        if count > 0 and (k == len(self.positions) or self.positions[k] != i):
+            # i itself is not selectable, the entry after it is one step
+            count -= 1
+        k = max(0, min(len(self.positions) - 1, k + count))
+        return self.positions[k]
+
+
 class InquirerControl(FormattedTextControl):
     SHORTCUT_KEYS = [
         "1",
@@ -187,15 +304,20 @@ class InquirerControl(FormattedTextControl):
         "z",
     ]
 
+    # number of selectable choices a page up / page down moves
+    PAGE_SIZE = 10
+
     choices: List[Choice]
     default: Optional[Union[str, Choice, Dict[str, Any]]]
     selected_options: List[Any]
     use_indicator: bool
     use_shortcuts: bool
+    use_numbers: bool
     use_arrow_keys: bool
     pointer: Optional[str]
     pointed_at: int
     is_answered: bool
+    navigation: "NavigationIndex"
 
     def __init__(
         self,
@@ -207,11 +329,13 @@ class InquirerControl(FormattedTextControl):
         show_selected: bool = False,
         use_arrow_keys: bool = True,
         initial_choice: Optional[Union[str, Choice, Dict[str, Any]]] = None,
+        use_numbers: bool = False,
         **kwargs: Any,
     ):
 
         self.use_indicator = use_indicator
         self.use_shortcuts = use_shortcuts
+        self.use_numbers = use_numbers
         self.show_selected = show_selected
         self.use_arrow_keys = use_arrow_keys
         self.default = default
@@ -247,7 +371,7 @@ class InquirerControl(FormattedTextControl):
 
         super().__init__(self._get_choice_tokens, **kwargs)
 
-        if not self.is_selection_valid():
+        if self.navigation.positions and not self.is_selection_valid():
             raise ValueError(
                 f"Invalid 'initial_choice' value ('{initial_choice}'). "
                 f"It must be a selectable value."
@@ -311,6 +435,30 @@ class InquirerControl(FormattedTextControl):
 
             self.choices.append(choice)
 
+        if pointed_at is None:
+            # nothing can be selected
+            self.pointed_at = 0
+
+        self.navigation = NavigationIndex(
+            [self._is_selectable(c) for c in self.choices]
+        )
+
+    @staticmethod
+    def _is_selectable(choice: Choice) -> bool:
+        return not isinstance(choice, Separator) and not choice.disabled
+
+    def update_choice(self, index: int, choice: Choice) -> None:
+        """Replace the choice at ``index``, e.g. to enable or disable it."""
+
+        self.choices[index] = choice
+        self.navigation.set_selectable(index, self._is_selectable(choice))
+
+    def append_choice(self, choice: Choice) -> None:
+        """Add a choice at the end of the list."""
+
+        self.choices.append(choice)
+        self.navigation.append(self._is_selectable(choice))
+
     @property
     def choice_count(self) -> int:
         return len(self.choices)
@@ -360,7 +508,7 @@ class InquirerControl(FormattedTextControl):
                     )
                 )
             else:
-                shortcut = choice.get_shortcut_title() if self.use_shortcuts else ""
+                shortcut = self._shortcut_title(index, choice)
 
                 if selected:
                     if self.use_indicator:
@@ -399,7 +547,7 @@ class InquirerControl(FormattedTextControl):
         if self.show_selected:
             current = self.get_pointed_at()
 
-            answer = current.get_shortcut_title() if self.use_shortcuts else ""
+            answer = self._shortcut_title(self.pointed_at, current)
 
             answer += (
                 current.title if isinstance(current.title, str) else current.title[0][1]
@@ -410,6 +558,13 @@ class InquirerControl(FormattedTextControl):
             tokens.pop()  # Remove last newline.
         return tokens
 
+    def _shortcut_title(self, index: int, choice: Choice) -> str:
+        if self.use_shortcuts:
+            return choice.get_shortcut_title()
+        if self.use_numbers and self._is_selectable(choice):
+            return "{}) ".format(self.navigation.number(index))
+        return ""
+
     def is_selection_a_separator(self) -> bool:
         selected = self.choices[self.pointed_at]
         return isinstance(selected, Separator)
@@ -421,10 +576,36 @@ class InquirerControl(FormattedTextControl):
         return not self.is_selection_disabled() and not self.is_selection_a_separator()
 
     def select_previous(self) -> None:
-        self.pointed_at = (self.pointed_at - 1) % self.choice_count
+        """Move to the previous selectable choice, wrapping around."""
+
+        previous = self.navigation.previous[self.pointed_at]
+        if previous != -1:
+            self.pointed_at = previous
 
     def select_next(self) -> None:
-        self.pointed_at = (self.pointed_at + 1) % self.choice_count
+        """Move to the next selectable choice, wrapping around."""
+
+        following = self.navigation.next[self.pointed_at]
+        if following != -1:
+            self.pointed_at = following
+
+    def select_page_up(self) -> None:
+        self.pointed_at = self.navigation.step(self.pointed_at, -self.PAGE_SIZE)
+
+    def select_page_down(self) -> None:
+        self.pointed_at = self.navigation.step(self.pointed_at, self.PAGE_SIZE)
+
+    def select_number(self, number: int) -> bool:
+        """Move to the selectable choice with this number, counting from 1.
+
+        Returns:
+            ``False`` if there is no such choice.
+        """
+
+        if not 0 < number <= len(self.navigation.positions):
+            return False
+        self.pointed_at = self.navigation.positions[number - 1]
+        return True
 
     def get_pointed_at(self) -> Choice:
         return self.choices[self.pointed_at]
@@ -438,7 +619,140 @@ class InquirerControl(FormattedTextControl):
         ]
 
 
-def build_validator(validate: Any) -> Optional[Validator]:
+class DebouncedValidator(Validator):
+    """Validate in the background once typing paused.
+
+    While typing, the input is only validated after no new input arrived
+    for ``delay`` seconds. Validators doing blocking work run in a thread,
+    validators implementing ``validate_async`` are awaited. Checks of input
+    that changed in the meantime are dropped. Until the check of the current
+    input completed, the error of the last completed check stays visible.
+
+    While typing, verdicts are remembered by input text for ``ttl`` seconds,
+    so editing back to a recent input shows its verdict without calling the
+    validator again. Submitting always validates the input right away, a
+    validator checking the file system or a server decides on the current
+    state.
+
+    Args:
+        validator: The validator to wrap.
+
+        delay: Number of seconds to wait for more input before validating.
+
+        cache_size: Number of verdicts remembered.
+
+        ttl: Number of seconds a verdict is reused while typing.
+    """
+
+    validator: Validator
+    delay: float
+    cache_size: int
+    ttl: float
+
+    def __init__(
+        self,
+        validator: Validator,
+        delay: float = 0.0,
+        cache_size: int = 256,
+        ttl: float = 1.0,
+    ) -> None:
+        self.validator = validator
+        self.delay = delay
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self._verdicts: Dict[str, Tuple[float, Optional[ValidationError]]] = (
+            collections.OrderedDict()
+        )
+        self._last_error: Optional[ValidationError] = None
+
+    @staticmethod
+    def _is_stale(document: Document) -> bool:
+        app = get_app_or_none()
+        if app is None:
+            return False
+        return app.current_buffer.text != document.text
+
+    def _remember(self, text: str, error: Optional[ValidationError]) -> None:
+        self._verdicts.pop(text, None)
+        self._verdicts[text] = (time.monotonic(), error)
+        if len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)  # type: ignore
+
+    def _is_known(self, text: str) -> bool:
+        verdict = self._verdicts.get(text)
+        return verdict is not None and time.monotonic() - verdict[0] < self.ttl
+
+    def _raise_verdict(self, text: str) -> None:
+        _, error = self._verdicts[text]
+        self._last_error = error
+        if error is not None:
+            raise error
+
+    def validate(self, document: Document) -> None:
+        # called on submit, never answer from the cache
+        try:
+            self.validator.validate(document)
+        except ValidationError as e:
+            self._remember(document.text, e)
+        else:
+            self._remember(document.text, None)
+        self._raise_verdict(document.text)
+
+    def _show_last_error(self) -> None:
+        app = get_app_or_none()
+        if app is not None and app.current_buffer.validation_error is None:
+            app.current_buffer.validation_error = self._last_error
+            app.invalidate()
+
+    async def validate_async(self, document: Document) -> None:
+        if not self._is_known(document.text):
+            self._show_last_error()
+            if self.delay > 0:
+                await asyncio.sleep(self.delay)
+                if self._is_stale(document):
+                    # the buffer validates the new input instead
+                    return
+
+            try:
+                if type(self.validator).validate_async is Validator.validate_async:
+                    await run_in_executor_with_context(
+                        lambda: self.validator.validate(document)
+                    )
+                else:
+                    await self.validator.validate_async(document)
+            except ValidationError as e:
+                self._remember(document.text, e)
+            else:
+                self._remember(document.text, None)
+
+            if self._is_stale(document):
+                return
+
+        self._raise_verdict(document.text)
+
+
+def build_validator(
+    validate: Any, debounce: Optional[float] = None
+) -> Optional[Validator]:
+    """Create a prompt_toolkit validator from a ``validate`` argument.
+
+    Args:
+        validate: A function accepting the input and returning ``True``,
+                  ``False`` or an error message, a validator class or a
+                  validator instance.
+
+        debounce: Validate in the background once typing paused for this
+                  many seconds, see :class:`DebouncedValidator`. ``None``
+                  validates synchronously on every keystroke.
+    """
+
+    validator = _build_validator(validate)
+    if validator is not None and debounce is not None:
+        return DebouncedValidator(validator, debounce)
+    return validator
+
+
+def _build_validator(validate: Any) -> Optional[Validator]:
     if validate:
         if inspect.isclass(validate) and issubclass(validate, Validator):
             return validate()
@@ -460,48 +774,58 @@ def build_validator(validate: Any) -> Optional[Validator]:
     return None
 
 
-def _fix_unecessary_blank_lines(ps: PromptSession) -> None:
-    """This is a fix for additional empty lines added by prompt toolkit.
-
-    This assumes the layout of the default session doesn't change, if it
-    does, this needs an update."""
-
-    default_container = ps.layout.container
-
-    default_buffer_window = (
-        default_container.get_children()[0].content.get_children()[1].content
-    )
-
-    assert isinstance(default_buffer_window, Window)
-    # this forces the main window to stay as small as possible, avoiding
-    # empty lines in selections
-    default_buffer_window.dont_extend_height = Always()
-    default_buffer_window.always_hide_cursor = Always()
-
-
 def create_inquirer_layout(
     ic: InquirerControl,
     get_prompt_tokens: Callable[[], List[Tuple[str, str]]],
     **kwargs: Any,
 ) -> Layout:
-    """Create a layout combining question and inquirer selection."""
+    """Create a layout combining question and inquirer selection.
+
+    The layout consists of the question line, the choices and a toolbar
+    showing validation errors, both hidden once the question is answered.
+
+    ``kwargs`` are the options the prompt passes on to its
+    :class:`~prompt_toolkit.application.Application`. Other options, like
+    the ``PromptSession`` options that used to shape this layout, raise a
+    :class:`TypeError` instead of being ignored."""
+
+    unsupported = set(kwargs) - set(utils.used_kwargs(kwargs, Application.__init__))
+    if unsupported:
+        raise TypeError(
+            "Unsupported options for a selection prompt: {}".format(
+                ", ".join(sorted(unsupported))
+            )
+        )
 
-    ps = PromptSession(get_prompt_tokens, reserve_space_for_menu=0, **kwargs)
-    _fix_unecessary_blank_lines(ps)
+    question_window = Window(
+        FormattedTextControl(get_prompt_tokens),
+        dont_extend_height=True,
+        wrap_lines=True,
+        always_hide_cursor=True,
+    )
 
-    validation_prompt = PromptSession(bottom_toolbar=lambda: ic.error_message, **kwargs)
+    error_toolbar = Window(
+        FormattedTextControl(
+            lambda: ic.error_message, style="class:bottom-toolbar.text"
+        ),
+        style="class:bottom-toolbar",
+        dont_extend_height=True,
+        height=Dimension(min=1),
+    )
 
     return Layout(
         HSplit(
             [
-                ps.layout.container,
+                question_window,
                 ConditionalContainer(Window(ic), filter=~IsDone()),
                 ConditionalContainer(
-                    validation_prompt.layout.container,
-                    filter=Condition(lambda: ic.error_message is not None),
+                    error_toolbar,
+                    filter=Condition(lambda: ic.error_message is not None)
+                    & ~IsDone(),
                 ),
             ]
-        )
+        ),
+        focused_element=question_window,
     )
 
 
@@ -1,14 +1,32 @@
+import asyncio
+import collections
+import hashlib
+import json
 import os
+import re
+import stat
+import threading
+import time
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
+    Dict,
     Iterable,
     List,
+    NamedTuple,
     Optional,
+    Pattern,
+    Sequence,
     Tuple,
 )
 
-from prompt_toolkit.completion import CompleteEvent, Completion, PathCompleter
+from prompt_toolkit.completion import (
+    CompleteEvent,
+    Completer,
+    Completion,
+    PathCompleter,
+)
 from prompt_toolkit.document import Document
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.key_binding.bindings.completion import (
@@ -20,41 +38,621 @@ from prompt_toolkit.lexers import SimpleLexer
 from prompt_toolkit.shortcuts.prompt import CompleteStyle, PromptSession
 from prompt_toolkit.styles import Style, merge_styles
 
+from go_questionary import fuzzy
 from go_questionary.constants import DEFAULT_QUESTION_PREFIX, DEFAULT_STYLE
+from go_questionary.prompts.autocomplete import DebouncedCompleter
 from go_questionary.prompts.common import build_validator
 from go_questionary.question import Question
 
 
+# Number of directory entries a background scan collects before they are
+# published to the completer (and passed through ``file_filter``).
+SCAN_BATCH_SIZE = 2048
+
+# Seconds between checks for new entries of a running directory scan.
+SCAN_POLL_INTERVAL = 0.05
+
+# Number of directory listings a cache keeps, the least recently used are
+# dropped first.
+LISTING_CACHE_SIZE = 128
+
+
+class DirectoryScan:
+    """Entries of a single directory, collected by a background thread.
+
+    Entries are published in batches of :data:`SCAN_BATCH_SIZE`, so partial
+    results of huge directories are available while the scan is running.
+
+    Args:
+        directory: The directory to scan.
+
+        mtime: Modification time of the directory when the scan started.
+    """
+
+    directory: str
+    mtime: int
+    entries: List[Tuple[str, bool]]
+    done: bool
+
+    def __init__(self, directory: str, mtime: int) -> None:
+        self.directory = directory
+        self.mtime = mtime
+        self.entries = []
+        self.done = False
+        self._finished = threading.Event()
+
+    def start(self) -> "DirectoryScan":
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def _run(self) -> None:
+        batch: List[Tuple[str, bool]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    try:
+                        # uses the file type returned by the directory
+                        # listing, no additional stat call on most systems
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    batch.append((entry.name, is_dir))
+
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        self.entries.extend(batch)
+                        batch = []
+        except OSError:
+            pass
+        finally:
+            self.entries.extend(batch)
+            self.done = True
+            self._finished.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the scan finished. Returns ``True`` if it did."""
+        return self._finished.wait(timeout)
+
+
+class DirectoryListingCache:
+    """Cache of directory listings, invalidated by the directory's mtime.
+
+    Args:
+        max_entries: Number of listings kept, the least recently used
+                     ones are dropped first.
+    """
+
+    max_entries: int
+
+    def __init__(self, max_entries: int = LISTING_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._scans: "collections.OrderedDict[str, DirectoryScan]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scans)
+
+    def get(self, directory: str) -> Optional[DirectoryScan]:
+        """Return the (possibly still running) scan of ``directory``.
+
+        Returns ``None`` if ``directory`` isn't a readable directory."""
+
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+
+        key = os.path.abspath(directory)
+        with self._lock:
+            scan = self._scans.get(key)
+            if scan is None or scan.mtime != st.st_mtime_ns:
+                scan = self._scans[key] = DirectoryScan(
+                    directory, st.st_mtime_ns
+                ).start()
+            self._scans.move_to_end(key)
+            while len(self._scans) > self.max_entries:
+                # a running scan that is dropped still finishes, whoever
+                # holds it sees all entries
+                self._scans.popitem(last=False)
+            return scan
+
+
+# Directory listings shared by all path prompts of this process
+LISTING_CACHE = DirectoryListingCache()
+
+
 class GreatUXPathCompleter(PathCompleter):
+    """Path completer that lists directories once and in the background.
+
+    Makes sure completions for directories end with a path separator. Also
+    make sure the right path separator is used.
+
+    Directory listings are cached until the directory is modified and are
+    read in a background thread, so large or slow (e.g. network) directories
+    don't block typing. While a directory is scanned, completions found so far
+    are shown.
+
+    Args:
+        listing_cache: Cache to store directory listings in. Allows sharing
+                       listings between completers.
+
+        kwargs: Arguments of :class:`prompt_toolkit.completion.PathCompleter`.
+    """
+
+    listing_cache: DirectoryListingCache
+
+    def __init__(
+        self, listing_cache: Optional[DirectoryListingCache] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.listing_cache = listing_cache or DirectoryListingCache()
+
+    def _scans_for(self, document: Document) -> Tuple[str, List[DirectoryScan]]:
+        """Prefix of the current file name and the scans of all directories
+        it should be looked up in."""
+
+        text = document.text_before_cursor
+
+        # Complete only when we have at least the minimal input length,
+        # otherwise, we can too many results and autocompletion will become too
+        # heavy.
+        if len(text) < self.min_input_len:
+            return "", []
+
+        # Do tilde expansion.
+        if self.expanduser:
+            text = os.path.expanduser(text)
+
+        # Directories where to look.
+        dirname = os.path.dirname(text)
+        if dirname:
+            directories = [
+                os.path.dirname(os.path.join(p, text)) for p in self.get_paths()
+            ]
+        else:
+            directories = self.get_paths()
+
+        scans = [self.listing_cache.get(d) for d in directories]
+        return os.path.basename(text), [s for s in scans if s is not None]
+
+    def _completions_for(
+        self, prefix: str, directory: str, entries: Iterable[Tuple[str, bool]]
+    ) -> List[Completion]:
+        matching = [
+            (name, is_dir)
+            for name, is_dir in entries
+            if name.startswith(prefix) and (is_dir or not self.only_directories)
+        ]
+        # filter a whole batch at once, after the cheap checks
+        return [
+            Completion(
+                text=name[len(prefix) :] + (os.path.sep if is_dir else ""),
+                start_position=0,
+                display=name + os.path.sep if is_dir else name,
+            )
+            for name, is_dir in sorted(matching)
+            if self.file_filter(os.path.join(directory, name))
+        ]
+
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> Iterable[Completion]:
-        """Get completions.
+        """Get completions, blocks until all directories are listed."""
 
-        Wraps :class:`prompt_toolkit.completion.PathCompleter`. Makes sure completions
-        for directories end with a path separator. Also make sure the right path
-        separator is used."""
-        completions = super(GreatUXPathCompleter, self).get_completions(
-            document, complete_event
-        )
+        prefix, scans = self._scans_for(document)
 
-        for completion in completions:
-            # check if the display value ends with a path separator.
-            # first check if display is properly set
-            styled_display = completion.display[0]
-            # styled display is a formatted text (a tuple of the text and its style)
-            # second tuple entry is the text
-            if styled_display[1][-1] == "/":
-                # replace separator with the OS specific one
-                display_text = styled_display[1][:-1] + os.path.sep
-                # update the styled display with the modified text
-                completion.display[0] = (styled_display[0], display_text)
-                # append the separator to the text as well - unclear why the normal
-                # path completer omits it from the text. this improves UX for the
-                # user, as they don't need to type the separator after auto-completing
-                # a directory
-                completion.text += os.path.sep
-            yield completion
+        completions = []
+        for scan in scans:
+            scan.wait()
+            completions.extend(self._completions_for(prefix, scan.directory, scan.entries))
+
+        if len(scans) > 1:
+            completions.sort(key=lambda c: prefix + c.text.rstrip(os.path.sep))
+        yield from completions
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        """Get completions, yields them while directories are being listed."""
+
+        prefix, scans = self._scans_for(document)
+
+        if all(scan.done for scan in scans):
+            for completion in self.get_completions(document, complete_event):
+                yield completion
+            return
+
+        for scan in scans:
+            seen = 0
+            while True:
+                done = scan.done
+                entries = scan.entries[seen:]
+                seen += len(entries)
+
+                for completion in self._completions_for(
+                    prefix, scan.directory, entries
+                ):
+                    yield completion
+
+                if done:
+                    break
+                await asyncio.sleep(SCAN_POLL_INTERVAL)
+
+
+# Number of results shown by the recursive (fuzzy file finder) mode.
+FINDER_MAX_RESULTS = 50
+
+# Directory where snapshots of walked directory trees are stored, one
+# ``tree-<sha1 of the root>.json`` file per root.
+FINDER_SNAPSHOT_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "go_questionary",
+)
+# Snapshots not written for this many seconds are removed.
+FINDER_SNAPSHOT_MAX_AGE = 30 * 24 * 3600
+# Maximum number of snapshots kept, the least recently written are removed.
+FINDER_SNAPSHOT_LIMIT = 32
+
+
+class _IgnoreRule(NamedTuple):
+    regex: Pattern[str]
+    negate: bool
+    dir_only: bool
+    anchored: bool
+    base: str
+
+
+def _glob_to_regex(pattern: str) -> Pattern[str]:
+    """Translate a ``.gitignore`` glob into a regular expression."""
+
+    i, n = 0, len(pattern)
+    result = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            start = i + 1
+            negate = start < n and pattern[start] in "!^"
+            if negate:
+                start += 1
+            # a ] right after the opening bracket is part of the set
+            end = pattern.find("]", start + 1 if start < n and pattern[start] == "]" else start)
+            if end == -1:
+                result.append(re.escape(c))
+            else:
+                chars = pattern[start:end].replace("\\", "\\\\").replace("[", "\\[")
+                chars = chars.replace("]", "\\]")
+                # like ``*`` and ``?``, a set never matches a ``/``
+                result.append("[^/" + chars + "]" if negate else "[" + chars + "]")
+                i = end
+        else:
+            result.append(re.escape(c))
+        i += 1
+    return re.compile("".join(result))
+
+
+def _parse_gitignore(file_path: str, base: str) -> List[_IgnoreRule]:
+    """Read the rules of a ``.gitignore`` file located in directory ``base``."""
+
+    rules = []
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return rules
+
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if line:
+            rules.append(
+                _IgnoreRule(_glob_to_regex(line), negate, dir_only, anchored, base)
+            )
+    return rules
+
+
+def _is_ignored(rules: Sequence[_IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    name = rel_path.rsplit("/", 1)[-1]
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.anchored:
+            target = rel_path[len(rule.base) + 1 :] if rule.base else rel_path
+        else:
+            target = name
+        if rule.regex.fullmatch(target):
+            ignored = not rule.negate
+    return ignored
+
+
+class FileFinder:
+    """Index of all files below a root directory, built in the background.
+
+    The tree is walked with :func:`os.scandir` in a background thread,
+    skipping everything ignored by ``.gitignore`` files. Found paths
+    (relative to ``root`` and using ``/`` as separator) are added to a
+    :class:`go_questionary.fuzzy.FuzzyIndex` while the walk is running.
+
+    Once the walk finished, the listings of all directories are stored in a
+    snapshot, ``tree-<sha1 of the root>.json`` in ``snapshot_dir``. The next
+    walk of the same root only lists directories whose modification time
+    changed since. Saving a snapshot removes the ones not written for
+    ``FINDER_SNAPSHOT_MAX_AGE`` seconds and the least recently written ones
+    beyond ``FINDER_SNAPSHOT_LIMIT``.
+
+    Args:
+        root: Directory to search in.
+
+        max_depth: Number of directory levels below ``root`` to descend into.
+                   ``None`` walks the whole tree.
+
+        only_directories: Index directories instead of files.
+
+        file_filter: Optional callable to filter indexed paths, it receives
+                     the path of a file relative to the current directory.
+
+        snapshot_dir: Directory to store snapshots in. ``None`` disables
+                      snapshots.
+    """
+
+    root: str
+    max_depth: Optional[int]
+    index: fuzzy.FuzzyIndex
+    done: bool
+
+    def __init__(
+        self,
+        root: str = ".",
+        max_depth: Optional[int] = None,
+        only_directories: bool = False,
+        file_filter: Optional[Callable[[str], bool]] = None,
+        snapshot_dir: Optional[str] = FINDER_SNAPSHOT_DIR,
+    ) -> None:
+        self.root = os.path.expanduser(root)
+        self.max_depth = max_depth
+        self.only_directories = only_directories
+        self.file_filter = file_filter or (lambda _: True)
+        self.snapshot_dir = snapshot_dir
+        self.index = fuzzy.FuzzyIndex()
+        self.done = False
+        self._finished = threading.Event()
+
+    def start(self) -> "FileFinder":
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the walk finished. Returns ``True`` if it did."""
+        return self._finished.wait(timeout)
+
+    def _snapshot_file(self) -> Optional[str]:
+        if self.snapshot_dir is None:
+            return None
+        key = hashlib.sha1(os.path.abspath(self.root).encode("utf-8")).hexdigest()
+        return os.path.join(self.snapshot_dir, "tree-{}.json".format(key))
+
+    def _load_snapshot(self) -> Dict[str, Any]:
+        snapshot_file = self._snapshot_file()
+        if snapshot_file is None:
+            return {}
+        try:
+            with open(snapshot_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_snapshot(self, listings: Dict[str, Any]) -> None:
+        snapshot_file = self._snapshot_file()
+        if snapshot_file is None:
+            return
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            tmp_file = "{}.{}.tmp".format(snapshot_file, os.getpid())
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(listings, f, separators=(",", ":"))
+            os.replace(tmp_file, snapshot_file)
+        except OSError:
+            return
+        self._prune_snapshots()
+
+    def _prune_snapshots(self) -> None:
+        """Remove old snapshots, the ones beyond the limit and temporary
+        files left by failed writes."""
+
+        assert self.snapshot_dir is not None
+        try:
+            names = os.listdir(self.snapshot_dir)
+        except OSError:
+            return
+
+        now = time.time()
+        remove, snapshots = [], []
+        for name in names:
+            if not name.startswith("tree-"):
+                continue
+            path = os.path.join(self.snapshot_dir, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if name.endswith(".tmp"):
+                if mtime < now - 3600:  # not being written anymore
+                    remove.append(path)
+            elif mtime < now - FINDER_SNAPSHOT_MAX_AGE:
+                remove.append(path)
+            else:
+                snapshots.append((mtime, path))
+
+        snapshots.sort(reverse=True)
+        remove.extend(path for _, path in snapshots[FINDER_SNAPSHOT_LIMIT:])
+        for path in remove:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _list_directory(
+        self, directory: str, snapshot: Dict[str, Any], rel_dir: str
+    ) -> Tuple[int, int, List[str], List[str]]:
+        """Modification times of the directory and its ``.gitignore``, and
+        its files and subdirectories. Reuses the snapshot if still valid."""
+
+        mtime = self._mtime(directory)
+        gitignore_mtime = self._mtime(os.path.join(directory, ".gitignore"))
+
+        cached = snapshot.get(rel_dir)
+        if cached and cached[0] == mtime and cached[1] == gitignore_mtime:
+            return cached[0], cached[1], cached[2], cached[3]
+
+        files, directories = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    (directories if is_dir else files).append(entry.name)
+        except OSError:
+            pass
+        return mtime, gitignore_mtime, files, directories
+
+    def _accepts(self, rel_path: str) -> bool:
+        try:
+            return bool(self.file_filter(os.path.join(self.root, rel_path)))
+        except Exception:
+            return False
+
+    def _add(self, found: List[str]) -> None:
+        """Add the paths of one directory to the index. If that fails, they
+        are added one at a time, so a name the index can't take (or that
+        ``file_filter`` fails on) only loses itself, not the whole walk."""
+
+        found = [f for f in found if self._accepts(f)]
+        try:
+            self.index.extend(found)
+        except Exception:
+            for f in found:
+                try:
+                    self.index.extend([f])
+                except Exception:
+                    pass
+
+    def _run(self) -> None:
+        snapshot = self._load_snapshot()
+        listings: Dict[str, Any] = {}
+
+        try:
+            # directories to visit: relative path, depth and active ignore rules
+            pending: List[Tuple[str, int, List[_IgnoreRule]]] = [("", 0, [])]
+            while pending:
+                rel_dir, depth, rules = pending.pop()
+                directory = os.path.join(self.root, rel_dir) if rel_dir else self.root
+
+                listing = self._list_directory(directory, snapshot, rel_dir)
+                listings[rel_dir] = listing
+                _, gitignore_mtime, files, directories = listing
+
+                if gitignore_mtime:
+                    rules = rules + _parse_gitignore(
+                        os.path.join(directory, ".gitignore"), rel_dir
+                    )
+
+                def rel(name: str) -> str:
+                    return "{}/{}".format(rel_dir, name) if rel_dir else name
+
+                subdirectories = [
+                    rel(d)
+                    for d in sorted(directories)
+                    if d != ".git" and not _is_ignored(rules, rel(d), True)
+                ]
+
+                if self.only_directories:
+                    found = subdirectories
+                else:
+                    found = [
+                        rel(f)
+                        for f in sorted(files)
+                        if not _is_ignored(rules, rel(f), False)
+                    ]
+                self._add(found)
+
+                if self.max_depth is None or depth < self.max_depth:
+                    pending.extend(
+                        (d, depth + 1, rules) for d in reversed(subdirectories)
+                    )
+
+            self._save_snapshot(listings)
+        finally:
+            self.done = True
+            self._finished.set()
+
+
+class FileFinderCompleter(Completer):
+    """Complete paths by fuzzy matching them against a :class:`FileFinder`.
+
+    Args:
+        finder: The finder, its walk can still be running.
+
+        max_results: Maximum number of completions.
+    """
+
+    finder: FileFinder
+    max_results: int
+
+    def __init__(self, finder: FileFinder, max_results: int = FINDER_MAX_RESULTS):
+        self.finder = finder
+        self.max_results = max_results
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        query = document.text_before_cursor
+        index = self.finder.index
+
+        for _, position, matched in index.rank(query, self.max_results):
+            rel_path = index.candidates[position]
+            if self.finder.root in ("", "."):
+                result = rel_path.replace("/", os.path.sep)
+            else:
+                result = os.path.join(self.finder.root, *rel_path.split("/"))
+
+            yield Completion(
+                result,
+                start_position=-len(query),
+                display=fuzzy.highlight(rel_path, matched),
+            )
 
 
 def path(
@@ -66,6 +664,10 @@ def path(
     only_directories: bool = False,
     file_filter: Optional[Callable[[str], bool]] = None,
     complete_style: CompleteStyle = CompleteStyle.MULTI_COLUMN,
+    recursive: bool = False,
+    root: str = ".",
+    max_depth: Optional[int] = None,
+    validate_debounce: Optional[float] = None,
     **kwargs: Any,
 ) -> Question:
     """A text input for a file or directory path with autocompletion enabled.
@@ -101,6 +703,12 @@ def path(
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
 
+        validate_debounce: Validate in a background thread once typing paused
+                           for this many seconds, e.g. for validators doing
+                           I/O. The last error stays visible while the new
+                           input is checked. ``None`` validates on every
+                           keystroke, blocking the input.
+
         style: A custom color and style for the question parts. You can
                configure colors as well as font types for different elements.
 
@@ -114,6 +722,19 @@ def path(
                      filtering suggestions you also want to validate the result, use
                      ``validate`` in combination with the ``file_filter``.
 
+        recursive: Instead of completing one path segment at a time, search
+                   all files below ``root`` by fuzzy matching the typed text.
+                   Files ignored by ``.gitignore`` files are skipped. The
+                   tree is searched in the background, results show up while
+                   it is being searched. Directory listings are kept in
+                   ``$XDG_CACHE_HOME/go_questionary`` (``~/.cache`` if unset)
+                   to speed up the next search, see :class:`FileFinder`.
+
+        root: Directory searched if ``recursive`` is set.
+
+        max_depth: Number of directory levels below ``root`` searched if
+                   ``recursive`` is set. ``None`` searches the whole tree.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
@@ -123,7 +744,7 @@ def path(
     def get_prompt_tokens() -> List[Tuple[str, str]]:
         return [("class:qmark", qmark), ("class:question", " {} ".format(message))]
 
-    validator = build_validator(validate)
+    validator = build_validator(validate, validate_debounce)
 
     bindings = KeyBindings()
 
@@ -140,26 +761,40 @@ def path(
             event.app.exit(result=result_path)
             event.app.current_buffer.append_to_history()
 
-    @bindings.add(os.path.sep, eager=True)
-    def next_segment(event: KeyPressEvent):
-        b = event.app.current_buffer
+    if recursive:
+        finder = FileFinder(
+            root,
+            max_depth=max_depth,
+            only_directories=only_directories,
+            file_filter=file_filter,
+        ).start()
+        completer = DebouncedCompleter(FileFinderCompleter(finder))
+    else:
+        completer = GreatUXPathCompleter(
+            listing_cache=LISTING_CACHE,
+            only_directories=only_directories,
+            file_filter=file_filter,
+            expanduser=True,
+        )
+
+        @bindings.add(os.path.sep, eager=True)
+        def next_segment(event: KeyPressEvent):
+            b = event.app.current_buffer
 
-        if b.complete_state:
-            b.complete_state = None
+            if b.complete_state:
+                b.complete_state = None
 
-        current_path = b.document.text
-        if not current_path.endswith(os.path.sep):
-            b.insert_text(os.path.sep)
+            current_path = b.document.text
+            if not current_path.endswith(os.path.sep):
+                b.insert_text(os.path.sep)
 
-        b.start_completion(select_first=False)
+            b.start_completion(select_first=False)
 
     p = PromptSession(
         get_prompt_tokens,
         lexer=SimpleLexer("class:answer"),
         style=merged_style,
-        completer=GreatUXPathCompleter(
-            only_directories=only_directories, file_filter=file_filter, expanduser=True
-        ),
+        completer=completer,
         validator=validator,
         complete_style=complete_style,
         key_bindings=bindings,
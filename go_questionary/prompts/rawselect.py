@@ -4,7 +4,7 @@ from prompt_toolkit.styles import Style
 
 from go_questionary.constants import DEFAULT_QUESTION_PREFIX, DEFAULT_SELECTED_POINTER
 from go_questionary.prompts import select
-from go_questionary.prompts.common import Choice
+from go_questionary.prompts.common import Choice, InquirerControl
 from go_questionary.question import Question
 
 
@@ -19,7 +19,8 @@ def rawselect(
 ) -> Question:
     """Ask the user to select one item from a list of choices using shortcuts.
 
-    The user can only select one option.
+    The user can only select one option. Lists with more choices than there
+    are shortcut keys are numbered instead, the user types the number.
 
     Example:
         >>> import go_questionary
@@ -61,6 +62,9 @@ def rawselect(
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
+    # there are not enough shortcut keys for long lists, number them instead
+    use_numbers = len(choices) > len(InquirerControl.SHORTCUT_KEYS)
+
     return select.select(
         message,
         choices,
@@ -68,7 +72,8 @@ def rawselect(
         qmark,
         pointer,
         style,
-        use_shortcuts=True,
+        use_shortcuts=not use_numbers,
+        use_numbers=use_numbers,
         use_arrow_keys=False,
         **kwargs,
     )
@@ -7,7 +7,7 @@ from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.styles import Style, merge_styles
 
-from go_questionary import utils
+from go_questionary import fuzzy, utils
 from go_questionary.constants import (
     DEFAULT_QUESTION_PREFIX,
     DEFAULT_SELECTED_POINTER,
@@ -28,9 +28,11 @@ def select(
     use_shortcuts: bool = False,
     use_arrow_keys: bool = True,
     use_indicator: bool = False,
-    use_jk_keys: bool = True,
+    use_jk_keys: Optional[bool] = None,
     show_selected: bool = False,
     instruction: Optional[str] = None,
+    use_fuzzy_search: bool = False,
+    use_numbers: bool = False,
     **kwargs: Any,
 ) -> Question:
     """A list of items to select **one** option from.
@@ -97,13 +99,28 @@ def select(
 
         use_jk_keys: Allow the user to select items from the list using
                      `j` (down) and `k` (up) keys. Arrow keys, j/k keys and
-                     shortcuts are not mutually exclusive.
+                     shortcuts are not mutually exclusive. On by default,
+                     unless ``use_fuzzy_search`` is set.
 
         show_selected: Display current selection choice at the bottom of list.
 
+        use_fuzzy_search: Allow the user to type to move the pointer to the
+                          best fuzzy match of the typed text. Turns j/k keys
+                          off, can not be combined with ``use_shortcuts`` or
+                          an explicit ``use_jk_keys=True``.
+
+        use_numbers: Number the selectable choices. Typing a number moves the
+                     pointer to the choice with that number. Unlike shortcuts
+                     this works for any number of choices. Can not be
+                     combined with ``use_shortcuts`` or ``use_fuzzy_search``.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
+    if use_jk_keys is None:
+        # j and k are typed into the search text
+        use_jk_keys = not use_fuzzy_search
+
     if not (use_arrow_keys or use_shortcuts or use_jk_keys):
         raise ValueError(
             "Some option to move the selection is required. Arrow keys, j/k keys or shortcuts."
@@ -117,6 +134,18 @@ def select(
                 "disable one or the other."
             )
 
+    if use_fuzzy_search and (use_shortcuts or use_jk_keys):
+        raise ValueError(
+            "Fuzzy search uses all printable keys to type the search text. "
+            "Disable shortcuts and j/k keys to use it."
+        )
+
+    if use_numbers and (use_shortcuts or use_fuzzy_search):
+        raise ValueError(
+            "Numbers can not be combined with shortcuts or fuzzy search, "
+            "they all use the typed keys."
+        )
+
     if choices is None or len(choices) == 0:
         raise ValueError("A list of choices needs to be provided.")
 
@@ -140,8 +169,30 @@ def select(
         show_selected=show_selected,
         use_arrow_keys=use_arrow_keys,
         initial_choice=default,
+        use_numbers=use_numbers,
     )
 
+    if not ic.navigation.positions:
+        raise ValueError("At least one of the choices needs to be selectable.")
+
+    search_text = []
+    number_text = []
+    if use_fuzzy_search:
+        # only selectable choices are searched, by their title
+        search_positions = [
+            i
+            for i, c in enumerate(ic.choices)
+            if not isinstance(c, Separator) and not c.disabled
+        ]
+        search_index = fuzzy.FuzzyIndex(
+            [
+                "".join(token[1] for token in c.title)
+                if isinstance(c.title, list)
+                else str(c.title)
+                for c in (ic.choices[i] for i in search_positions)
+            ]
+        )
+
     def get_prompt_tokens():
         # noinspection PyListCreation
         tokens = [("class:qmark", "🦍"), ("class:question", " {} ".format(message))]
@@ -168,6 +219,11 @@ def select(
                     instruction_msg = "(Use arrow keys)"
                 tokens.append(("class:instruction", "Welcome to Gorilla. Use arrows to select"))
 
+            if search_text:
+                tokens.append(("class:answer", " {}".format("".join(search_text))))
+            if number_text:
+                tokens.append(("class:answer", " {}".format("".join(number_text))))
+
         return tokens
 
     layout = common.create_inquirer_layout(ic, get_prompt_tokens, **kwargs)
@@ -203,17 +259,15 @@ def select(
 
     def move_cursor_down(event):
         ic.select_next()
-        while not ic.is_selection_valid():
-            ic.select_next()
 
     def move_cursor_up(event):
         ic.select_previous()
-        while not ic.is_selection_valid():
-            ic.select_previous()
 
     if use_arrow_keys:
         bindings.add(Keys.Down, eager=True)(move_cursor_down)
         bindings.add(Keys.Up, eager=True)(move_cursor_up)
+        bindings.add(Keys.PageDown, eager=True)(lambda event: ic.select_page_down())
+        bindings.add(Keys.PageUp, eager=True)(lambda event: ic.select_page_up())
 
     if use_jk_keys:
         bindings.add("j", eager=True)(move_cursor_down)
@@ -224,10 +278,45 @@ def select(
         ic.is_answered = True
         event.app.exit(result=ic.get_pointed_at().value)
 
+    def move_cursor_to_best_match():
+        if not search_text:
+            return
+        best = search_index.rank("".join(search_text), limit=1)
+        if best:
+            ic.pointed_at = search_positions[best[0][1]]
+
+    def type_number_digit(event):
+        # continue the typed number if a choice has it, else start a new one
+        for typed in (number_text + [event.data], [event.data]):
+            if ic.select_number(int("".join(typed))):
+                number_text[:] = typed
+                return
+
+    if use_numbers:
+        for digit in "0123456789":
+            bindings.add(digit, eager=True)(type_number_digit)
+
+        @bindings.add(Keys.Backspace, eager=True)
+        def remove_number_digit(event):
+            if number_text:
+                number_text.pop()
+                if number_text:
+                    ic.select_number(int("".join(number_text)))
+
+    if use_fuzzy_search:
+
+        @bindings.add(Keys.Backspace, eager=True)
+        def remove_search_character(event):
+            if search_text:
+                search_text.pop()
+                move_cursor_to_best_match()
+
     @bindings.add(Keys.Any)
     def other(event):
         """Disallow inserting other text. """
-        pass
+        if use_fuzzy_search and event.data.isprintable():
+            search_text.append(event.data)
+            move_cursor_to_best_match()
 
     return Question(
         Application(
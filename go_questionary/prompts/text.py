@@ -23,6 +23,7 @@ def text(
     multiline: bool = False,
     instruction: Optional[str] = None,
     lexer: Optional[Lexer] = None,
+    validate_debounce: Optional[float] = None,
     **kwargs: Any,
 ) -> Question:
     """Prompt the user to enter a free text message.
@@ -54,6 +55,12 @@ def text(
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
 
+        validate_debounce: Validate in a background thread once typing paused
+                           for this many seconds, e.g. for validators doing
+                           I/O. The last error stays visible while the new
+                           input is checked. ``None`` validates on every
+                           keystroke, blocking the input.
+
         qmark: Question prefix displayed in front of the question.
                By default this is a ``?``.
 
@@ -76,7 +83,7 @@ def text(
 
     merged_style = merge_styles([DEFAULT_STYLE, style])
     lexer = lexer or SimpleLexer("class:answer")
-    validator = build_validator(validate)
+    validator = build_validator(validate, validate_debounce)
 
     if instruction is None and multiline:
         instruction = INSTRUCTION_MULTILINE
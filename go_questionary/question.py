@@ -3,9 +3,10 @@ import sys
 from prompt_toolkit import Application
 import prompt_toolkit.patch_stdout
 
-from go_questionary import utils
+from go_questionary import instrumentation, utils
+from go_questionary.frames import DEFAULT_MAX_FPS, FrameScheduler, limit_frame_rate
 from go_questionary.constants import DEFAULT_KBI_MESSAGE
-from typing import Any
+from typing import Any, Optional
 
 
 class Question:
@@ -18,11 +19,58 @@ class Question:
     should_skip_question: bool
     default: Any
 
+    frames: Optional[FrameScheduler]
+    """Limits the redraws of the question if enabled with
+    :meth:`limit_frame_rate`, see :class:`FrameScheduler`"""
+
     def __init__(self, application: "Application[Any]") -> None:
         self.application = application
+        self.frames = None
         self.should_skip_question = False
         self.default = None
 
+        if instrumentation.RECORDER is not None:
+            instrumentation.RECORDER.attach(application)
+
+    def limit_frame_rate(self, max_fps: float = DEFAULT_MAX_FPS) -> "Question":
+        """Redraw the question at most ``max_fps`` times per second, except
+        for keystrokes.
+
+        Useful if background threads update the question often, e.g.
+        completions or validation messages. Replaces the application's
+        ``invalidate()``, see :class:`FrameScheduler`.
+
+        Args:
+            max_fps: Maximum number of frames per second for updates that
+                     are not keystrokes.
+
+        Returns:
+            :class:`Question`: `self`.
+        """
+
+        if self.frames is None:
+            self.frames = limit_frame_rate(self.application, max_fps)
+        else:
+            self.frames.max_fps = max_fps
+        return self
+
+    def instrument(
+        self, recorder: Optional[instrumentation.LatencyRecorder] = None
+    ) -> instrumentation.LatencyRecorder:
+        """Record the keystroke, token and render latencies of this question.
+
+        Args:
+            recorder: Recorder to add the samples to, a new one is created
+                      if it is not set.
+
+        Returns:
+            The recorder, see :class:`instrumentation.LatencyRecorder`.
+        """
+
+        if recorder is None:
+            recorder = instrumentation.LatencyRecorder()
+        return recorder.attach(self.application)
+
     async def ask_async(
         self, patch_stdout: bool = False, kbi_msg: str = DEFAULT_KBI_MESSAGE
     ) -> Any:
@@ -0,0 +1,200 @@
+from typing import Any, Callable, Dict, Generator, Hashable, Optional
+
+import prompt_toolkit.patch_stdout
+from prompt_toolkit import Application
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.key_binding import DynamicKeyBindings
+from prompt_toolkit.styles import BaseStyle, DynamicStyle
+
+from go_questionary import instrumentation
+from go_questionary.frames import limit_frame_rate
+from go_questionary.question import Question
+
+# A flow of questions: yields the questions to ask, one at a time, and
+# receives the answer of each question from the runner.
+QuestionFlow = Generator[Question, Any, None]
+
+
+class _SessionApplication(Application):
+    """Application showing the layouts of several questions, one after another.
+
+    Instead of exiting when a question is answered, the answered question is
+    rendered in its final state and the layout, key bindings and style of
+    the next question are swapped in. The terminal stays in raw mode and the
+    input is attached for the whole session.
+
+    Args:
+        question: Application of the first question.
+
+        advance: Receives the answer of the current question and returns the
+                 application of the next question, ``None`` if it was the
+                 last one.
+
+        max_fps: Limits the frame rate of the session, ``None`` doesn't,
+                 see :class:`~go_questionary.frames.FrameScheduler`.
+    """
+
+    def __init__(
+        self,
+        question: "Application[Any]",
+        advance: Callable[[Any], Optional["Application[Any]"]],
+        max_fps: Optional[float] = None,
+    ) -> None:
+        self._question = question
+        self._advance = advance
+        self._answered = False
+        # compiled styles, by their invalidation hash
+        self._styles: Dict[Hashable, BaseStyle] = {}
+
+        super().__init__(
+            layout=question.layout,
+            key_bindings=DynamicKeyBindings(lambda: self._question.key_bindings),
+            style=DynamicStyle(lambda: self._cached_style(self._question.style)),
+            mouse_support=Condition(lambda: self._question.mouse_support()),
+            color_depth=lambda: self._question.color_depth,
+            editing_mode=question.editing_mode,
+            erase_when_done=question.erase_when_done,
+            input=question.input,
+            output=question.output,
+        )
+        self.frames = limit_frame_rate(self, max_fps) if max_fps is not None else None
+        if instrumentation.RECORDER is not None:
+            instrumentation.RECORDER.attach(self)
+
+    def _cached_style(self, style: Optional[BaseStyle]) -> Optional[BaseStyle]:
+        """Reuse an equal style of an earlier question, its rules are
+        already compiled."""
+
+        if style is None:
+            return None
+        return self._styles.setdefault(style.invalidation_hash(), style)
+
+    @property
+    def is_done(self) -> bool:
+        return self._answered or super().is_done
+
+    def _switch_to(self, question: "Application[Any]") -> None:
+        self._question = question
+        self.layout = question.layout
+        self.exit_style = ""
+
+        # keys typed ahead stay queued in the key processor, they are
+        # handled by the bindings of the new question
+        self.layout.reset()
+
+        # Make sure that we have a 'focusable' widget focused.
+        if not self.layout.current_control.is_focusable():
+            for w in self.layout.find_all_windows():
+                if w.content.is_focusable():
+                    self.layout.current_window = w
+                    break
+
+        self.renderer.request_absolute_cursor_position()
+        self.invalidate()
+
+    def _render_answered(self) -> None:
+        """Draw the answered question in its final state, like prompt_toolkit
+        does when an application exits, using only its public API."""
+
+        self.render_counter += 1
+        self.before_render.fire()
+        if self.erase_when_done:
+            self.renderer.erase()
+        else:
+            self.renderer.render(self, self.layout, is_done=True)
+        self.layout.update_parents_relations()
+        self.after_render.fire()
+
+    def exit(
+        self,
+        result: Any = None,
+        exception: Optional[Any] = None,
+        style: str = "",
+    ) -> None:
+        if exception is not None:
+            super().exit(exception=exception, style=style)
+            return
+
+        try:
+            question = self._advance(result)
+        except Exception as e:
+            super().exit(exception=e)
+            return
+
+        if question is None:
+            super().exit(result=result, style=style)
+            return
+
+        # draw the answered question in its final state and continue below it
+        self.exit_style = style
+        self._answered = True
+        try:
+            self._render_answered()
+        finally:
+            self._answered = False
+            self.renderer.reset()
+
+        self._switch_to(question)
+
+
+def run_questions(flow: QuestionFlow, patch_stdout: bool = False) -> None:
+    """Ask all questions of ``flow`` using a single prompt_toolkit application.
+
+    Setting up the application and switching the terminal into raw mode only
+    happens once per flow, instead of once per question. If the first
+    question limits its frame rate (see :meth:`Question.limit_frame_rate`),
+    the whole session does.
+
+    Does not catch keyboard interrupts.
+
+    Args:
+        flow: Generator yielding the questions to ask. The answer to each
+              question is sent back into the generator.
+
+        patch_stdout: Ensure that the prompt renders correctly if other threads
+                      are printing to stdout.
+    """
+
+    try:
+        first = next(flow)
+    except StopIteration:
+        return
+
+    def advance(answer: Any) -> Optional["Application[Any]"]:
+        try:
+            return flow.send(answer).application
+        except StopIteration:
+            return None
+
+    app = _SessionApplication(
+        first.application,
+        advance,
+        first.frames.max_fps if first.frames is not None else None,
+    )
+
+    if patch_stdout:
+        with prompt_toolkit.patch_stdout.patch_stdout():
+            app.run()
+    else:
+        app.run()
+
+
+def ask_questions(flow: QuestionFlow, patch_stdout: bool = False) -> None:
+    """Ask all questions of ``flow``, each with its own application.
+
+    Does not catch keyboard interrupts.
+
+    Args:
+        flow: Generator yielding the questions to ask. The answer to each
+              question is sent back into the generator.
+
+        patch_stdout: Ensure that the prompt renders correctly if other threads
+                      are printing to stdout.
+    """
+
+    try:
+        question = next(flow)
+        while True:
+            question = flow.send(question.unsafe_ask(patch_stdout))
+    except StopIteration:
+        return
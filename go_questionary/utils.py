@@ -1,5 +1,6 @@
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
 
 ACTIVATED_ASYNC_MODE = False
 
@@ -10,22 +11,47 @@ def is_prompt_toolkit_3() -> bool:
     return ptk_version.startswith("3.")
 
 
+def _inspect_parameters(func: Callable[..., Any]) -> Tuple[Tuple[str, bool], ...]:
+    return tuple(
+        (
+            k,
+            v.default is not inspect.Parameter.empty
+            or v.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        for k, v in inspect.signature(func).parameters.items()
+    )
+
+
+_cached_parameters = functools.lru_cache(maxsize=None)(_inspect_parameters)
+
+
+def _parameters(func: Callable[..., Any]) -> Tuple[Tuple[str, bool], ...]:
+    """Names of the parameters of ``func`` and whether they have a default.
+
+    Signatures are only inspected once per function."""
+
+    try:
+        return _cached_parameters(func)
+    except TypeError:
+        # not hashable, can't be cached
+        return _inspect_parameters(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _argument_set(parameters: Tuple[Tuple[str, bool], ...]) -> FrozenSet[str]:
+    return frozenset(k for k, _ in parameters)
+
+
 def default_values_of(func: Callable[..., Any]) -> List[str]:
     """Return all parameter names of ``func`` with a default value."""
 
-    signature = inspect.signature(func)
-    return [
-        k
-        for k, v in signature.parameters.items()
-        if v.default is not inspect.Parameter.empty
-        or v.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD
-    ]
+    return [k for k, has_default in _parameters(func) if has_default]
 
 
 def arguments_of(func: Callable[..., Any]) -> List[str]:
     """Return the parameter names of the function ``func``."""
 
-    return list(inspect.signature(func).parameters.keys())
+    return [k for k, _ in _parameters(func)]
 
 
 def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, Any]:
@@ -39,7 +65,7 @@ def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, A
         Subset of kwargs which are accepted by ``func``.
     """
 
-    possible_arguments = arguments_of(func)
+    possible_arguments = _argument_set(_parameters(func))
 
     return {k: v for k, v in kwargs.items() if k in possible_arguments}
 
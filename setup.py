@@ -23,13 +23,18 @@ setup(
     description="LLMs for CLI",
     long_description=open("README.md", "r", encoding="utf-8").read(),
     long_description_content_type="text/markdown",
-    py_modules=["go_cli"],
+    py_modules=["go_cli", "go_cli_cache"],
     packages=find_packages(include=["*", "go_questionary.*"]),
     install_requires=[
         "requests",
         "halo",
         "prompt-toolkit",
     ],
+    extras_require={
+        # vectorized prefiltering for fuzzy matching of large choice lists
+        # and the semantic cache of earlier queries
+        "fast": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "gorilla=go_cli:main",
@@ -41,5 +46,5 @@ setup(
         "Operating System :: OS Independent",
     ],
     license="Apache 2.0",
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )